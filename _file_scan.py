@@ -1,5 +1,7 @@
 import re
 import itertools
+import mmap
+from contextlib import contextmanager
 
 __all__ = ['']
 
@@ -23,6 +25,11 @@ performance is undoubtadly hit when compared to built in python functions.
 if the buffer is to small in _buffered_file_line_search, there is a chance that the splitting of the 
 text could land directly between search phrases - i.e. split the search phrase in half, and the text
 will not be found.
+
+the memory mapped functions at the bottom of this module (_mapped_file, _find_text_between_phrases,
+_iter_repeated_phrase_blocks) do not suffer from this. The file is mapped into memory by the OS
+(so it is paged in as needed rather than read into a python string) and regular expressions run over
+the bytes of the whole file, returning offsets that may be used to create zero-copy memoryviews.
 """
 
 def _buffered_file_line_search(search_function: callable):        #the search function
@@ -186,3 +193,166 @@ def _get_repeated_text_phrase_lines(text: str,    #the name of the file
     
     else:
         return output,True,record
+
+@contextmanager
+def _mapped_file(fname: str):
+    """
+    Parameters
+    ----------
+    fname: the name of the file to map into memory
+
+    Returns
+    ----------
+    context manager yielding a read only mmap of the file (or empty bytes if the file is empty,
+    since empty files cannot be mapped). Any memoryview of the map must be released before
+    the context exits
+    """
+    with open(fname,'rb') as file:
+        try:
+            buffer = mmap.mmap(file.fileno(),0,access = mmap.ACCESS_READ)
+        except ValueError:
+            yield b''
+            return
+        
+        try:
+            yield buffer
+        finally:
+            buffer.close()
+
+def _compile_bytes_phrase(phrase,
+                          literal = False):
+    """
+    Parameters
+    ----------
+    phrase: the phrase as a str regular expression, bytes regular expression or compiled expression
+    literal: treat the phrase as literal text rather than a regular expression
+
+    Returns
+    ----------
+    the phrase compiled as a bytes regular expression
+    """
+    if isinstance(phrase,re.Pattern):
+        phrase = phrase.pattern
+    
+    if isinstance(phrase,str):
+        phrase = phrase.encode()
+    
+    if literal:
+        phrase = re.escape(phrase)
+    
+    return re.compile(phrase)
+
+_REGEX_SPECIAL = set(b'.^$*+?{}[]\\()')
+
+def _search_phrase(buffer,
+                   phrase,
+                   pos = 0) -> tuple:
+    """
+    Parameters
+    ----------
+    buffer: the bytes-like object to search
+    phrase: the phrase (regular expression) to search for
+    pos: the position in the buffer to start searching from
+
+    Returns
+    ----------
+    the (start,end) offsets of the first match of the phrase, or None if not found. Phrases
+    that are literal text (or alternations of literal text) are located using find() which
+    is much faster than the re module on large buffers
+    """
+    pattern = _compile_bytes_phrase(phrase)
+    alternatives = pattern.pattern.split(b'|')
+    if any(_REGEX_SPECIAL.intersection(alternative) for alternative in alternatives):
+        match = pattern.search(buffer,pos)
+        return None if match is None else (match.start(),match.end())
+    
+    found = [(buffer.find(alternative,pos),len(alternative)) for alternative in alternatives]
+    found = [(start,start + length) for start,length in found if start != -1]
+    return min(found) if found else None
+
+def _find_text_between_phrases(buffer,                        #bytes-like object, i.e. a mmap
+                               pair: list,                    #list with len() = 2
+                               include_pairs = False,         #option to include the pairs in the returned range
+                               pos = 0,                       #position in the buffer to start searching from
+                               ) -> tuple:
+    """
+    Parameters
+    ----------
+    buffer: the bytes-like object to search, typically the mmap from _mapped_file
+    pair: the two phrases (regular expressions) to locate, a list. If the second phrase is None
+          the range extends to the end of the buffer
+    include_pairs: include the pairs in the returned range
+    pos: the position in the buffer to start searching from
+
+    Returns
+    ----------
+    the (start,end) offsets of the text between the first occurrence of the first phrase
+    and the next occurence of the second phrase. If the second phrase is not found, end is 
+    the end of the buffer. Returns None if the first phrase is not found
+    """
+    start = _search_phrase(buffer,pair[0],pos = pos)
+    if start is None:
+        return None
+    
+    end = None if pair[1] is None else _search_phrase(buffer,pair[1],pos = start[1])
+    if include_pairs:
+        return start[0],len(buffer) if end is None else end[1]
+    else:
+        return start[1],len(buffer) if end is None else end[0]
+
+def _iter_repeated_phrase_blocks(buffer,                   #bytes-like object, i.e. a mmap
+                                 phrase: str,              #the phrase to search for
+                                 pos = 0,                  #position in the buffer to start searching from
+                                 endline = '\n'):
+    """
+    Parameters
+    ----------
+    buffer: the bytes-like object to search, typically the mmap from _mapped_file
+    phrase: the (literal) phrase that is repeated on multiple lines in a row
+    pos: the position in the buffer to start searching from
+    endline: the end of a line character in case this differs from the default
+
+    Returns
+    ----------
+    generator of the (start,end) offsets of each block of consecutive lines containing the phrase,
+    the range including the trailing end of line character of the block
+    """
+    phrase = _compile_bytes_phrase(phrase,literal = True).pattern
+    endline = re.escape(endline.encode())
+    block = re.compile(b'(?:^[^' + endline + b']*' + phrase + b'[^' + endline + b']*(?:' + endline + b'|\\Z))+',
+                       re.MULTILINE)
+    for match in block.finditer(buffer,pos):
+        yield match.start(),match.end()
+
+def _read_text_between_phrases(fname: str,
+                               pair: list,
+                               include_pairs = False,
+                               strip = True,
+                               encoding = 'utf-8') -> str:
+    """
+    Parameters
+    ----------
+    fname: the name of the file to search
+    pair: the two phrases to locate and record the text between, a list of strings
+    include_pairs: include the pairs on the returned text
+    strip: strip the leading and trailing white space from the returned text
+    encoding: the encoding of the file
+
+    Returns
+    ----------
+    the requested text decoded, or an empty string if the first phrase is not found. 
+    Only the requested range is decoded from a memoryview of the mapped file, 
+    and universal new lines are applied as when reading the file in text mode
+    """
+    with _mapped_file(fname) as buffer:
+        found = _find_text_between_phrases(buffer,pair,include_pairs = include_pairs)
+        if found is None:
+            return ''
+        
+        with memoryview(buffer)[found[0]:found[1]] as view:
+            text = str(view,encoding,errors = 'replace')
+    
+    if '\r' in text:
+        text = text.replace('\r\n','\n')
+    
+    return text.strip() if strip else text
@@ -0,0 +1,208 @@
+#native imports
+import warnings
+import numpy as np
+import pandas as pd
+
+"""
+Author: Michael Lanahan
+Date Created: 10.18.2026
+Last Edit: 10.18.2026
+
+Description:
+alignment of the ragged histories (residuals, reports) of the cases of a batch onto a shared
+iteration index, so that statistics across the cases can be computed in a single vectorized call
+"""
+
+#the nan-aware counterparts of common statistics, the aligned histories are padded with nan
+_NAN_STATISTICS = {np.min:np.nanmin,
+                   np.amin:np.nanmin,
+                   np.max:np.nanmax,
+                   np.amax:np.nanmax,
+                   np.mean:np.nanmean,
+                   np.average:np.nanmean,
+                   np.median:np.nanmedian,
+                   np.std:np.nanstd,
+                   np.var:np.nanvar,
+                   np.sum:np.nansum}
+
+_NAMED_STATISTICS = {'min':np.nanmin,
+                     'max':np.nanmax,
+                     'mean':np.nanmean,
+                     'median':np.nanmedian,
+                     'std':np.nanstd,
+                     'var':np.nanvar,
+                     'sum':np.nansum}
+
+def nan_statistic(func):
+    """
+    the nan-aware counterpart of the statistic, a name (i.e. "mean"), numpy function or
+    callable. Callables without a known counterpart are returned as is
+    """
+    if isinstance(func,str):
+        try:
+            return _NAMED_STATISTICS[func]
+        except KeyError:
+            raise ValueError('statistic must be one of: {}, not: {}'.format(','.join(_NAMED_STATISTICS.keys()),func))
+
+    return _NAN_STATISTICS.get(func,func)
+
+class RaggedSeries:
+
+    """
+    Parameters
+    ----------
+    series : dict
+            the series of each case, keyed by the name of the case. Each series is either
+            a pandas Series indexed by iteration, or a tuple of (iterations,values)
+
+    Description
+    -----------
+    The histories of the cases of a batch have ragged iterations, the cases finish (or converge)
+    at different iterations, and iterations may be missing. The series are packed into a single
+    nan-padded 2D array (values) with a row for each iteration of the shared (sorted) index, and
+    a column for each case. Statistics across the cases are then computed in one (nan-aware) call
+
+    Examples
+    --------
+    .. code-block:: python
+
+        series = RaggedSeries.from_files(solution_files,'continuity')
+        lower,upper,center = series.envelope(0.05,0.95,'median')
+        converged = series.last() < 1e-4
+    """
+
+    def __init__(self,series: dict):
+
+        self.names = list(series.keys())
+        iterations,values = [],[]
+        for s in series.values():
+            if isinstance(s,pd.Series):
+                iterations.append(s.index.to_numpy())
+                values.append(s.to_numpy(dtype = float))
+            else:
+                iterations.append(np.asarray(s[0]))
+                values.append(np.asarray(s[1],dtype = float))
+
+        self.index,self.values = self._pack(iterations,values)
+
+    @staticmethod
+    def _pack(iterations: list,
+              values: list) -> tuple:
+        """
+        pack the series into the nan-padded array on the union of the iterations. Repeated
+        iterations of a series keep the last value
+        """
+        lengths = [i.shape[0] for i in iterations]
+        if not iterations or sum(lengths) == 0:
+            return np.array([]),np.full((0,len(iterations)),np.nan)
+
+        flat = np.concatenate(iterations)
+        index = np.unique(flat)
+        rows = np.searchsorted(index,flat)
+        cols = np.repeat(np.arange(len(iterations)),lengths)
+        array = np.full((index.shape[0],len(iterations)),np.nan)
+        array[rows,cols] = np.concatenate(values)
+        return index,array
+
+    @classmethod
+    def from_frames(cls,frames: dict,
+                        variables: list,
+                        ignore_missing = False) -> dict:
+        """
+        align the variables of the frames of each case (i.e. FluentFiles.frames), returning
+        a RaggedSeries for each variable. Cases without the variable are skipped if ignore_missing,
+        otherwise a KeyError is raised
+        """
+        aligned = {}
+        for variable in variables:
+            series = {}
+            for name,frame in frames.items():
+                try:
+                    series[name] = frame[variable]
+                except KeyError:
+                    if not ignore_missing:
+                        raise
+
+            aligned[variable] = cls(series)
+
+        return aligned
+
+    @classmethod
+    def from_files(cls,fluent_files,
+                       variable: str,
+                       ignore_missing = False):
+        """
+        align the variable of each of the files of a FluentFiles container, loading
+        the files if they have not been loaded
+        """
+        if not fluent_files.frames:
+            fluent_files.load()
+
+        return cls.from_frames(fluent_files.frames,[variable],ignore_missing = ignore_missing)[variable]
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __len__(self):
+        return self.index.shape[0]
+
+    def counts(self) -> np.ndarray:
+        """
+        the number of cases with a value at each iteration
+        """
+        return np.count_nonzero(~np.isnan(self.values),axis = 1)
+
+    def lengths(self) -> np.ndarray:
+        """
+        the number of values of each case
+        """
+        return np.count_nonzero(~np.isnan(self.values),axis = 0)
+
+    def last(self) -> np.ndarray:
+        """
+        the last value of each case (nan for empty cases), i.e. the converged result
+        """
+        valid = ~np.isnan(self.values)
+        if self.values.shape[0] == 0:
+            return np.full(self.values.shape[1],np.nan)
+
+        rows = self.values.shape[0] - 1 - np.argmax(valid[::-1],axis = 0)
+        last = self.values[rows,np.arange(self.values.shape[1])]
+        last[~valid.any(axis = 0)] = np.nan
+        return last
+
+    def statistic(self,func) -> np.ndarray:
+        """
+        a (nan-aware) statistic across the cases at each iteration. func is a name, numpy
+        function, callable taking the values and axis, or a float in [0,1] for a quantile
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore',RuntimeWarning)
+            if isinstance(func,float):
+                return np.nanquantile(self.values,func,axis = 1)
+
+            return nan_statistic(func)(self.values,axis = 1)
+
+    def envelope(self,*funcs) -> tuple:
+        """
+        the statistics across the cases at each iteration (see statistic()). Quantiles are computed
+        together in a single call. Defaults to the min, max, and mean
+        """
+        if not funcs:
+            funcs = (np.min,np.max,np.mean)
+
+        quantiles = [f for f in funcs if isinstance(f,float)]
+        computed = {}
+        if quantiles:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore',RuntimeWarning)
+                computed = dict(zip(quantiles,np.nanquantile(self.values,quantiles,axis = 1)))
+
+        return tuple(computed[f] if isinstance(f,float) else self.statistic(f) for f in funcs)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        the aligned values as a DataFrame indexed by iteration, with a column for each case
+        """
+        return pd.DataFrame(self.values,index = self.index,columns = self.names)
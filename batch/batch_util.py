@@ -17,4 +17,35 @@ def _parse_pykwargs(default_script,
             if pace_lib not in pykwargs['python_libs']:
                 pykwargs['python_libs'].append(pace_lib)
 
-    return pykwargs
\ No newline at end of file
+    return pykwargs
+
+
+def pack_processors(processors: list,
+                    capacity: int) -> list:
+    """
+    pack cases requesting a number of processors into allocations of
+    at most capacity processors (first fit decreasing). Returns the indices of the 
+    cases in each allocation
+
+    Example
+    -------
+    pack_processors([4,2,1,3,2],4)
+    > [[0],[2,3],[1,4]]
+    """
+    
+    order = sorted(range(len(processors)),key = lambda i: processors[i],reverse = True)
+    packs,loads = [],[]
+    for i in order:
+        if processors[i] > capacity:
+            raise ValueError('case {} requests {} processors, more than the capacity of an allocation: {}'.format(i,processors[i],capacity))
+        
+        for j,load in enumerate(loads):
+            if load + processors[i] <= capacity:
+                packs[j].append(i)
+                loads[j] += processors[i]
+                break
+        else:
+            packs.append([i])
+            loads.append(processors[i])
+    
+    return [sorted(pack) for pack in packs]
@@ -0,0 +1,485 @@
+#native imports
+from abc import ABC,abstractmethod
+from typing import List, Union
+import subprocess
+import itertools
+import time
+import os
+
+#package imports
+from .submit import FluentSubmission,PaceFluentSubmission
+from .ansys import PaceAPDLSubmission,PaceMechanicalSubmission
+from .pbs import PythonPBS
+from .slurm import PythonSlurm
+from ..pace import BulkJobStatus
+
+"""
+Author: Michael Lanahan
+Date Created: 10.18.2026
+Last Edit: 10.18.2026
+
+Submission of jobs with dependencies between them, i.e. a fluent simulation followed
+by a mechanical simulation followed by post-processing across many design points.
+The dependencies are handed to the scheduler (--dependency=afterok with slurm, -W depend=afterok
+with PBS) so that no job has to wait on another by polling. Polling is only required
+to retry failed jobs, in which case the jobs that depend on the failed job are resubmitted
+against the retried job.
+"""
+
+QUEUED = 'Queued'
+RUNNING = 'Running'
+COMPLETED = 'Completed'
+FAILED = 'Failed'
+SKIPPED = 'Skipped'
+TERMINAL_STATES = [COMPLETED,FAILED,SKIPPED]
+
+class SchedulerBackend(ABC):
+
+    """
+    Base class for submitting, cancelling and querying jobs with a scheduler.
+    The dependency option is formatted with the colon seperated job ids that
+    must complete succesfully before the job starts
+    """
+
+    DEPENDENCY_OPTION = ''
+
+    def __init__(self,submit_command: str,
+                      cancel_command: str,
+                      scheduler: str):
+
+        self.submit_command = submit_command
+        self.cancel_command = cancel_command
+        self.scheduler = scheduler
+
+    def format_dependency(self,dependencies: List[str]) -> str:
+
+        if not dependencies:
+            return ''
+
+        return self.DEPENDENCY_OPTION.format(':'.join(dependencies)) + ' '
+
+    def format_submit(self,script: str,
+                           dependencies = []) -> str:
+
+        return self.submit_command + ' ' + self.format_dependency(dependencies) + script
+
+    @abstractmethod
+    def parse_job_id(self,output: str) -> str:
+        pass
+
+    def _run(self,command: str,
+                  folder = None) -> str:
+
+        return subprocess.run(command,shell = True,capture_output = True,
+                              text = True,cwd = folder).stdout
+
+    def submit(self,script: str,
+                    folder: str,
+                    dependencies = []) -> str:
+        """
+        submit the script from the folder, returning the job id
+        """
+        jobid = self.parse_job_id(self._run(self.format_submit(script,dependencies),folder = folder))
+        if not jobid:
+            raise RuntimeError('could not submit job: {} in folder: {}'.format(script,folder))
+
+        return jobid
+
+    def cancel(self,jobids: List[str]) -> None:
+
+        if jobids:
+            self._run(self.cancel_command + ' ' + ' '.join(jobids))
+
+    def status(self,jobids: List[str]) -> dict:
+        """
+        the states of the jobs (see pace.BulkJobStatus) from a single query
+        """
+        return BulkJobStatus(jobids,scheduler = self.scheduler)()
+
+class SlurmBackend(SchedulerBackend):
+
+    """
+    slurm backend - the state of finished jobs is taken from sacct
+    so that failed jobs can be distinguished from completed jobs
+    """
+
+    DEPENDENCY_OPTION = '--dependency=afterok:{}'
+
+    def __init__(self,submit_command = 'sbatch --parsable',
+                      cancel_command = 'scancel',
+                      scheduler = 'sacct'):
+
+        super().__init__(submit_command,cancel_command,scheduler)
+
+    def parse_job_id(self,output: str) -> str:
+        #--parsable outputs jobid[;cluster]
+        return output.strip().split(';')[0]
+
+class PBSBackend(SchedulerBackend):
+
+    """
+    PBS backend - qstat reports finished jobs as F regardless of
+    the exit status, so failures are only detected for jobs that the
+    scheduler removes
+    """
+
+    DEPENDENCY_OPTION = '-W depend=afterok:{}'
+
+    def __init__(self,submit_command = 'qsub',
+                      cancel_command = 'qdel',
+                      scheduler = 'qstat'):
+
+        super().__init__(submit_command,cancel_command,scheduler)
+
+    def parse_job_id(self,output: str) -> str:
+        #i.e. 1234.sched-torque
+        return output.strip().split('.')[0]
+
+class DryRunBackend(SlurmBackend):
+
+    """
+    backend that records the commands that would be issued instead of issuing them,
+    for checking a graph locally. Jobs are assigned increasing ids and have
+    the state in the states dictionary (default Queued) which may be modified to
+    emulate the progress of the jobs
+    """
+
+    def __init__(self,*args,
+                      first_id = 1,
+                      **kwargs):
+
+        super().__init__(*args,**kwargs)
+        self.commands = []
+        self.states = {}
+        self.__ids = itertools.count(first_id)
+
+    def _run(self,command: str,
+                  folder = None) -> str:
+
+        self.commands.append((command,folder))
+        if command.startswith(self.submit_command):
+            jobid = str(next(self.__ids))
+            self.states[jobid] = QUEUED
+            return jobid + '\n'
+        elif command.startswith(self.cancel_command):
+            for jobid in command[len(self.cancel_command):].split():
+                self.states[jobid] = FAILED
+
+        return ''
+
+    def status(self,jobids: List[str]) -> dict:
+        return {jobid: self.states[jobid] for jobid in jobids}
+
+def _submission_script(submission) -> str:
+    """
+    the name of the script written by a submission that is submitted to
+    the scheduler
+    """
+    if isinstance(submission,PaceFluentSubmission):
+        return submission.PACE_PBS
+    elif isinstance(submission,PaceAPDLSubmission):
+        return submission.PACE_ADPL_SCRIPT
+    elif isinstance(submission,PaceMechanicalSubmission):
+        return submission.PACE_MECH_PBS
+    elif isinstance(submission,PythonSlurm):
+        return 'python.slurm'
+    elif isinstance(submission,PythonPBS):
+        return 'python.pbs'
+    else:
+        raise ValueError('cannot determine the script to submit for: {}, specify the script explicitly'.format(type(submission).__name__))
+
+class JobNode:
+
+    """
+    A single job in the graph, the submission is written to the folder
+    and the script is submitted from the folder once the jobs it depends on
+    have completed successfully
+
+    Parameters
+    ----------
+    name : str
+            the unique name of the job in the graph
+    submission : FluentSubmission | PythonSlurm | PythonPBS
+            the submission to write to the folder
+    depends_on : list
+            names of the jobs that must complete before this job starts
+    folder : str
+            the folder (relative to the parent folder) to write the submission to,
+            default is the name of the job
+    script : str
+            the name of the script to submit, by default determined from the submission
+    retries : int
+            the number of times to resubmit the job if it fails
+    """
+
+    def __init__(self,name: str,
+                      submission: Union[FluentSubmission,PythonSlurm,PythonPBS],
+                      depends_on = [],
+                      folder = None,
+                      script = None,
+                      retries = 0):
+
+        self.name = name
+        self.submission = submission
+        self.depends_on = list(depends_on)
+        self.folder = name if folder is None else folder
+        self.script = _submission_script(submission) if script is None else script
+        self.retries = retries
+        self.jobid = None
+        self.jobids = []
+        self.state = None
+        self.failures = 0
+
+    def write(self,folder: str) -> None:
+
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        if isinstance(self.submission,(PythonSlurm,PythonPBS)):
+            self.submission.write(os.path.join(folder,self.script))
+        else:
+            self.submission.write(folder)
+
+    def __repr__(self) -> str:
+        return 'JobNode({}, jobid = {}, state = {})'.format(self.name,self.jobid,self.state)
+
+class JobGraph:
+
+    """
+    Directed acyclic graph of jobs submitted with native scheduler dependencies.
+
+    Jobs are submitted in topological order, each depending on the job ids of the jobs
+    it depends on. If a job fails it is resubmitted (up to the number of retries of the job)
+    and the jobs downstream of it are cancelled and resubmitted against the new job. If it
+    fails again, the jobs downstream are cancelled and marked as Skipped, while independent
+    jobs in the graph continue.
+
+    Parameters
+    ----------
+    backend : SchedulerBackend
+            the scheduler to submit to - default SlurmBackend(). Use DryRunBackend() to
+            check the commands without submitting.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        graph = JobGraph(backend = SlurmBackend())
+        for i,(fluent,mechanical) in enumerate(zip(fluent_submissions,mechanical_submissions)):
+            graph.add_job('fluent-{}'.format(i),fluent,retries = 2)
+            graph.add_job('mechanical-{}'.format(i),mechanical,depends_on = ['fluent-{}'.format(i)],
+                          folder = 'fluent-{}'.format(i))
+
+        graph.add_job('post',post_pbs,depends_on = ['mechanical-{}'.format(i) for i in range(len(fluent_submissions))])
+        states = graph.run('batch',poll_interval = 300)
+    """
+
+    def __init__(self,backend = None):
+
+        self.backend = SlurmBackend() if backend is None else backend
+        self.nodes = {}
+        self.parent = None
+
+    def add_job(self,name: str,
+                     submission: Union[FluentSubmission,PythonSlurm,PythonPBS],
+                     depends_on = [],
+                     **kwargs) -> JobNode:
+        """
+        add a job to the graph, see JobNode for the keyword arguments
+        """
+        if name in self.nodes:
+            raise ValueError('job names must be unique, job: {} already exists'.format(name))
+
+        self.nodes[name] = JobNode(name,submission,depends_on = depends_on,**kwargs)
+        return self.nodes[name]
+
+    @classmethod
+    def from_sequence(cls,submissions: List[Union[FluentSubmission,PythonSlurm,PythonPBS]],
+                          folder = '.',
+                          backend = None,
+                          **kwargs):
+        """
+        jobs that run one after another in the same folder, i.e. the replacement
+        for the SequentialPaceSubmission
+        """
+        graph = cls(backend = backend)
+        previous = []
+        for i,submission in enumerate(submissions):
+            name = 'job-{}'.format(i)
+            graph.add_job(name,submission,depends_on = previous,folder = folder,**kwargs)
+            previous = [name]
+
+        return graph
+
+    @property
+    def states(self) -> dict:
+        return {name: node.state for name,node in self.nodes.items()}
+
+    @property
+    def done(self) -> bool:
+        return all(node.state in TERMINAL_STATES for node in self.nodes.values())
+
+    def children(self) -> dict:
+
+        children = {name: [] for name in self.nodes}
+        for name,node in self.nodes.items():
+            for parent in node.depends_on:
+                if parent not in self.nodes:
+                    raise ValueError('job: {} depends on unknown job: {}'.format(name,parent))
+
+                children[parent].append(name)
+
+        return children
+
+    def order(self) -> List[str]:
+        """
+        topological order of the jobs, raising a ValueError if the
+        dependencies are cyclic
+        """
+        children = self.children()
+        num_parents = {name: len(set(node.depends_on)) for name,node in self.nodes.items()}
+        ready = [name for name,n in num_parents.items() if n == 0]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for child in children[name]:
+                num_parents[child] -= 1
+                if num_parents[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(self.nodes):
+            raise ValueError('job dependencies are cyclic between: {}'.format(
+                             ', '.join([name for name in self.nodes if name not in order])))
+
+        return order
+
+    def descendants(self,name: str) -> List[str]:
+        """
+        all jobs downstream of the job, in topological order
+        """
+        children = self.children()
+        found = set()
+        stack = list(children[name])
+        while stack:
+            child = stack.pop()
+            if child not in found:
+                found.add(child)
+                stack.extend(children[child])
+
+        return [n for n in self.order() if n in found]
+
+    def ancestors(self,name: str) -> List[str]:
+        """
+        all jobs upstream of the job
+        """
+        found = set()
+        stack = list(self.nodes[name].depends_on)
+        while stack:
+            parent = stack.pop()
+            if parent not in found:
+                found.add(parent)
+                stack.extend(self.nodes[parent].depends_on)
+
+        return [n for n in self.order() if n in found]
+
+    def write(self,parent: str) -> None:
+
+        self.parent = parent
+        if not os.path.isdir(parent):
+            os.makedirs(parent)
+
+        for name in self.order():
+            self.nodes[name].write(os.path.join(parent,self.nodes[name].folder))
+
+    def _submit_node(self,node: JobNode) -> str:
+
+        dependencies = [self.nodes[parent].jobid for parent in node.depends_on
+                        if self.nodes[parent].state != COMPLETED]
+        node.jobid = self.backend.submit(node.script,
+                                         os.path.join(self.parent,node.folder),
+                                         dependencies = dependencies)
+        node.jobids.append(node.jobid)
+        node.state = QUEUED
+        return node.jobid
+
+    def submit(self,parent: str,
+                    write = True) -> dict:
+        """
+        write (optionally) and submit all of the jobs in the graph, returning the
+        job ids of the jobs
+        """
+        if write:
+            self.write(parent)
+        else:
+            self.parent = parent
+
+        for name in self.order():
+            self._submit_node(self.nodes[name])
+
+        return {name: node.jobid for name,node in self.nodes.items()}
+
+    def _cancel(self,names: List[str],
+                     state = None) -> None:
+
+        active = [self.nodes[name] for name in names if self.nodes[name].state not in TERMINAL_STATES]
+        self.backend.cancel([node.jobid for node in active])
+        for node in active:
+            node.state = state
+
+    def _handle_failure(self,node: JobNode) -> None:
+
+        node.failures += 1
+        descendants = self.descendants(node.name)
+        if node.failures <= node.retries:
+            #descendants that can no longer run because another job upstream
+            #of them failed for good remain skipped
+            blocked = [name for name in descendants if self.nodes[name].state in [FAILED,SKIPPED]
+                       or any(self.nodes[a].state == FAILED for a in self.ancestors(name))]
+            retry = [name for name in descendants if name not in blocked]
+            self._cancel(blocked,state = SKIPPED)
+            self._cancel(retry)
+            self._submit_node(node)
+            for name in retry:
+                self._submit_node(self.nodes[name])
+        else:
+            node.state = FAILED
+            self._cancel(descendants,state = SKIPPED)
+
+    def update(self) -> dict:
+        """
+        query the state of the active jobs, retrying failed jobs, and return
+        the state of each job in the graph
+        """
+        active = {node.jobid: node for node in self.nodes.values() if node.state not in TERMINAL_STATES}
+        status = self.backend.status(list(active.keys()))
+        for name in self.order():
+            node = self.nodes[name]
+            if node.jobid not in active or node.state in TERMINAL_STATES:
+                continue
+
+            state = status.get(node.jobid,node.state)
+            if state == FAILED:
+                self._handle_failure(node)
+            elif state in [QUEUED,RUNNING,COMPLETED]:
+                node.state = state
+
+        return self.states
+
+    def run(self,parent: str,
+                 poll_interval = 60.0,
+                 max_polls = None,
+                 sleep = time.sleep) -> dict:
+        """
+        submit the graph and poll until every job has completed, failed or
+        been skipped, returning the final state of each job
+        """
+        self.submit(parent)
+        polls = 0
+        while not self.done and (max_polls is None or polls < max_polls):
+            sleep(poll_interval)
+            self.update()
+            polls += 1
+
+        return self.states
@@ -22,6 +22,158 @@ CASE_EXT = '.cas'
 REPORT_FILE_TAG = 'report-file'
 EXCLUDE_FOLDERS = ['_batchcache_']
 
+class FileSystemIndex:
+
+    """
+    In memory index of the folders of a batch and the files in them, built from a 
+    single walk of the root with os.scandir so that repeated extension/tag queries
+    do not go back to the (network) file system. 
+
+    The index is invalidated by modification time - refresh() lists the root once and
+    rescans only the folders whose modification time changed (i.e. files were added, removed
+    or renamed). Queries check the modification time of the root (folders, root_files) or of the
+    folder queried (files) and rescan it if it changed, so the index does not go stale. The stat 
+    information of the files is read on first request and cached until the folder is rescanned
+    """
+
+    def __init__(self,root: str,
+                      Path = PosixPath):
+
+        self.__root = str(root)
+        self.Path = Path
+        self.__root_files = []
+        self.__folders = {}
+        self.__stats = {}
+        self.__mtime = None
+    
+    @property
+    def root(self):
+        return self.__root
+
+    @property
+    def folders(self):
+        """
+        the names of the folders in the root
+        """
+        self._check_root()
+
+        return list(self.__folders.keys())
+    
+    @property
+    def root_files(self):
+        """
+        the names of the files in the root
+        """
+        self._check_root()
+        
+        return self.__root_files
+
+    def refresh(self) -> list:
+        """
+        list the root, rescanning the folders that are new or whose modification time changed
+        and dropping the folders that no longer exist. Returns the names of the rescanned folders
+        """
+        rescanned = []
+        folders = {}
+        root_files = []
+        self.__mtime = os.stat(self.root).st_mtime_ns
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if entry.is_dir():
+                    mtime = entry.stat().st_mtime_ns
+                    cached = self.__folders.get(entry.name)
+                    if cached is not None and cached[0] == mtime:
+                        folders[entry.name] = cached
+                    else:
+                        folders[entry.name] = (mtime,self._scan_folder(entry.path))
+                        self.__stats.pop(entry.name,None)
+                        rescanned.append(entry.name)
+                else:
+                    root_files.append(entry.name)
+        
+        for name in set(self.__folders) - set(folders):
+            self.__stats.pop(name,None)
+
+        self.__folders = folders
+        self.__root_files = root_files
+        return rescanned
+
+    def _check_root(self) -> None:
+        """
+        refresh the index if the root has not been scanned, or if folders or files were
+        added to or removed from the root since it was
+        """
+        if self.__mtime is None or os.stat(self.root).st_mtime_ns != self.__mtime:
+            self.refresh()
+
+    @staticmethod
+    def _scan_folder(folder: str) -> list:
+        
+        with os.scandir(folder) as it:
+            return [entry.name for entry in it]
+
+    def files(self,folder: str) -> list:
+        """
+        the names of the files (and sub-folders) in the folder. The folder is rescanned
+        if its modification time changed since it was last scanned
+        """
+        name = os.path.basename(str(folder))
+        path = os.path.join(self.root,name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self.__folders.pop(name,None)
+            self.__stats.pop(name,None)
+            raise FileNotFoundError('no folder: {} in the root: {}'.format(name,self.root))
+        
+        cached = self.__folders.get(name)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime,self._scan_folder(path))
+            self.__folders[name] = cached
+            self.__stats.pop(name,None)
+        
+        return cached[1]
+    
+    def suffixes(self,folder: str) -> set:
+        """
+        the suffixes of the files in the folder
+        """
+        return set(os.path.splitext(f)[1] for f in self.files(folder))
+
+    def find(self,ext: str,
+                  tag = '',
+                  folders = None) -> dict:
+        """
+        the files with the extension "ext" and containing the "tag" in their path
+        in each of the folders, keyed by the folder. Folders without such files are
+        not included
+        """
+        if folders is None:
+            folders = [self.Path(self.root,f) for f in self.folders]
+
+        _d = {}
+        for folder in folders:
+            _found_files = [self.Path(folder,f) for f in self.files(folder) 
+                            if os.path.splitext(f)[1] == ext]
+            _found_files = [f for f in _found_files if tag in str(f)]
+            if _found_files:
+                _d[folder] = _found_files
+        
+        return _d
+
+    def stat(self,folder: str,
+                  file_name: str) -> os.stat_result:
+        """
+        the cached stat information of the file in the folder
+        """
+        folder = os.path.basename(str(folder))
+        stats = self.__stats.setdefault(folder,{})
+        try:
+            return stats[file_name]
+        except KeyError:
+            stats[file_name] = os.stat(os.path.join(self.root,folder,file_name))
+            return stats[file_name]
+
 class BatchFileSystem(ABC):
 
     def __init__(self, root: str,
@@ -46,11 +198,19 @@ class BatchFileSystem(ABC):
         self.__solution_file_dict = {}
         self.__report_files = None
         self.__solution_files = None
+        self.__index = None
 
     @property
     def root(self):
         return self.__root
     
+    @property
+    def index(self):
+        if self.__index is None:
+            self.__index = FileSystemIndex(self.root,Path = self.Path)
+        
+        return self.__index
+    
     @property
     def Path(self):
         return self.__Path
@@ -107,7 +267,7 @@ class BatchFileSystem(ABC):
         tag = '' if name is None else name
         self.solution_file_dict = self._find_ext_in_submission_folders(SOLUTION_EXT, tag = tag)
     
-    def map_report_files(self, name: str):
+    def map_report_files(self, name = None):
         if name is None:
             name = REPORT_FILE_TAG
         
@@ -154,18 +314,9 @@ class BatchFileSystem(ABC):
         Additional keyword argument "tag" allows for clarification with a nuemonic if there are multiple
         files with the same extension
 
+        The files are looked up in the index of the file system rather than by listing the folders
         """
-        _d = {}
-        for folder in self.submission_folder_list:
-            _found_files = []
-            for f in folder.iterdir():
-                if f.suffix == ext and tag in str(f):
-                    _found_files.append(f)
-            
-            if _found_files:
-                _d[folder] = _found_files
-        
-        return _d
+        return self.index.find(ext,tag = tag,folders = self.submission_folder_list)
     
     @abstractmethod
     def map_submit_folders(self):
@@ -195,10 +346,10 @@ class TableFileSystem(BatchFileSystem):
         assumes that there is only one .cas file and will raise 
         an error otherwise
         """
-        for f in self.root.iterdir(): 
-            _,ext = os.path.splitext(f.name)
+        for f in self.index.root_files: 
+            _,ext = os.path.splitext(f)
             if ext == CASE_EXT:
-                return f
+                return self.Path(self.root,f)
 
     def map_submit_folders(self,
                            check_contents = []):
@@ -208,24 +359,19 @@ class TableFileSystem(BatchFileSystem):
         provides the oppurtunity to check if files with the suffix provided by the list
         of check_contents exist in the folder. If they do not, these directories will be
         excluded from the submission_folder_list
+
+        the index of the file system is refreshed here, rescanning only the folders that changed
         """
+        self.index.refresh()
+        check_contents = set(check_contents)
         sl = []
-        for f in self.root.iterdir():
-            if f.is_dir():
-                flag = True
-                if check_contents:
-                    exts_in_dir = [_f.suffix for _f in f.iterdir()]
-                    for c in check_contents:
-                        if c not in exts_in_dir:
-                            flag = False
-                            break
-                
-                for ef in EXCLUDE_FOLDERS:
-                    if ef in str(f):
-                        flag = False
-                
-                if flag: 
-                    sl.append(f)
+        for name in self.index.folders:
+            f = self.Path(self.root,name)
+            if check_contents and not check_contents <= self.index.suffixes(name):
+                continue
+
+            if not any(ef in str(f) for ef in EXCLUDE_FOLDERS):
+                sl.append(f)
 
         self.submission_folder_list = sl
         
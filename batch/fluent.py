@@ -1,7 +1,8 @@
 from .slurm import DefaultSlurm
 from .pbs import DefaultPBS
 from ..disk import SerializableClass
-from copy import deepcopy
+from copy import deepcopy, copy
+import os
 
 class FluentScript(SerializableClass):
 
@@ -108,7 +109,15 @@ class FluentScript(SerializableClass):
         txt = self.script_header() + self.LINE_BREAK
         txt += self.config
         txt += self.format_change_dir(self.PDIR) +self.LINE_BREAK
-        txt += self.LINE_BREAK + self.LINE_BREAK + self.script_header.added_text + self.LINE_BREAK + self.LINE_BREAK
+        txt += self.format_run()
+
+        return  txt
+    
+    def format_run(self):
+        """
+        format the set up and call of fluent following the change of directory
+        """
+        txt = self.LINE_BREAK + self.LINE_BREAK + self.script_header.added_text + self.LINE_BREAK + self.LINE_BREAK
         txt += self.format_load_ansys(self.version) +self.LINE_BREAK
         mpi = self.format_machine_file()
         cnf = self.format_cnf()
@@ -116,8 +125,8 @@ class FluentScript(SerializableClass):
                                          self.input_file,mpi,cnf,
                                          self.specification) \
                 + self.LINE_BREAK
-
-        return  txt
+        
+        return txt
     
     @staticmethod
     def format_change_dir(chdir):
@@ -154,11 +163,19 @@ class FluentScript(SerializableClass):
         """
         return self.format_call()
     
-    def copy(self):
+    def copy(self,deep = True):
         """
-        useful for making a bunch of copies in a batch script
+        useful for making a bunch of copies in a batch script. A shallow copy
+        copies only the script header and configuration, which is all that 
+        differs between the scripts of a batch
         """
-        return deepcopy(self)
+        if deep:
+            return deepcopy(self)
+        
+        script = copy(self)
+        script.script_header = copy(self.script_header)
+        script._config = list(self._config)
+        return script
     
     def write(self,f):
         """
@@ -179,6 +196,10 @@ class FluentScript(SerializableClass):
         dmdict.pop('class')
         input_file = dmdict.pop('input_file')
         dmdict['mpi_option'] = dmdict.pop('mpi_opt')
+        dmdict['config'] = dmdict.pop('_config',[])
+        for attr in ['PDIR','NODE_FILE']:
+            dmdict.pop(attr,None)
+        
         return [input_file],dmdict
 
 class FluentPBS(FluentScript):
@@ -198,3 +219,203 @@ class FluentSlurm(FluentScript):
         self.NODE_FILE = '$SLURM_JOB_NODELIST'
 
 
+
+class FluentArrayScript:
+
+    """
+    A single array job script running fluent in many submission folders. The task
+    with index i changes to the folder on line i + 1 of the folder file, so that one script
+    and one submission serve every folder of a batch. The header (and the fluent call) 
+    are shared from the fluent script of the batch
+
+    Parameters
+    ----------
+    fluent_script : FluentScript
+            the FluentSlurm or FluentPBS script to run in each folder
+    folders : list
+            the submission folders, in order of the task index
+    max_concurrent : int
+            the maximum number of tasks to run at once - default None is unlimited
+    name : str
+            the name of the array job - default None uses the name of the fluent script
+    """
+
+    LINE_BREAK = '\n'
+    FOLDER_FILE = 'array_folders.txt'
+
+    def __init__(self,fluent_script: FluentScript,
+                      folders: list,
+                      max_concurrent = None,
+                      name = None,
+                      folder_file = FOLDER_FILE):
+
+        self.fluent_script = fluent_script.copy()
+        if name is not None:
+            self.fluent_script.script_header.name = name
+        
+        self.folders = [str(folder) for folder in folders]
+        self.max_concurrent = max_concurrent
+        self.folder_file = folder_file
+    
+    @property
+    def num_tasks(self):
+        return len(self.folders)
+
+    def format_select_folder(self) -> str:
+        """
+        change to the folder of the task
+        """
+        index = self.fluent_script.script_header.array_index
+        txt = 'FOLDER=$(sed -n "$(({} + 1))p" {})'.format(index,self.folder_file) + self.LINE_BREAK
+        txt += self.fluent_script.format_change_dir('$FOLDER') + self.LINE_BREAK
+        return txt
+
+    def format_call(self):
+
+        header = self.fluent_script.script_header
+        txt = header() + header.format_array(self.num_tasks,self.max_concurrent) + self.LINE_BREAK
+        txt += self.fluent_script.config
+        txt += self.fluent_script.format_change_dir(self.fluent_script.PDIR) + self.LINE_BREAK
+        txt += self.format_select_folder()
+        txt += self.fluent_script.format_run()
+        return txt
+    
+    def __call__(self):
+        return self.format_call()
+    
+    def write(self,folder: str,
+                   script_name: str) -> None:
+        """
+        write the array script and the folder file to the folder
+        """
+        with open(os.path.join(folder,script_name),'w',newline = self.LINE_BREAK) as file:
+            file.write(self.format_call())
+        
+        with open(os.path.join(folder,self.folder_file),'w',newline = self.LINE_BREAK) as file:
+            file.write(self.LINE_BREAK.join(self.folders) + self.LINE_BREAK)
+
+class FluentPackedScript:
+
+    """
+    A single job script running the cases of several (small) fluent scripts at once
+    in one allocation on a single node. The allocation requests the processors of all
+    of the cases, ansys is loaded once, and each case runs in its own folder pinned to 
+    its own cores of the allocation. The exit status of each case is logged to the 
+    status file (and the output of the job) as it completes.
+
+    Parameters
+    ----------
+    fluent_scripts : list
+            the FluentSlurm or FluentPBS scripts of the cases, using the same version of ansys
+    folders : list
+            the submission folder of each case
+    name : str
+            the name of the job - default None uses the name of the first fluent script
+    """
+
+    LINE_BREAK = '\n'
+    STATUS_FILE = 'packed_status.txt'
+
+    def __init__(self,fluent_scripts: list,
+                      folders: list,
+                      name = None,
+                      status_file = STATUS_FILE):
+
+        if len(fluent_scripts) != len(folders):
+            raise ValueError('a folder is required for each of the {} fluent scripts, not: {}'.format(len(fluent_scripts),len(folders)))
+
+        versions = set([script.version for script in fluent_scripts])
+        if len(versions) > 1:
+            raise ValueError('packed cases must use the same version of ansys, not: {}'.format(', '.join(versions)))
+
+        self.fluent_scripts = fluent_scripts
+        self.folders = [str(folder) for folder in folders]
+        self.status_file = status_file
+
+        self.fluent_script = fluent_scripts[0].copy()
+        self.fluent_script.script_header.processors = self.num_processors
+        self.fluent_script.script_header.nodes = 1
+        self.fluent_script.script_header.walltime_seconds = self.walltime
+        self.fluent_script.script_header.memory_amount = self.memory
+        if name is not None:
+            self.fluent_script.script_header.name = name
+    
+    @property
+    def num_processors(self):
+        return sum([script.N_PROCESSORS for script in self.fluent_scripts])
+    
+    @property
+    def walltime(self):
+        """
+        the allocation lasts as long as the longest of the cases
+        """
+        return max([script.script_header.walltime_seconds for script in self.fluent_scripts])
+    
+    @property
+    def memory(self):
+        """
+        the memory of the allocation, the sum over the cases for a total ("t") request
+        and the largest per core ("p") request otherwise
+        """
+        headers = [script.script_header for script in self.fluent_scripts]
+        if self.fluent_script.script_header.memory_request == 't':
+            return sum([header.memory_amount for header in headers])
+        
+        return max([header.memory_amount for header in headers])
+
+    def format_cores(self) -> str:
+        """
+        the cores available to the job, expanded from the cpus allowed i.e. 0-3,8 -> 0 1 2 3 8
+        """
+        txt = 'CORES=()' + self.LINE_BREAK
+        txt += "for RANGE in $(grep Cpus_allowed_list /proc/self/status | cut -f2 | tr ',' ' '); do" + self.LINE_BREAK
+        txt += '    CORES+=($(seq ${RANGE%-*} ${RANGE#*-}))' + self.LINE_BREAK
+        txt += 'done' + self.LINE_BREAK
+        return txt
+
+    def format_case(self,fluent_script: FluentScript,
+                         folder: str,
+                         first_core: int) -> str:
+        """
+        run the case in the background in its folder, pinned to N_PROCESSORS cores
+        starting from the first core
+        """
+        cores = '$(echo ${{CORES[@]:{}:{}}} | tr " " ",")'.format(first_core,fluent_script.N_PROCESSORS)
+        call = 'taskset -c {} fluent {} -t{}{}{}-affinity=off -g < {} > outputfile 2>&1'.format(cores,
+                                                                                                fluent_script.specification,
+                                                                                                fluent_script.N_PROCESSORS,
+                                                                                                fluent_script.format_machine_file(),
+                                                                                                fluent_script.format_cnf(),
+                                                                                                fluent_script.input_file)
+        
+        status = self.fluent_script.PDIR + '/' + self.status_file
+        txt = '(' + self.fluent_script.format_change_dir(folder) + ' && ' + call + self.LINE_BREAK
+        txt += ' STATUS=$?' + self.LINE_BREAK
+        txt += ' echo "{},$STATUS" >> {}'.format(folder,status) + self.LINE_BREAK
+        txt += ' echo "case in folder: {} completed with exit status: $STATUS") &'.format(folder) + self.LINE_BREAK
+        return txt
+
+    def format_call(self):
+
+        txt = self.fluent_script.script_header() + self.LINE_BREAK
+        txt += self.fluent_script.config
+        txt += self.fluent_script.format_change_dir(self.fluent_script.PDIR) + self.LINE_BREAK
+        txt += self.LINE_BREAK + self.fluent_script.script_header.added_text + self.LINE_BREAK + self.LINE_BREAK
+        txt += self.fluent_script.format_load_ansys(self.fluent_script.version) + self.LINE_BREAK
+        txt += self.format_cores() + self.LINE_BREAK
+
+        first_core = 0
+        for fluent_script,folder in zip(self.fluent_scripts,self.folders):
+            txt += self.format_case(fluent_script,folder,first_core)
+            first_core += fluent_script.N_PROCESSORS
+        
+        txt += 'wait' + self.LINE_BREAK
+        return txt
+    
+    def __call__(self):
+        return self.format_call()
+    
+    def write(self,f: str) -> None:
+
+        with open(f,'w',newline = self.LINE_BREAK) as file:
+            file.write(self.format_call())
@@ -56,6 +56,9 @@ class PBS:
     """
     
     line_leader = '#PBS '
+    array_option = '-J {}'
+    array_index = '$PBS_ARRAY_INDEX'
+    added_text = ''
     def __init__(self, name: str,
                        account: str,
                        queue: str,
@@ -172,6 +175,38 @@ class PBS:
     def name(self,n):
         self.__name = n
     
+    @property
+    def processors(self):
+        return self.__processors
+    
+    @processors.setter
+    def processors(self,p):
+        self.__processors = p
+    
+    @property
+    def nodes(self):
+        return self.__nodes
+    
+    @nodes.setter
+    def nodes(self,n):
+        self.__nodes = n
+
+    @property
+    def walltime_seconds(self):
+        return self.__walltime
+    
+    @walltime_seconds.setter
+    def walltime_seconds(self,w):
+        self.__walltime = w
+    
+    @property
+    def memory_amount(self):
+        return self.__memory
+    
+    @memory_amount.setter
+    def memory_amount(self,m):
+        self.__memory = m
+    
     def format_pbs_header(self):
 
         txt = ''
@@ -183,6 +218,18 @@ class PBS:
         
         return txt
 
+    def format_array(self,num_tasks: int,
+                          max_concurrent = None) -> str:
+        """
+        the directive making the script an array job of num_tasks tasks with indices
+        0 through num_tasks - 1, with at most max_concurrent tasks running at once
+        """
+        tasks = '0-{}'.format(num_tasks - 1)
+        if max_concurrent is not None:
+            tasks += '%{}'.format(max_concurrent)
+        
+        return self.line_leader + ' ' + self.array_option.format(tasks) + LINE_BREAK
+
     def copy(self):
         return deepcopy(self)
 
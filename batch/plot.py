@@ -1,10 +1,12 @@
 #native imports
 from .filesystem import TableFileSystem
+from .align import RaggedSeries,nan_statistic
 import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib import axes
 from itertools import zip_longest
 import pandas as pd
+import warnings
 
 RESIDUAL_NAMES = ['continuity' ,'x-velocity','y-velocity',  'z-velocity','energy','k','epsilon']
 fig_size = (16,12)
@@ -16,15 +18,162 @@ LEGEND_SIZE = 24
 EXCLUDE_RESIDUAL = 'report-con'
 ASPECT = 4.0/3.0
 
+#series longer than the pixel width of the axes are decimated before they are handed to
+#matplotlib, None plots every point
+DECIMATE = 'minmax'
+DECIMATION_METHODS = ['minmax','lttb']
+
 def line_plot(ax: axes,
               x: np.ndarray,
               y: np.ndarray,
               linewidth = 2,
               color = 'blue',
-              linestyle = '-'):
+              linestyle = '-',
+              decimate = DECIMATE):
+
+    if decimate is not None:
+        x,y = decimate_series(x,y,_pixel_width(ax),method = decimate)
 
     ax.plot(x,y,linewidth = linewidth,color = color,linestyle = linestyle)
 
+def _pixel_width(ax: axes) -> int:
+    """
+    the width of the axes in pixels
+    """
+    return max(int(np.ceil(ax.get_window_extent().width)),1)
+
+def _bin_edges(n: int,
+               width: int) -> np.ndarray:
+    """
+    the edges of (at most) width bins of nearly equal numbers of points
+    """
+    return np.unique(np.linspace(0,n,width + 1).astype(int))
+
+def minmax_decimate(x: np.ndarray,
+                    y: np.ndarray,
+                    width: int) -> tuple:
+    """
+    keep the first and last points, and the minimum and maximum points of each of width bins,
+    in order. At the pixel width the plotted line is indistinguishable from the line of all of the points
+    """
+    n = y.shape[0]
+    edges = _bin_edges(n,width)
+    bins = np.repeat(np.arange(edges.shape[0] - 1),np.diff(edges))
+    order = np.lexsort((y,bins))
+    index = np.unique(np.concatenate([order[edges[:-1]],order[edges[1:] - 1],[0,n - 1]]))
+    return x[index],y[index]
+
+def lttb_decimate(x: np.ndarray,
+                  y: np.ndarray,
+                  width: int) -> tuple:
+    """
+    largest triangle three buckets decimation to width points: the first and last points are kept
+    and the point of each bucket in between forming the largest triangle with the point 
+    kept in the previous bucket and the average of the next bucket
+    """
+    n = y.shape[0]
+    if width < 3:
+        return minmax_decimate(x,y,width)
+
+    edges = np.unique(np.linspace(1,n - 1,width - 1).astype(int))
+    edges = np.append(edges,n)
+    index = np.zeros(edges.shape[0],dtype = int)
+    for i in range(edges.shape[0] - 2):
+        start,end,next_end = edges[i],edges[i + 1],edges[i + 2]
+        avg_x,avg_y = x[end:next_end].mean(),y[end:next_end].mean()
+        a = index[i]
+        area = np.abs((x[a] - avg_x)*(y[start:end] - y[a]) - (x[a] - x[start:end])*(avg_y - y[a]))
+        index[i + 1] = start + np.argmax(area)
+
+    index[-1] = n - 1
+    return x[index],y[index]
+
+def decimate_series(x: np.ndarray,
+                    y: np.ndarray,
+                    width: int,
+                    method = 'minmax') -> tuple:
+    """
+    decimate the series to the pixel width (missing values are dropped). Series with fewer than
+    twice as many points as the width are not decimated
+
+    Parameters
+    ----------
+    x : np.ndarray
+            the (ascending) x values of the series, i.e. the iterations
+    y : np.ndarray
+            the y values of the series
+    width : int
+            the pixel width of the axes the series is plotted on
+    method : str
+            "minmax" (keep the extremes of each pixel) or "lttb" (largest triangle three buckets)
+    
+    Returns
+    -------
+    x,y : np.ndarray
+            the decimated series
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError('method must be one of: {}, not: {}'.format(','.join(DECIMATION_METHODS),method))
+
+    x = np.asarray(x)
+    y = np.asarray(y,dtype = float)
+    finite = ~np.isnan(y)
+    if not finite.all():
+        x,y = x[finite],y[finite]
+
+    if y.shape[0] <= 2*width:
+        return x,y
+    elif method == 'lttb':
+        return lttb_decimate(x,y,width)
+    else:
+        return minmax_decimate(x,y,width)
+
+def batch_envelope(Y: np.ndarray,
+                   bound1 = np.min,
+                   bound2 = np.max,
+                   center = np.mean) -> tuple:
+    """
+    the envelope (bounds and center) of the cases of a batch on the aligned iteration grid
+    i.e. the rows of Y are the iterations and the columns the cases, padded with nan. The
+    statistics are computed over the cases in a single (nan-aware) call each
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore',RuntimeWarning)
+        return tuple(nan_statistic(func)(Y,axis = 1) for func in [bound1,bound2,center])
+
+def _aligned(df) -> tuple:
+    """
+    the iterations and the nan-padded values of the cases, from either an aligned DataFrame
+    or a RaggedSeries
+    """
+    if isinstance(df,RaggedSeries):
+        return df.index,df.values
+    
+    return df.index.to_numpy(),df.to_numpy(dtype = float)
+
+def reduce_envelope(x: np.ndarray,
+                    b1: np.ndarray,
+                    b2: np.ndarray,
+                    cen: np.ndarray,
+                    width: int) -> tuple:
+    """
+    reduce the envelope to (at most) width bins, keeping the lowest of bound1, the highest
+    of bound2, and the mean of the center in each bin, so that the envelope is filled 
+    between common x values
+    """
+    if x.shape[0] <= 2*width:
+        return x,b1,b2,cen
+
+    edges = _bin_edges(x.shape[0],width)
+    starts,counts = edges[:-1],np.diff(edges)
+    finite = ~np.isnan(cen)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore',RuntimeWarning)
+        cen = np.add.reduceat(np.where(finite,cen,0.0),starts)/np.add.reduceat(finite,starts)
+
+    return np.add.reduceat(x.astype(float),starts)/counts,\
+           np.fmin.reduceat(b1,starts),np.fmax.reduceat(b2,starts),cen
+
 def _residual_set_up(fs: TableFileSystem,
                      shape = None):
 
@@ -126,7 +275,7 @@ def plot_residual_summary(batch_folder: str,
         if col is None:
             ax.axis('off')
         else:
-            df = fs.solution_files.get_variable(col)
+            df = RaggedSeries.from_files(fs.solution_files,col)
             make_residual_summary_plot('',col,df = df,ax = ax,
                                             shared_x = shared_x,
                                             shared_y = shared_y,
@@ -224,7 +373,7 @@ def plot_report_summary(batch_folder: str,
         if col is None:
             ax.axis('off')
         else:
-            df = fs.report_files.get_variable(col)
+            df = RaggedSeries.from_files(fs.report_files,col)
             make_report_summary_plot('',col,
                                             normalized = normalized,
                                             absolute = absolute,
@@ -296,13 +445,16 @@ def make_report_summary_plot(batch_folder: str,
     if df is None:
         fs = filesys(batch_folder)
         fs.map_report_files()
-        df = fs.report_files.get_variable(name)
+        df = RaggedSeries.from_files(fs.report_files,name)
     
-    df = _handle_differencing(df,diff,absolute,normalized)
+    if isinstance(df,RaggedSeries) and diff != 0:
+        df = df.to_frame()
 
+    df = _handle_differencing(df,diff,absolute,normalized)
+    x,Y = _aligned(df)
     ax = _summary_plot(ax,
-                       df.index.to_numpy(),
-                       df.to_numpy(),
+                       x,
+                       Y,
                        bound1 = bound1,
                        bound2 = bound2,
                        center = center,
@@ -487,14 +639,15 @@ def make_residual_summary_plot(batch_folder: str,
     if df is None:
         fs = filesys(batch_folder)
         fs.map_solution_files()
-        df = fs.solution_files.get_variable(residual_name)
+        df = RaggedSeries.from_files(fs.solution_files,residual_name)
 
+    x,Y = _aligned(df)
     ax = _summary_plot(ax,
-                       df.index.to_numpy(),
-                       df.to_numpy(),
-                       bound1 = np.min,
-                       bound2 = np.max,
-                       center = np.mean,
+                       x,
+                       Y,
+                       bound1 = bound1,
+                       bound2 = bound2,
+                       center = center,
                        bound1_color = bound1_color,
                        bound2_color = bound2_color,
                        bound1_width = bound1_width,
@@ -534,17 +687,17 @@ def _summary_plot(ax: axes,
                   fill_alpha = 0.5,
                   *plot_args,**plot_kwargs):
     
-    b1 = bound1(Y,axis =1)
-    b2 = bound2(Y,axis =1)
-    cen = center(Y,axis = 1)
+    b1,b2,cen = batch_envelope(Y,bound1 = bound1,bound2 = bound2,center = center)
+    if plot_kwargs.pop('decimate',DECIMATE) is not None:
+        x,b1,b2,cen = reduce_envelope(x,b1,b2,cen,_pixel_width(ax))
 
     for b,c,w,s in zip([b1,b2],[bound1_color,bound2_color],
                        [bound1_width,bound2_width],[bound1_style,bound2_style]):
 
-        line_plot(ax,x,b,linestyle= s,linewidth= w,color =c)
+        line_plot(ax,x,b,linestyle= s,linewidth= w,color =c,decimate = None)
         if fill:
             ax.fill_between(x,b,cen,alpha = fill_alpha,color = fill_color)
         
-    line_plot(ax,x,cen,*plot_args,**plot_kwargs)
+    line_plot(ax,x,cen,*plot_args,decimate = None,**plot_kwargs)
 
     return ax
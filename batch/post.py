@@ -7,11 +7,15 @@ import sys
 import pandas as pd
 from pathlib import WindowsPath,PosixPath
 import shutil
+import tempfile
+import queue
+import warnings
+from concurrent.futures import ThreadPoolExecutor,as_completed
 
 #package imports
 from .submit import FluentBatchSubmission
 from .filesystem import TableFileSystem
-from ..tui import FluentEngine, SurfaceIntegrals
+from ..tui import FluentEngine, FluentEnginePool, SurfaceIntegrals
 from ..fluentio import SurfaceIntegralFile
 from ..util import _surface_construction_arg_validator
 
@@ -138,6 +142,12 @@ class SurfaceIntegralBatch:
     """
     Extends the SurfaceIntegrals to work with batch
     folder structures
+
+    Cases may be evaluated concurrently by specifying more than one worker, each
+    running its own engine with num_processors = processors_per_worker. Each worker
+    writes the engine input/output files to its own scratch folder so that workers
+    do not collide. Cases that fail are recorded in the failures dictionary and are
+    absent from the resulting dataframe. 
     """
 
     def __init__(self,folder: str,
@@ -147,6 +157,9 @@ class SurfaceIntegralBatch:
                       engine = FluentEngine,
                       folders = [],
                       id_pad = 1,
+                      workers = 1,
+                      processors_per_worker = None,
+                      verbose = False,
                       **engine_kwargs):
 
         self.id,self.variable,self.surface_type  = \
@@ -155,10 +168,15 @@ class SurfaceIntegralBatch:
         self.fs = TableFileSystem(folder)
         self.engine = engine
         self.surface_integrals = {}
+        self.failures = {}
         self.df = None
         self.folders = folders
         self.engine_kwargs = engine_kwargs
         self.id_pad = id_pad
+        self.workers = workers
+        self.verbose = verbose
+        if processors_per_worker is not None:
+            self.engine_kwargs['num_processors'] = processors_per_worker
 
     @staticmethod
     def _validate_constructor_args(id: list,
@@ -178,9 +196,9 @@ class SurfaceIntegralBatch:
         self.fs.map_submit_folders(check_contents = [FLUENT_DATA_EXT])
         case_files = {key: None for key in self.fs.submission_folder_list}
         for folder in self.fs.submission_folder_list:
-            for f in folder.iterdir():
-                if FLUENT_CASE_EXT in f.name:
-                    case_files[folder] = f
+            for f in self.fs.index.files(folder):
+                if FLUENT_CASE_EXT in f:
+                    case_files[folder] = folder.joinpath(f)
         
         return case_files
     
@@ -196,20 +214,91 @@ class SurfaceIntegralBatch:
             case_files = {folder:case_file for folder,case_file in case_files.items() 
                             if folder.name in self.folders}
         
-        for folder,case_file in case_files.items():
+        #a pool of persistent sessions runs one case per session, otherwise each
+        #worker starts its own engine in a seperate scratch folder
+        if isinstance(self.engine,FluentEnginePool):
+            workers = self.engine.num_sessions
+        else:
+            workers = self.workers
+        
+        isolate = workers > 1 and isinstance(self.engine,type) and issubclass(self.engine,FluentEngine)
+        with tempfile.TemporaryDirectory() as scratch:
+            work_dirs = None
+            if isolate:
+                work_dirs = queue.Queue()
+                for i in range(workers):
+                    work_dirs.put(os.path.join(scratch,'worker-{}'.format(i)))
+            
+            results = self._run_cases(case_files,workers,work_dirs)
+        
+        self.failures = {}
+        for folder in case_files:
+            _,case = os.path.split(folder)
+            if isinstance(results[folder],Exception):
+                self.failures[case] = results[folder]
+            else:
+                self.surface_integrals[case] = results[folder]
+        
+        if self.failures and WARNINGS:
+            warnings.warn('surface integrals failed for cases: {}'.format(', '.join(self.failures.keys())))
+
+        return self.surface_integrals
+    
+    def _run_cases(self,case_files: dict,
+                        workers: int,
+                        work_dirs: queue.Queue) -> dict:
+        """
+        run the cases on a pool of threads (the work is done by the engine processes),
+        returning the parsed surface integral files or the exception raised for each case 
+        """
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers = workers) as executor:
+            futures = {executor.submit(self._case_surface_integrals,folder,case_file,work_dirs = work_dirs): folder
+                       for folder,case_file in case_files.items()}
+            
+            for i,future in enumerate(as_completed(futures)):
+                folder = futures[future]
+                try:
+                    results[folder] = future.result()
+                    status = 'completed'
+                except Exception as e:
+                    results[folder] = e
+                    status = 'failed with: {}'.format(str(e))
+                
+                if self.verbose:
+                    print('case: {} {} ({}/{})'.format(folder.name,status,i + 1,len(futures)))
+        
+        return results
+    
+    def _case_surface_integrals(self,folder: str,
+                                     case_file: str,
+                                     work_dirs = None) -> list:
+        """
+        read the case and data and compute the surface integrals for a single
+        case folder, returning the parsed surface integral files. If a queue of 
+        working directories is provided, the engine runs in one of these
+        """
+        engine_kwargs = self.engine_kwargs.copy()
+        work_dir = None if work_dirs is None else work_dirs.get()
+        try:
+            if work_dir is not None:
+                #fluent runs from the working directory, so the case and the files written
+                #next to it must be referenced with absolute paths
+                engine_kwargs['work_dir'] = work_dir
+                case_file = os.path.abspath(case_file)
 
             si = SurfaceIntegrals(case_file,self.id,
                                        self.variable,
                                        self.surface_type,
                                        engine = self.engine,
                                        id_pad = self.id_pad,
-                                       **self.engine_kwargs)
+                                       **engine_kwargs)
 
-            attr = [_si.read() for _si in si()]
-            _,case = os.path.split(folder)
-            self.surface_integrals[case] = attr
-        
-        return self.surface_integrals
+            return [_si.read() for _si in si()]
+        finally:
+            if work_dir is not None:
+                work_dirs.put(work_dir)
     
     def _post_surface_integral_collection(self,name = None) -> dict:
         """
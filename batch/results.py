@@ -0,0 +1,369 @@
+#native imports
+import os
+import sqlite3
+import warnings
+import operator
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+
+#package imports
+from .submit import BatchCache
+from .filesystem import FileSystemIndex,EXCLUDE_FOLDERS,REPORT_FILE_TAG
+from ..fluentio import ReportFileOut,SolutionFile,SurfaceIntegralFile,SurfaceFile
+
+"""
+Author: Michael Lanahan
+Date Created: 10.18.2026
+Last Edit: 10.18.2026
+
+Description:
+a persistent store of the results of a batch, so that questions about the results of the
+whole batch may be answered without parsing any of the ascii output files again.
+"""
+
+REPORT_EXT = '.out'
+SOLUTION_EXT = '.trn'
+SURFACE_INTEGRAL_EXT = '.srp'
+SURFACE_EXPORT_EXT = '.so'
+
+class BatchResults:
+
+    """
+    Parameters
+    ----------
+    batch_folder : str
+            the folder of the batch
+    workers : int
+            the number of threads used to parse the changed files in update(). If None,
+            the default of the pool is used, if 1 the files are parsed sequentially
+
+    Description
+    -----------
+    Persistent, incrementally updated store of the results of a batch in a single (sqlite) file
+    in the cache folder of the batch. The results of each submission folder are stored as
+    (folder,file,variable,value) rows, ingested from
+
+    - report files: the converged result (last row) of each column
+    - solution files: the run status record and the last row of the residuals
+    - surface integral files (.srp): the value on each boundary, and the net value
+    - surface exports (.so): the mean, min and max of each exported variable
+
+    the variables are named by the columns of the report/solution files, and by the name of the 
+    file for surface integrals and exports, so should be unique within a submission folder
+
+    update() only parses the files that are new or whose size/modification time changed,
+    so it may be called repeatedly as the jobs of the batch finish. query() returns the
+    requested columns of the results, joined to the design table cached with the batch
+    (BatchCache.cache_df), and filtered by predicates on either.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        results = BatchResults('batch_folder')
+        results.update()
+        df = results.query(columns = ['outlet:temperature:pressure-outlet','max-temp'],
+                           where = [('max-temp','>',800.0),('completed','==',1)])
+    """
+
+    _STORE_FILE = 'results.db'
+    SURFACE_STATISTICS = {'mean':np.mean,'min':np.min,'max':np.max}
+    OPERATORS = {'<':operator.lt,
+                 '<=':operator.le,
+                 '>':operator.gt,
+                 '>=':operator.ge,
+                 '==':operator.eq,
+                 '!=':operator.ne}
+
+    def __init__(self,batch_folder: str,
+                      workers = None):
+
+        self.batch_folder = batch_folder
+        self.workers = workers
+        self.batch_cache = BatchCache(batch_folder)
+
+    @property
+    def store(self):
+        return os.path.join(self.batch_cache.batch_cache,self._STORE_FILE)
+
+    def _connect(self) -> sqlite3.Connection:
+
+        conn = sqlite3.connect(self.store)
+        conn.execute('CREATE TABLE IF NOT EXISTS files (folder TEXT, file TEXT, size INTEGER, mtime_ns INTEGER, PRIMARY KEY (folder,file))')
+        conn.execute('CREATE TABLE IF NOT EXISTS results (folder TEXT, file TEXT, variable TEXT, value)')
+        conn.execute('CREATE INDEX IF NOT EXISTS results_variable ON results (variable,value)')
+        conn.execute('CREATE INDEX IF NOT EXISTS results_folder ON results (folder,file)')
+        return conn
+
+    @classmethod
+    def _readers(cls) -> dict:
+        """
+        the function reading the results of each kind of file, by extension
+        """
+        return {REPORT_EXT: cls._read_report_file,
+                SOLUTION_EXT: cls._read_solution_file,
+                SURFACE_INTEGRAL_EXT: cls._read_surface_integral_file,
+                SURFACE_EXPORT_EXT: cls._read_surface_export}
+
+    @staticmethod
+    def _read_report_file(fname: str) -> dict:
+        """
+        the converged result of each column of the report file
+        """
+        row = ReportFileOut(fname).read_last_row()
+        return {} if row.empty else row.iloc[-1].to_dict()
+
+    @staticmethod
+    def _read_solution_file(fname: str) -> dict:
+        """
+        the run status and the last row of the residuals of the solution file
+        """
+        sfile = SolutionFile(fname,parser = 'vectorized')
+        status = sfile.run_status()
+        variables = status.to_dict()
+        variables['completed'] = status.completed
+        variables['termination_reason'] = status.termination_reason
+        if status.executed_iterations > 0:
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    variables.update(sfile.readdf().iloc[-1].to_dict())
+            except (ValueError,AttributeError,IndexError) as error:
+                warnings.warn('could not read the residuals of: {} - {}'.format(fname,str(error)))
+
+        return variables
+
+    @staticmethod
+    def _read_surface_integral_file(fname: str) -> dict:
+        """
+        the value of the surface integral on each boundary, the net value is named
+        by the file
+        """
+        name = os.path.splitext(os.path.basename(fname))[0]
+        attributes = SurfaceIntegralFile(fname).read()
+        return {name if boundary == 'Net' else name + ':' + boundary: value
+                for boundary,value in zip(attributes['boundary'],attributes['value'])}
+
+    @classmethod
+    def _read_surface_export(cls,fname: str) -> dict:
+        """
+        statistics of each of the variables exported on the surface
+        """
+        name = os.path.splitext(os.path.basename(fname))[0]
+        with SurfaceFile(fname) as sfile:
+            df = sfile.readdf()
+
+        variables = {}
+        for column in df.columns:
+            if 'coordinate' in column:
+                continue
+
+            values = df[column].to_numpy(dtype = float)
+            for stat,func in cls.SURFACE_STATISTICS.items():
+                variables['{}:{}:{}'.format(name,column,stat)] = float(func(values))
+
+        return variables
+
+    def _result_files(self,index: FileSystemIndex) -> dict:
+        """
+        the files in the submission folders which are ingested, keyed by (folder,file)
+        """
+        readers = self._readers()
+        files = {}
+        for folder in index.folders:
+            if any(ef in folder for ef in EXCLUDE_FOLDERS):
+                continue
+
+            for f in index.files(folder):
+                ext = os.path.splitext(f)[1]
+                if ext in readers and (ext != REPORT_EXT or REPORT_FILE_TAG in f):
+                    files[(folder,f)] = readers[ext]
+
+        return files
+
+    def _read_file(self,reader,
+                        fname: str) -> list:
+
+        try:
+            return list(reader(fname).items())
+        except (OSError,ValueError,KeyError,IndexError,AttributeError) as error:
+            warnings.warn('could not read the results of: {} - {}'.format(fname,str(error)))
+            return []
+
+    def update(self,finished_only = False) -> list:
+        """
+        ingest the results files which are new or have changed since the last update, and
+        remove the results of files which no longer exist
+
+        Parameters
+        ----------
+        finished_only : bool
+                only ingest the folders whose solution file shows that the run terminated
+
+        Returns
+        -------
+        folders : list
+                the folders whose results were updated
+        """
+        index = FileSystemIndex(self.batch_folder)
+        files = self._result_files(index)
+        if finished_only:
+            finished = set(folder for (folder,f),reader in files.items() if reader == self._read_solution_file and
+                           SolutionFile(os.path.join(self.batch_folder,folder,f)).run_status().termination_reason is not None)
+            files = {key:reader for key,reader in files.items() if key[0] in finished}
+
+        with closing(self._connect()) as conn:
+            stored = {(folder,f):(size,mtime_ns) for folder,f,size,mtime_ns in conn.execute('SELECT * FROM files')}
+
+        changed = {}
+        for (folder,f),reader in files.items():
+            stat = index.stat(folder,f)
+            if stored.get((folder,f)) != (stat.st_size,stat.st_mtime_ns):
+                changed[(folder,f)] = (reader,stat)
+
+        removed = [key for key in stored if key not in files and not finished_only]
+        paths = {key:os.path.join(self.batch_folder,*key) for key in changed}
+        if self.workers == 1 or len(changed) <= 1:
+            parsed = {key:self._read_file(reader,paths[key]) for key,(reader,_) in changed.items()}
+        else:
+            with ThreadPoolExecutor(max_workers = self.workers) as executor:
+                futures = {key:executor.submit(self._read_file,reader,paths[key]) for key,(reader,_) in changed.items()}
+                parsed = {key:future.result() for key,future in futures.items()}
+
+        with closing(self._connect()) as conn, conn:
+            for key in list(changed) + removed:
+                conn.execute('DELETE FROM results WHERE folder = ? AND file = ?',key)
+                conn.execute('DELETE FROM files WHERE folder = ? AND file = ?',key)
+
+            for (folder,f),(_,stat) in changed.items():
+                conn.execute('INSERT INTO files VALUES (?,?,?,?)',(folder,f,stat.st_size,stat.st_mtime_ns))
+                conn.executemany('INSERT INTO results VALUES (?,?,?,?)',
+                                 [(folder,f,variable,_sql_value(value)) for variable,value in parsed[(folder,f)]])
+
+        return sorted(set(key[0] for key in list(changed) + removed))
+
+    def variables(self) -> list:
+        """
+        the variables in the store
+        """
+        with closing(self._connect()) as conn:
+            return [row[0] for row in conn.execute('SELECT DISTINCT variable FROM results ORDER BY variable')]
+
+    def design_table(self) -> pd.DataFrame:
+        """
+        the design table cached with the batch, indexed by the submission folder. None
+        if there is no cached design table
+        """
+        df = self.batch_cache.read_df_cache()
+        if df is None:
+            return None
+
+        formatting = self.batch_cache.read_formatting_cache()
+        if formatting and formatting.get('prefix') is not None:
+            df.index = [formatting['prefix'] + formatting.get('seperator','') + str(i) for i in df.index]
+        else:
+            df.index = [str(i) for i in df.index]
+
+        return df
+
+    def query(self,columns = None,
+                   where = [],
+                   design = True) -> pd.DataFrame:
+        """
+        query the results of the batch
+
+        Parameters
+        ----------
+        columns : list
+                the result variables and/or columns of the design table to return. If None,
+                all of the variables and design columns are returned
+        where : list
+                predicates in the format (column,operator,value) where operator is one of
+                the keys of OPERATORS. Predicates on result variables are evaluated in the store,
+                and predicates on design columns on the design table. Only the folders satisfying
+                all of the predicates are returned
+        design : bool
+                join the results to the design table
+
+        Returns
+        -------
+        df : pandas.DataFrame
+                the requested columns, indexed by the submission folder
+        """
+        for _,op,_ in where:
+            if op not in self.OPERATORS:
+                raise ValueError('operator must be one of: {}, not: {}'.format(','.join(self.OPERATORS.keys()),op))
+
+        design_df = self.design_table() if design else None
+        design_columns = [] if design_df is None else list(design_df.columns)
+
+        if columns is None:
+            variables = None
+            columns = design_columns + self.variables()
+        else:
+            variables = [c for c in columns if c not in design_columns]
+
+        conditions,params = self._predicates(where,design_columns)
+        with closing(self._connect()) as conn:
+            sql = 'SELECT DISTINCT folder FROM files'
+            if conditions:
+                sql += ' WHERE ' + ' AND '.join(conditions)
+
+            folders = sorted(row[0] for row in conn.execute(sql,params))
+            if variables is not None:
+                conditions = ['variable IN ({})'.format(','.join('?'*len(variables)))] + conditions
+                params = variables + params
+
+            sql = 'SELECT folder,variable,value FROM results'
+            if conditions:
+                sql += ' WHERE ' + ' AND '.join(conditions)
+
+            rows = conn.execute(sql,params).fetchall() if variables is None or variables else []
+
+        df = pd.DataFrame(rows,columns = ['folder','variable','value'])\
+               .drop_duplicates(subset = ['folder','variable'],keep = 'last')\
+               .pivot(index = 'folder',columns = 'variable',values = 'value')\
+               .reindex(pd.Index(folders,name = 'folder'))
+
+        for column in df.columns:
+            try:
+                df[column] = pd.to_numeric(df[column])
+            except (ValueError,TypeError):
+                pass
+
+        if design_df is not None:
+            df = df.join(design_df.reindex(df.index))
+            for column,op,value in where:
+                if column in design_columns:
+                    df = df[self.OPERATORS[op](df[column],value)]
+
+        return df.reindex(columns = columns)
+
+    def _predicates(self,where: list,
+                         design_columns: list) -> tuple:
+        """
+        the sql conditions (and parameters) selecting the folders satisfying the
+        predicates on the result variables
+        """
+        conditions,params = [],[]
+        for column,op,value in where:
+            if column not in design_columns:
+                conditions.append('folder IN (SELECT folder FROM results WHERE variable = ? AND value {} ?)'.format('=' if op == '==' else op))
+                params += [column,_sql_value(value)]
+
+        return conditions,params
+
+def _sql_value(value):
+    """
+    convert (numpy) scalars to values that may be stored in sqlite
+    """
+    if isinstance(value,(bool,np.bool_)):
+        return int(value)
+    elif isinstance(value,np.integer):
+        return int(value)
+    elif isinstance(value,np.floating):
+        return float(value)
+
+    return value
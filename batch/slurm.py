@@ -58,6 +58,8 @@ class Slurm:
     
     LINE_BREAK = '\n'
     line_leader = '#SBATCH '
+    array_option = '--array={}'
+    array_index = '$SLURM_ARRAY_TASK_ID'
     added_text = """export FLUENT_SSH=blaunch			#change remote node launcher in fluent
 export SCHEDULER_RSH=1				#enable remote sceudling
 export I_MPI_HYDRA_BOOTSTRAP="slurm"		#set scheduler for MPI
@@ -177,6 +179,38 @@ FLUENTNODES=$(echo $FLUENTNODES | tr ' ' ',')"""
     def name(self,n):
         self.__name = n
     
+    @property
+    def processors(self):
+        return self.__processors
+    
+    @processors.setter
+    def processors(self,p):
+        self.__processors = p
+    
+    @property
+    def nodes(self):
+        return self.__nodes
+    
+    @nodes.setter
+    def nodes(self,n):
+        self.__nodes = n
+
+    @property
+    def walltime_seconds(self):
+        return self.__walltime
+    
+    @walltime_seconds.setter
+    def walltime_seconds(self,w):
+        self.__walltime = w
+    
+    @property
+    def memory_amount(self):
+        return self.__memory
+    
+    @memory_amount.setter
+    def memory_amount(self,m):
+        self.__memory = m
+    
     def format_pbs_header(self):
 
         txt = '#!/bin/bash' + self.LINE_BREAK
@@ -188,6 +222,18 @@ FLUENTNODES=$(echo $FLUENTNODES | tr ' ' ',')"""
         
         return txt
 
+    def format_array(self,num_tasks: int,
+                          max_concurrent = None) -> str:
+        """
+        the directive making the script an array job of num_tasks tasks with indices
+        0 through num_tasks - 1, with at most max_concurrent tasks running at once
+        """
+        tasks = '0-{}'.format(num_tasks - 1)
+        if max_concurrent is not None:
+            tasks += '%{}'.format(max_concurrent)
+        
+        return self.line_leader + ' ' + self.array_option.format(tasks) + self.LINE_BREAK
+
     def copy(self):
         return deepcopy(self)
 
@@ -221,6 +267,7 @@ class DefaultSlurm(Slurm):
 class PythonSlurm(SerializableClass):
 
     SLURM_PDIR = '$SLURM_SUBMIT_DIR'
+    LINE_BREAK = '\n'
 
     def __init__(self,
                  script: PaceScript,
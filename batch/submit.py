@@ -5,22 +5,31 @@ from pandas.core.frame import DataFrame
 import numpy as np
 import shutil
 from pathlib import Path, PosixPath,WindowsPath
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Mapping
 import pandas as pd
 import json
 from abc import ABC, abstractmethod, abstractstaticmethod
 import sys
 import warnings
+import hashlib
+import tempfile
+import filecmp
+import sqlite3
+from contextlib import closing
+from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+import dill
 
 #package imports
 from ..disk import SerializableClass
 from ..pace import PaceScript
 from .pbs import PBS
-from .fluent import FluentPBS
-from ..tui import BatchCaseReader, FluentJournal
+from .fluent import FluentPBS, FluentArrayScript, FluentPackedScript
+from ..tui import BatchCaseReader, FluentJournal, JournalTemplate
+from ..fluentio import SolutionFile
 from .table_parse import partition_boundary_table
 from .filesystem import TableFileSystem
-from .batch_util import _parse_pykwargs
+from .batch_util import _parse_pykwargs, pack_processors
 
 """ 
 Author: Michael Lanahan
@@ -367,6 +376,7 @@ class FluentBatchSubmission(ABC):
             text = text.replace('<check_time>',str(self.check_time))
             text = text.replace('<num_resubmit>', str(self.num_resubmit))
             text = text.replace('<backend>',self.submit_command)
+            text = text.replace('<array_file>',getattr(self,'array_file',None) or '')
 
             return text
 
@@ -397,30 +407,12 @@ class FluentBatchSubmission(ABC):
             except AttributeError:
                 pass
 
-    def make_batch_submission(self,parent: str,
-                                   verbose = True,
-                                   purge = False,
-                                   overwrite = False):
-        
+    def _prepare_parent(self,parent: str,
+                             purge = False) -> None:
         """
-        Formatting the submission
-        makes appropriate directories if they do not exist
-        and optionally purges data using a safety delete that does not allow
-        recursion past a level of 2 on file folders, and will not delete .cas
-        or .dat files
-
-        Parameters
-        ----------
-        parent : str
-                the parent or root directory of the submission to make
-        verbose : bool
-                if True will print information during runtime
-        purge : bool
-                if True will purge the parent folder of any files or folders prior to 
-                populating with current batch information
+        make (and optionally purge) the parent directory, and write the batch files,
+        the monitering and post scripts and the batch cache to it
         """
-        
-        
 
         if not os.path.isdir(parent):
             os.mkdir(parent)
@@ -435,23 +427,89 @@ class FluentBatchSubmission(ABC):
         
         for file in set(self.move_batch_files):
             if file is not None:
-                try:
-                    shutil.copy2(file,parent)
-                except shutil.Error as fe:
-                    if overwrite:
-                        os.remove(parent,os.path.split(file)[0])
-                        shutil.copy2(file,parent)
-                    else:
-                        raise FileExistsError(fe)
+                _link_file(str(file),parent)
         
         #write some scripts to the folder that help with monitering
         #and an additonal post re-run script
         self._setup_batch_moniter_file(parent)
         self._setup_post_file(parent)
-        self.batch_moniter_file.write(parent)
-        self.post_script_file.write(parent)
+        self.batch_moniter_file.write(os.path.join(parent,self.batch_moniter_file.script_name))
+        self.post_script_file.write(os.path.join(parent,self.post_script_file.script_name))
 
         self._populate_batch_cache_folder(parent)
+    
+    def _write_folders(self,parent: str,
+                            write = None,
+                            workers = None,
+                            overwrite = False) -> dict:
+        """
+        write the folder of each submission concurrently. Each folder is written to a local
+        staging folder first and only copied to the batch folder if the hash of its content 
+        changed since it was last written, so that re-generating a batch only rewrites
+        the folders that changed. Returns whether each folder was (re)written
+        
+        Parameters
+        ----------
+        parent : str
+                the parent or root directory of the submission
+        write : callable
+                write(folder,submission) writes the files of a submission to the folder - default
+                None writes the whole submission and the post files
+        workers : int
+                the number of threads writing folders - default None uses the default of ThreadPoolExecutor
+        overwrite : bool
+                if True every folder is rewritten, even if its content is unchanged
+        """
+
+        if write is None:
+            def write(folder: str,
+                      submission: FluentSubmission) -> None:
+                submission.write(folder)
+                self.move_fluent_post_files(folder,submission)
+
+        def write_folder(folder: str,
+                         submission: FluentSubmission) -> bool:
+
+            with tempfile.TemporaryDirectory() as staging:
+                write(staging,submission)
+                return _sync_folder(staging,os.path.join(parent,str(folder)),force = overwrite)
+        
+        with ThreadPoolExecutor(max_workers = workers) as executor:
+            written = executor.map(write_folder,self.submission_object.keys(),
+                                   self.submission_object.values())
+            return dict(zip(self.submission_object.keys(),written))
+
+    def make_batch_submission(self,parent: str,
+                                   verbose = True,
+                                   purge = False,
+                                   overwrite = False,
+                                   workers = None):
+        
+        """
+        Formatting the submission
+        makes appropriate directories if they do not exist
+        and optionally purges data using a safety delete that does not allow
+        recursion past a level of 2 on file folders, and will not delete .cas
+        or .dat files
+
+        Parameters
+        ----------
+        parent : str
+                the parent or root directory of the submission to make
+        verbose : bool
+                if True will print information during runtime
+        purge : bool
+                if True will purge the parent folder of any files or folders prior to 
+                populating with current batch information
+        overwrite : bool
+                if True every folder is rewritten, otherwise only the folders whose
+                content changed since they were last written are
+        workers : int
+                the number of threads writing folders
+        """
+        
+        self._prepare_parent(parent,purge = purge)
+        self._write_folders(parent,workers = workers,overwrite = overwrite)
         keys = list(self.submission_object.keys())
         python_version = self.submission_object[keys[0]].python_script.python_version
 
@@ -464,8 +522,7 @@ class FluentBatchSubmission(ABC):
             if verbose:
                 txt += 'echo "executing job located in folder: {}"'.format(folder) + self.LINE_BREAK
             
-            command,file = submission.format_submit(os.path.join(parent,str(folder)))
-            self.move_fluent_post_files(os.path.join(parent,str(folder)),submission)
+            command,file = submission.execute_command(os.path.join(parent,str(folder)))
             txt += 'cd '  + str(folder) + self.LINE_BREAK 
             txt += ''.join([command,file,' &',self.LINE_BREAK])
             txt += 'cd ..' + self.LINE_BREAK
@@ -574,18 +631,19 @@ class FluentBatchSubmission(ABC):
 
         """
         make a submission object from a boundary DataFrame i.e. a DataFrame of
-        FluentBoundaryConditions.
+        FluentBoundaryConditions. The journals are compiled from a single template journal,
+        so that only the boundary conditions are rendered for each row
         """
         
         submit_list = []
         name = '' if bdf.index.name is None else bdf.index.name
-        for index in bdf.index:
-            fluent_journal = FluentJournal(case_name,
-                                            reader = BatchCaseReader,
-                                            *frargs,**frkwargs)
-            
-            fluent_journal.reader.pwd = name + seperator + str(index)
-            fluent_journal.boundary_conditions = list(bdf.loc[index])
+        journal_template = JournalTemplate(FluentJournal(case_name,
+                                                         reader = BatchCaseReader,
+                                                         *frargs,**frkwargs))
+        
+        for index,row in zip(bdf.index,bdf.to_numpy(dtype = object)):
+            fluent_journal = journal_template.journal(list(row),
+                                                      pwd = name + seperator + str(index))
             submission_args =\
                  submission_object_parser(submission_args,
                                           case_name,index,name,seperator,
@@ -612,6 +670,9 @@ class FluentBatchSubmission(ABC):
 class PaceBatchSubmission(FluentBatchSubmission):
 
     PACE_PBS = 'fluent.pbs'
+    ARRAY_PBS = 'fluent_array.pbs'
+    PACKED_PBS = 'fluent_pack_{}.pbs'
+    ARRAY_SUBMIT = {'sbatch': ('sbatch --parsable','${ID%%;*}','${ID}_$i')}
     SUBMISSION_CLASS = PaceFluentSubmission
 
     def __init__(self,fluent_submission_list: list,
@@ -619,7 +680,10 @@ class PaceBatchSubmission(FluentBatchSubmission):
                       prefix = '',
                       seperator = '-',
                       case_file = None,
-                      submit_command = 'sbatch'):
+                      submit_command = 'sbatch',
+                      array = False,
+                      max_concurrent = None,
+                      pack = None):
 
         super().__init__(fluent_submission_list,
                          index = index,
@@ -631,11 +695,30 @@ class PaceBatchSubmission(FluentBatchSubmission):
         #these are fixed on PACE
         self.BATCH_EXE_FNAME = 'batch.sh'
         self.TERMINAL_TYPE = 'bash'
+
+        #submit all of the folders as the tasks of a single array job, only with slurm
+        #as the tasks of a PBS array cannot be resubmitted individually
+        if array and submit_command not in self.ARRAY_SUBMIT:
+            raise ValueError('array submission requires one of: {}, not: {}'.format(', '.join(self.ARRAY_SUBMIT),submit_command))
+        
+        self.array = array
+        self.max_concurrent = max_concurrent
+
+        #or run the cases of several folders at once in allocations of (at most) pack processors
+        if array and pack is not None:
+            raise ValueError('a batch may be submitted either as an array job or packed, not both')
+        
+        self.pack = pack
+    
+    @property
+    def array_file(self):
+        return self.ARRAY_PBS if self.array else None
     
     def generate_submission(self,parent: str,
                             purge=False, 
                             verbose=True,
-                            overwrite = False) -> None:
+                            overwrite = False,
+                            workers = None) -> None:
         
         try:
             self.move_batch_files.append(self.case_file)
@@ -643,15 +726,151 @@ class PaceBatchSubmission(FluentBatchSubmission):
             warnings.warn(str(ae))
 
         _bf = os.path.join(parent,self.BATCH_EXE_FNAME)
-        txt = self.make_batch_submission(parent,
-                                        verbose = verbose, 
-                                        purge = purge,
-                                        overwrite = overwrite)
+        if self.array:
+            make_submission = self.make_array_submission
+        elif self.pack is not None:
+            make_submission = self.make_packed_submission
+        else:
+            make_submission = self.make_batch_submission
+        
+        txt = make_submission(parent,
+                              verbose = verbose, 
+                              purge = purge,
+                              overwrite = overwrite,
+                              workers = workers)
 
         with open(_bf,'w',newline = self.LINE_BREAK) as file:
             file.write(txt)
 
 
+    def make_array_submission(self,parent: str,
+                                   verbose = True,
+                                   purge = False,
+                                   overwrite = False,
+                                   workers = None):
+        """
+        Formatting the submission as a single array job, rather than
+        a job for each folder. Only the journal files are written to the folders,
+        and a single array script of the first submission (in the parent folder) runs
+        the folder of each task. The batch script submits the array once and logs the id of 
+        each task so that the batch moniter can follow (and resubmit) the tasks individually.
+
+        Parameters
+        ----------
+        parent : str
+                the parent or root directory of the submission to make
+        verbose : bool
+                if True will print information during runtime
+        purge : bool
+                if True will purge the parent folder of any files or folders prior to 
+                populating with current batch information
+        overwrite : bool
+                if True every folder is rewritten, otherwise only the folders whose
+                content changed since they were last written are
+        """
+
+        if self.submit_command not in self.ARRAY_SUBMIT:
+            raise ValueError('array submission requires one of: {}, not: {}'.format(', '.join(self.ARRAY_SUBMIT),self.submit_command))
+
+        self._prepare_parent(parent,purge = purge)
+        keys = list(self.submission_object.keys())
+        first = self.submission_object[keys[0]]
+        python_version = first.python_script.python_version
+
+        def write_journal(folder: str,
+                          submission: FluentSubmission) -> None:
+            submission.fluent_journal.write(os.path.join(folder,submission.fluent_pbs.input_file))
+            self.move_fluent_post_files(folder,submission)
+        
+        self._write_folders(parent,write = write_journal,workers = workers,overwrite = overwrite)
+        name = self.prefix if self.prefix else 'fluent-array'
+        array_script = FluentArrayScript(first.fluent_pbs,keys,
+                                         max_concurrent = self.max_concurrent,
+                                         name = name)
+        array_script.write(parent,self.ARRAY_PBS)
+
+        command,job_id,task_id = self.ARRAY_SUBMIT[self.submit_command]
+        txt = 'module load anaconda3/' + python_version + self.LINE_BREAK
+        txt += 'conda init ' + self.TERMINAL_TYPE + self.LINE_BREAK
+        txt += 'conda activate' + self.LINE_BREAK
+        if verbose:
+            txt += 'echo "executing array job of {} folders"'.format(len(keys)) + self.LINE_BREAK
+        
+        txt += 'ID=$({} {})'.format(command,self.ARRAY_PBS) + self.LINE_BREAK
+        txt += 'ID={}'.format(job_id) + self.LINE_BREAK
+        txt += 'i=0' + self.LINE_BREAK
+        txt += 'while read FOLDER; do' + self.LINE_BREAK
+        txt += '    echo "$FOLDER,{}" >> {}'.format(task_id,'jobid.txt') + self.LINE_BREAK
+        txt += '    i=$((i + 1))' + self.LINE_BREAK
+        txt += 'done < ' + array_script.folder_file + self.LINE_BREAK
+        txt += 'python ' + self.batch_moniter_file.script_name + ' &' + self.LINE_BREAK
+        txt += 'conda deactivate' + self.LINE_BREAK
+        txt += 'module unload anaconda3/' + python_version + self.LINE_BREAK
+
+        return txt
+
+    def make_packed_submission(self,parent: str,
+                                    verbose = True,
+                                    purge = False,
+                                    overwrite = False,
+                                    workers = None):
+        """
+        Formatting the submission so that small cases share allocations. The cases are packed
+        by the number of processors they request into allocations of at most pack processors (a node), 
+        and each allocation runs all of its cases at once with a single job. Each folder is still written 
+        in full, so that the batch moniter can resubmit a case that failed in its own allocation.
+
+        Parameters
+        ----------
+        parent : str
+                the parent or root directory of the submission to make
+        verbose : bool
+                if True will print information during runtime
+        purge : bool
+                if True will purge the parent folder of any files or folders prior to 
+                populating with current batch information
+        overwrite : bool
+                if True every folder is rewritten, otherwise only the folders whose
+                content changed since they were last written are
+        """
+
+        if self.submit_command not in self.ARRAY_SUBMIT:
+            raise ValueError('packed submission requires one of: {}, not: {}'.format(', '.join(self.ARRAY_SUBMIT),self.submit_command))
+
+        self._prepare_parent(parent,purge = purge)
+        keys = list(self.submission_object.keys())
+        python_version = self.submission_object[keys[0]].python_script.python_version
+
+        self._write_folders(parent,workers = workers,overwrite = overwrite)
+        packs = pack_processors([self.submission_object[key].fluent_pbs.N_PROCESSORS for key in keys],
+                                self.pack)
+
+        command,job_id,_ = self.ARRAY_SUBMIT[self.submit_command]
+        txt = 'module load anaconda3/' + python_version + self.LINE_BREAK
+        txt += 'conda init ' + self.TERMINAL_TYPE + self.LINE_BREAK
+        txt += 'conda activate' + self.LINE_BREAK
+        for i,pack in enumerate(packs):
+            folders = [keys[j] for j in pack]
+            script_name = self.PACKED_PBS.format(i)
+            name = (self.prefix if self.prefix else 'fluent') + '-pack-' + str(i)
+            packed_script = FluentPackedScript([self.submission_object[folder].fluent_pbs for folder in folders],
+                                               folders,name = name)
+            packed_script.write(os.path.join(parent,script_name))
+
+            if verbose:
+                txt += 'echo "executing jobs located in folders: {}"'.format(', '.join([str(f) for f in folders])) + self.LINE_BREAK
+            
+            txt += 'ID=$({} {})'.format(command,script_name) + self.LINE_BREAK
+            txt += 'ID={}'.format(job_id) + self.LINE_BREAK
+            for folder in folders:
+                txt += 'echo "{},$ID" >> {}'.format(folder,'jobid.txt') + self.LINE_BREAK
+
+        txt += 'python ' + self.batch_moniter_file.script_name + ' &' + self.LINE_BREAK
+        txt += 'conda deactivate' + self.LINE_BREAK
+        txt += 'module unload anaconda3/' + python_version + self.LINE_BREAK
+
+        return txt
+
     @staticmethod
     def submission_args_from_boundary_df(submission_args: list,
                                          case_name : str,
@@ -661,21 +880,43 @@ class PaceBatchSubmission(FluentBatchSubmission):
                                          *frargs,
                                          **frkwargs) -> Tuple:
         
-        _pbs = submission_args[0].copy()
+        _pbs = submission_args[0].copy(deep = False)
         _pbs.script_header.name = name + seperator + str(index)
         return (_pbs,)
 
 class BatchCache:
+
+    """
+    Cache of a batch submission, so that the batch can be rebuilt later. The whole batch is
+    stored in a single (sqlite) file in the cache folder: the dictionary representation of the 
+    first submission is stored once as the template, and each submission is stored as the 
+    small delta of its representation from the template, indexed by the folder of the submission. 
+    Submissions may be read individually (and lazily) by folder.
+
+    caches written by earlier versions (one file per submission) are still read.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        batch_cache = BatchCache('batch_folder')
+        submission = batch_cache.read_submission('test-3')
+
+        submissions = batch_cache.read_submission_object_cache(lazy = True)
+        submission = submissions['test-3']          #read on access
+    """
     
     LINE_BREAK = '\n'
     _BATCH_CACHE_FOLDER = '_batchcache_'
     _SUBMISSION_CACHE_FILE = '.submission'
     _FRAME_CACHE_FILE = '.frame'
     _FORMATTING_CACHE_FILE = '.fmt'
+    _STORE_FILE = 'batch.db'
     
     def __init__(self,batch_folder: str):
 
         self.batch_folder = batch_folder
+        self.__template = None
 
         #check to see if the cache folder exists
         if not os.path.isdir(self.batch_cache):
@@ -684,38 +925,84 @@ class BatchCache:
     @property
     def batch_cache(self):
         return os.path.join(self.batch_folder,self._BATCH_CACHE_FOLDER)
+    
+    @property
+    def store(self):
+        return os.path.join(self.batch_cache,self._STORE_FILE)
+
+    def _connect(self) -> sqlite3.Connection:
+
+        conn = sqlite3.connect(self.store)
+        conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB)')
+        conn.execute('CREATE TABLE IF NOT EXISTS submissions (folder TEXT PRIMARY KEY, position INTEGER, delta BLOB)')
+        return conn
+    
+    def _write_meta(self,key: str,
+                         value) -> None:
+        
+        with closing(self._connect()) as conn, conn:
+            conn.execute('INSERT OR REPLACE INTO meta VALUES (?,?)',(key,value))
+    
+    def _read_meta(self,key: str):
+
+        if not os.path.exists(self.store):
+            return None
+        
+        with closing(self._connect()) as conn:
+            row = conn.execute('SELECT value FROM meta WHERE key = ?',(key,)).fetchone()
+        
+        return None if row is None else row[0]
 
     def cache_submission_object(self,submission_object:dict) -> None:
         """
         cache the submission object for later retrieval
         """
 
-        sf = os.path.join(self.batch_cache,self._SUBMISSION_CACHE_FILE)
-        with open(sf,'w') as sf_file:
-            for folder,submission in submission_object.items():
-                submission_cache_file = os.path.join(self.batch_cache,folder)
-                try:
-                    submission.serialize(submission_cache_file)
-                except TypeError as t:
-                    warnings.warn(str(t))
-                
-                sf_file.write(folder + self.LINE_BREAK)
+        representations = {}
+        for folder,submission in submission_object.items():
+            try:
+                representations[folder] = dict(_flatten_representation(submission._dict_representation()))
+            except TypeError as t:
+                warnings.warn(str(t))
+        
+        if not representations:
+            return
+        
+        template = next(iter(representations.values()))
+        try:
+            template = {path: dill.dumps(value) for path,value in template.items()}
+        except TypeError as t:
+            warnings.warn(str(t))
+            return
+
+        rows = []
+        for position,(folder,representation) in enumerate(representations.items()):
+            try:
+                delta = _representation_delta(template,representation)
+            except TypeError as t:
+                warnings.warn(str(t))
+                continue
+
+            rows.append((folder,position,dill.dumps(delta)))
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM submissions')
+            conn.execute('INSERT OR REPLACE INTO meta VALUES (?,?)',('template',dill.dumps(template)))
+            conn.executemany('INSERT INTO submissions VALUES (?,?,?)',rows)
+        
+        self.__template = None
     
     def cache_df(self, df: pd.DataFrame) -> None:
         """
         cache the data frame if there is one associated with the batch
         """
-
-        frame_file = os.path.join(self.batch_cache,self._FRAME_CACHE_FILE)
-        df.to_csv(frame_file)
+        self._write_meta('frame',df.to_csv())
     
     def cache_batch_formatting(self,kwargs) -> None:
         """
         cache the formatting arguments
         """
-
-        with open(os.path.join(self.batch_cache,self._FORMATTING_CACHE_FILE),'w') as file:
-            json.dump(kwargs,file)
+        self._write_meta('formatting',json.dumps(kwargs))
     
     def cache_batch(self,submission_object: dict,
                          df = None,
@@ -729,28 +1016,73 @@ class BatchCache:
             self.cache_df(df)
         
         self.cache_batch_formatting(fmtkwargs)
+    
+    @property
+    def _legacy(self) -> bool:
+        """
+        the cache was written with one file per submission
+        """
+        return not os.path.exists(self.store) and \
+                os.path.exists(os.path.join(self.batch_cache,self._SUBMISSION_CACHE_FILE))
 
-    def read_submission_object_cache(self, so_class: FluentSubmission) -> dict:
+    def folders(self) -> list:
         """
-        read in the submission object cache
+        the folders of the cached submissions, in order
         """
-        sf = os.path.join(self.batch_cache,self._SUBMISSION_CACHE_FILE)
-        with open(sf,'r') as file:
-            folders = []
-            for line in file.readlines():
-                folders.append(line.strip())
+        if self._legacy:
+            with open(os.path.join(self.batch_cache,self._SUBMISSION_CACHE_FILE),'r') as file:
+                return [line.strip() for line in file.readlines() if line.strip()]
+        
+        with closing(self._connect()) as conn:
+            return [row[0] for row in conn.execute('SELECT folder FROM submissions ORDER BY position')]
+
+    def read_submission(self,folder: str,
+                             so_class = None) -> FluentSubmission:
+        """
+        read in the submission of a single folder. The class of the submission
+        is the cached class, unless so_class is provided
+        """
+        if self._legacy:
+            dmdict = _load_legacy(os.path.join(self.batch_cache,folder))
+        else:
+            if self.__template is None:
+                self.__template = dill.loads(self._read_meta('template'))
+
+            with closing(self._connect()) as conn:
+                row = conn.execute('SELECT delta FROM submissions WHERE folder = ?',(folder,)).fetchone()
+            
+            if row is None:
+                raise KeyError('no submission cached for folder: {}'.format(folder))
+            
+            representation = dict(self.__template)
+            representation.update(dill.loads(row[0]))
+            dmdict = _unflatten_representation(representation)
+        
+        if so_class is None:
+            so_class = dmdict['class']
         
-        submission_object = dict.fromkeys(folders)
-        for folder in folders:
-            submission_file_name = os.path.join(self.batch_cache,folder)
-            submission_object[folder] = so_class.from_file(submission_file_name)
+        return so_class.from_dict(dmdict)
+
+    def read_submission_object_cache(self,so_class = None,
+                                          lazy = False) -> dict:
+        """
+        read in the submission object cache. If lazy, the submissions are only 
+        read as they are accessed
+        """
+        folders = self.folders()
+        if lazy:
+            return LazySubmissionCache(self,folders,so_class = so_class)
         
-        return submission_object
+        return {folder: self.read_submission(folder,so_class = so_class) for folder in folders}
     
     def read_df_cache(self) -> pd.DataFrame:
         """
         read in the cached data frame
         """
+        frame = self._read_meta('frame')
+        if frame is not None:
+            return pd.read_csv(StringIO(frame),header = 0,index_col= 0)
+        
         try:
             df_file = os.path.join(self.batch_cache,self._FRAME_CACHE_FILE)
             return pd.read_csv(df_file,header = 0,index_col= 0)
@@ -761,11 +1093,102 @@ class BatchCache:
         """
         read in the cached formatting
         """
+        formatting = self._read_meta('formatting')
+        if formatting is not None:
+            return json.loads(formatting)
+        
         with open(os.path.join(self.batch_cache,self._FORMATTING_CACHE_FILE),'r') as file:
             fmt_data = json.load(file)
         
         return fmt_data
 
+class LazySubmissionCache(Mapping):
+
+    """
+    read only mapping of folder to submission, reading each submission
+    from the BatchCache the first time it is accessed
+    """
+
+    def __init__(self,batch_cache: BatchCache,
+                      folders: list,
+                      so_class = None):
+
+        self.batch_cache = batch_cache
+        self.folders = folders
+        self.so_class = so_class
+        self.__submissions = {}
+    
+    def __getitem__(self,folder: str) -> FluentSubmission:
+
+        if folder not in self.__submissions:
+            if folder not in self.folders:
+                raise KeyError(folder)
+
+            self.__submissions[folder] = self.batch_cache.read_submission(folder,so_class = self.so_class)
+        
+        return self.__submissions[folder]
+    
+    def __iter__(self):
+        return iter(self.folders)
+    
+    def __len__(self):
+        return len(self.folders)
+
+_DELETED = None
+
+def _flatten_representation(representation: dict,
+                            path = ()) -> Iterable:
+    """
+    the leaves of a (nested) dictionary representation as (path,value) pairs
+    """
+    for key,value in representation.items():
+        if isinstance(value,dict) and value:
+            yield from _flatten_representation(value,path + (key,))
+        else:
+            yield path + (key,),value
+
+def _unflatten_representation(leaves: dict) -> dict:
+    """
+    rebuild the (nested) dictionary representation from the pickled leaves
+    """
+    representation = {}
+    for path,value in leaves.items():
+        if value is _DELETED:
+            continue
+
+        d = representation
+        for key in path[0:-1]:
+            d = d.setdefault(key,{})
+        
+        d[path[-1]] = dill.loads(value)
+    
+    return representation
+
+def _representation_delta(template: dict,
+                          representation: dict) -> dict:
+    """
+    the pickled leaves of the representation that differ from the (pickled) template,
+    with the leaves of the template missing from the representation marked as deleted
+    """
+    delta = {}
+    for path,value in representation.items():
+        value = dill.dumps(value)
+        if template.get(path) != value:
+            delta[path] = value
+    
+    for path in template:
+        if path not in representation:
+            delta[path] = _DELETED
+    
+    return delta
+
+def _load_legacy(file_name: str) -> dict:
+    """
+    load the dictionary representation of a submission cached in its own file
+    """
+    with open(file_name,'rb') as file:
+        return dill.load(file)
+
 class BatchSubmissionSummary:
 
     FLUENT_SOLUTION_EXT = '.trn'
@@ -796,31 +1219,36 @@ class BatchSubmissionSummary:
     
     def get_folders_with_completed_solution(self):
         
+        """
+        the folders with a solution file (transcript) whose run status is completed. Nothing
+        is written to the folders
+        """
+        if not self.filesys.solution_file_dict:
+            self.filesys.map_solution_files()
+
         folders = []
-        self.filesys.solution_files
-        for solution_file in self.filesys.solution_files.keys:
-            with self.filesys.solution_files[solution_file] as sf:
-                if sf.STATUS:
-                    folder = self.filesys.Path(os.path.join(self._folder,sf.fluent_folder))
-                    folders.append(folder)
-        
+        for folder,files in self.filesys.solution_file_dict.items():
+            if any(SolutionFile(str(f)).STATUS for f in files):
+                folders.append(folder)
+
         return folders
     
     def make_summary(self):
 
-        dfolders = self.get_folders_with_data()
-        cfolders = self.get_folders_with_case()
-        sfolders = self.get_folders_with_solution()
-        rfolders = self.get_folders_with_report_file()
-        csfolders = self.get_folders_with_completed_solution()
-
-        index = np.array(list(set(dfolders + cfolders + sfolders + rfolders + csfolders)))
-        data = np.zeros(shape = [index.shape[0],len(self.COLUMNS)],dtype = bool)
-        for i,_list in enumerate([dfolders,cfolders,sfolders,rfolders,csfolders]):
-            for j in range(len(index)):
-                if index[j] in _list:
-                    data[j,i] = True
-        
+        """
+        summary of the folders of the batch, with a column for each of the COLUMNS flagging 
+        if the folder has the files. The folders are listed once (in the index of the file system) 
+        and membership is found with set operations
+        """
+        self.filesys.map_submit_folders()
+        columns = [self.get_folders_with_data(),
+                   self.get_folders_with_case(),
+                   self.get_folders_with_solution(),
+                   self.get_folders_with_report_file(),
+                   self.get_folders_with_completed_solution()]
+
+        index = pd.Index(sorted(set().union(*columns)),dtype = object)
+        data = {name: index.isin(set(folders)) for name,folders in zip(self.COLUMNS,columns)}
         return pd.DataFrame(data,index = index,columns = self.COLUMNS)
 
 class FileSystemTree:
@@ -920,6 +1348,104 @@ def _flatten_dict(d,
     
     return dict(items)
 
+def _link_file(file: str,
+               folder: str) -> None:
+    """
+    hard link (or symbolic link if the file cannot be hard linked, i.e. across file systems)
+    the file into the folder, copying it only if neither link can be made. Files already in 
+    the folder are replaced, unless they are the same file or an unmodified copy
+    """
+
+    dst = os.path.join(folder,os.path.split(file)[1])
+    if os.path.exists(dst):
+        if os.path.samefile(file,dst) or filecmp.cmp(file,dst,shallow = True):
+            return
+        
+        os.remove(dst)
+
+    try:
+        os.link(file,dst)
+    except OSError:
+        try:
+            os.symlink(os.path.abspath(file),dst)
+        except OSError:
+            shutil.copy2(file,dst)
+
+def _folder_files(folder: str) -> list:
+    """
+    the paths of the files in a folder relative to the folder, sorted
+    """
+    files = []
+    for root,dirs,fnames in os.walk(folder):
+        dirs.sort()
+        files.extend([os.path.relpath(os.path.join(root,f),folder) for f in sorted(fnames)])
+    
+    return files
+
+def _folder_hash(folder: str,
+                 files = None) -> str:
+    """
+    hash of the names and content of the files in a folder, or of only the 
+    (relative paths of the) files provided. Returns None if any of the files are missing
+    """
+
+    hasher = hashlib.blake2b(digest_size = 16)
+    for file in (_folder_files(folder) if files is None else files):
+        hasher.update(file.encode())
+        try:
+            with open(os.path.join(folder,file),'rb') as f:
+                hasher.update(f.read())
+        except FileNotFoundError:
+            return None
+    
+    return hasher.hexdigest()
+
+FOLDER_HASH_FILE = '.folderhash'
+
+def _sync_folder(src: str,
+                 dst: str,
+                 force = False) -> bool:
+    """
+    copy the files of the (staging) folder src to the folder dst, unless the hash of
+    the files is the hash recorded in dst when it was last synced and the copies in dst
+    still have this hash (i.e. they were not edited or deleted since). The files synced are 
+    recorded with the hash, and files from an earlier sync that are no longer in src are removed 
+    from dst, while any other files (i.e. the output of a run) are kept. Returns
+    True if the files were copied, which they always are if force is True
+    """
+
+    content_hash = _folder_hash(src)
+    hash_file = os.path.join(dst,FOLDER_HASH_FILE)
+    try:
+        with open(hash_file,'r') as file:
+            previous = file.read().splitlines()
+    except FileNotFoundError:
+        previous = []
+    
+    files = _folder_files(src)
+    if not force and previous and previous[0].strip() == content_hash and \
+        _folder_hash(dst,files = files) == content_hash:
+        return False
+    
+    for stale in set(previous[1:]).difference(files):
+        fname = os.path.join(dst,stale)
+        try:
+            os.remove(fname)
+        except FileNotFoundError:
+            continue
+        
+        #remove the folders the stale file leaves empty
+        folder = os.path.dirname(fname)
+        while os.path.normpath(folder) != os.path.normpath(dst) and not os.listdir(folder):
+            os.rmdir(folder)
+            folder = os.path.dirname(folder)
+
+    shutil.copytree(src,dst,dirs_exist_ok = True)
+    with open(hash_file,'w') as file:
+        file.write('\n'.join([content_hash] + files) + '\n')
+    
+    return True
+
 def _safety_delete(root: str,
                    max_depth = 3,
                    keep_files = [],
@@ -1,6 +1,7 @@
 #native imports
 from multiprocessing.sharedctypes import Value
 from pandas import DataFrame,Series
+import pandas as pd
 from typing import List, Type
 import numpy as np 
 #package imports
@@ -37,6 +38,26 @@ ALLOWABLE_BOUNDARY_TYPES = ['mass-flow-inlet','pressure-outlet','wall',
 
 FLUID_BOUNDARY_CONDITIIONS = ['mass-flow-inlet','pressure-outlet']
 
+BOUNDARY_CONDITION_MAPPING = {'pressure-outlet':PressureOutlet,
+                              'mass-flow-inlet':MassFlowInlet,
+                              'wall':WallBoundaryCondition,
+                              'velocity-inlet':VelocityInlet,
+                              'ke-standard':KEpsilonModelConstants,
+                              'kw-standard':KOmegaModelConstants,
+                              'ke-realizable':KEpsilonModelConstants,
+                              'ke-rng': KEpsilonRNGModelConstants,
+                              'kw-SST': KOmega_SSTModelConstants,
+                              'kw-sst': KOmega_SSTModelConstants,
+                              'kw-BSL': KOmega_BSLModelConstants,
+                              'kw-bsl': KOmega_BSLModelConstants,
+                              'kw-low-re': KOmegaLowReCorrection,
+                              'kw-geko':GEKOModelConstants,
+                              'geko':GEKOModelConstants,
+                              'fluid-modification':FluidMaterialModification,
+                              'laminar': NoTurbulenceModel,
+                              'source': ConstantSource,
+                              'rp_var': RPSetVar}
+
 def split_header_name(string: str,
                         delim = ':') -> tuple:
     """
@@ -96,6 +117,10 @@ def partition_boundary_table(df: DataFrame,
 
     and the rows contain the boundary conditions of the appropriate type. The number
     of rows will be identical to the number of inputs rows of the table
+
+    The table is compiled by column: each column is checked and converted once for each of 
+    its distinct values (parsing UDF strings once), and a boundary condition is made once 
+    for each distinct row of a boundary, shared by all of the rows with those values
     """
     
     models = _infer_models_from_headers(df.columns)
@@ -109,29 +134,115 @@ def partition_boundary_table(df: DataFrame,
         else:
             cols = [_name[0]  + delim + c + delim + _name[1] for c in svars]
         
-        bc_map = dict(zip(cols,sorted_df[name]))
-        _df = df[cols]
-        boundary_list[name] = []
-        for i in df.index:
+        #model and fluid modifications are passed the values of the table as is
+        convert = _name[1] != 'model modification' and _name[1] != 'fluid-modification'
+        try:
+            columns = [_compile_column(df[col],col,convert) for col in cols]
+        except TypeError:
+            #unhashable values (i.e. lists) are handled row by row
+            columns = [_column_by_row(df[col],col,convert) for col in cols]
+
+        codes = np.stack([c[0] for c in columns],axis = 1)
+        unique_rows,inverse = np.unique(codes,axis = 0,return_inverse = True)
         
-            try:
-                bc_dict = _df.loc[i].to_dict()
-            except IndexError:
-                bc_dict = _df.loc[i].squeeze().to_dict()
-            
-            boundary_list[name].append(
-            make_boundary_condition_from_series(_name[1],
-                                                _name[0],
-                                                bc_dict,
-                                                bc_map,
-                                                turbulence_model,
-                                                models)
-                                     )
+        made = []
+        for row in unique_rows:
+            made.append(_make_compiled_boundary_condition(_name[1],_name[0],
+                                                          {var: column[1][code] for var,column,code in zip(sorted_df[name],columns,row)},
+                                                          turbulence_model,
+                                                          models))
+        
+        boundary_list[name] = [made[i] for i in np.ravel(inverse)]
     
     bdf = DataFrame.from_dict(boundary_list)
     bdf.index = df.index
     return bdf
 
+def _convert_value(value,column: str) -> tuple:
+    """
+    convert a value of a boundary condition column, returning (True,UDF) if the
+    value specifies a UDF and (False,value) otherwise
+    """
+    if isinstance(value,str):
+        try:
+            return True,_parse_udf_from_str(value)
+        except ValueError:
+            return False,float(value)
+        except TypeError:
+            try:
+                return False,bool(value)
+            except TypeError:
+                raise TypeError('cannot convert value: {} from column {} to float'.format(value,column))
+    elif isinstance(value,list):
+        return False,value
+    else:
+        try:
+            return False,float(value)
+        except TypeError:
+            try:
+                return False,bool(value)
+            except TypeError:
+                raise TypeError('cannot convert value: {} from column {} to float'.format(value,column))
+
+def _compile_column(column: Series,
+                    name: str,
+                    convert = True) -> tuple:
+    """
+    the codes of the distinct values of the column for each row, and the
+    (converted) distinct values
+    """
+    if convert and column.dtype.kind in 'iufb':
+        codes,uniques = pd.factorize(column.to_numpy(dtype = float),use_na_sentinel = False)
+        return codes,[(False,float(value)) for value in uniques]
+
+    codes,uniques = pd.factorize(column.to_numpy(dtype = object),use_na_sentinel = False)
+    if convert:
+        #values written differently (i.e. 2e6 and '2e6') share a code once converted
+        converted,recode,seen = [],np.empty(len(uniques),dtype = int),{}
+        for i,value in enumerate(uniques):
+            value = _convert_value(value,name)
+            key = value if not value[0] and isinstance(value[1],float) else (i,)
+            recode[i] = seen.setdefault(key,len(converted))
+            if recode[i] == len(converted):
+                converted.append(value)
+
+        return recode[codes],converted
+
+    return codes,[(False,value) for value in uniques]
+
+def _column_by_row(column: Series,
+                   name: str,
+                   convert = True) -> tuple:
+    """
+    every row of the column as a distinct value
+    """
+    values = column.to_list()
+    if convert:
+        values = [_convert_value(value,name) for value in values]
+    else:
+        values = [(False,value) for value in values]
+    
+    return np.arange(len(values)),values
+
+def _make_compiled_boundary_condition(btype: str,
+                                      name: str,
+                                      values: dict,
+                                      turbulence_model: str,
+                                      models: list):
+    """
+    make the boundary condition from the compiled (converted) values of a row
+    """
+    if btype == 'model modification' or btype == 'fluid-modification':
+        return make_boundary_condition_from_series(btype,name,
+                                                   {var: value for var,(_,value) in values.items()},
+                                                   {var: var for var in values},
+                                                   turbulence_model,models)
+
+    udfs = {var: value for var,(is_udf,value) in values.items() if is_udf}
+    bc_kwargs = {var: value for var,(is_udf,value) in values.items() if not is_udf}
+    return _build_udf_boundary_condition(BOUNDARY_CONDITION_MAPPING[btype],name,models,
+                                         turbulence_model,udfs,bc_kwargs)
+
 def _infer_models_from_headers(columns: list) -> list:
     """
     simple function for infering models from the supplied headers. 
@@ -218,26 +329,20 @@ def handle_udf_boundary_condition(cls: FluentBoundaryCondition,
     udfs = {}
     bc_kwargs = {}
     for key,value in kwargs.items():
-        if isinstance(value,str):
-            try:
-                udfs[key] = _parse_udf_from_str(value)
-            except ValueError:
-                bc_kwargs[key] = float(value)
-            except TypeError:
-                try:
-                    bc_kwargs[key] = bool(value)
-                except TypeError:
-                    raise TypeError('cannot convert value: {} from column {} to float'.format(value,key))
-        elif isinstance(value,list):
-            bc_kwargs[key] = value
+        is_udf,value = _convert_value(value,key)
+        if is_udf:
+            udfs[key] = value
         else:
-            try:
-                bc_kwargs[key] = float(value)
-            except TypeError:
-                try:
-                    bc_kwargs[key] = bool(value)
-                except TypeError:
-                    raise TypeError('cannot convert value: {} from column {} to float'.format(value,key))
+            bc_kwargs[key] = value
+    
+    return _build_udf_boundary_condition(cls,name,models,turbulence_model,udfs,bc_kwargs)
+
+def _build_udf_boundary_condition(cls: FluentBoundaryCondition,
+                                  name: str,
+                                  models: List[str],
+                                  turbulence_model: str,
+                                  udfs: dict,
+                                  bc_kwargs: dict) -> FluentBoundaryCondition:
     
     try:
         boundary_condition = cls(name,models,turbulence_model, **bc_kwargs)
@@ -276,25 +381,7 @@ def make_boundary_condition_from_series(btype: str,
     for key,value in boundary_dict.items():
         bdict[bc_map[key]] = value
     
-    mapping = {'pressure-outlet':PressureOutlet,
-               'mass-flow-inlet':MassFlowInlet,
-               'wall':WallBoundaryCondition,
-               'velocity-inlet':VelocityInlet,
-               'ke-standard':KEpsilonModelConstants,
-               'kw-standard':KOmegaModelConstants,
-               'ke-realizable':KEpsilonModelConstants,
-               'ke-rng': KEpsilonRNGModelConstants,
-               'kw-SST': KOmega_SSTModelConstants,
-               'kw-sst': KOmega_SSTModelConstants,
-               'kw-BSL': KOmega_BSLModelConstants,
-               'kw-bsl': KOmega_BSLModelConstants,
-               'kw-low-re': KOmegaLowReCorrection,
-               'kw-geko':GEKOModelConstants,
-               'geko':GEKOModelConstants,
-               'fluid-modification':FluidMaterialModification,
-               'laminar': NoTurbulenceModel,
-               'source': ConstantSource,
-               'rp_var': RPSetVar}
+    mapping = BOUNDARY_CONDITION_MAPPING
     
     if btype != 'model modification' and btype != 'fluid-modification':
         return handle_udf_boundary_condition(mapping[btype],
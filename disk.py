@@ -2,6 +2,10 @@
 from abc import ABC,abstractstaticmethod
 import os
 import dill
+import json
+import hashlib
+import numpy as np
+import pandas as pd
 
 """
 Author: Michael Lanahan
@@ -139,4 +143,233 @@ def _serialize_file_writer_dispatch(file_name,data):
         with open(file_name,'wb') as file:
             dill.dump(data,file)
     else:
-        dill.dump(data,file_name)    
\ No newline at end of file
+        dill.dump(data,file_name)    
+
+class ParseCache:
+    """
+    ParseCache
+
+    Parameters
+    ----------
+    folder : str
+            a central folder to write the cache entries to. If None, the entries
+            are written to a folder named FOLDER_NAME next to each source file
+    
+    Description
+    ----------
+    on-disk cache of parsed DataFrames (and some side metadata) so that 
+    unchanged ascii output files do not need to be re-parsed. Entries are written
+    in numpy's binary .npz format with one array per column, and are keyed on the
+    path of the source file (and the parsing options). An entry is valid if 
+    the size and modification time of the source are unchanged, or if the size and
+    a content hash of the source are unchanged. Stale entries are evicted when 
+    they are found, and clean() removes all stale entries in a folder.
+
+    Only DataFrames with numeric columns and index are cached.
+
+    Examples
+    ----------
+    .. code-block:: python
+
+        from fluentpy.disk import ParseCache
+        from fluentpy.fluentio import FluentFile,SolutionFile
+
+        FluentFile.PARSE_CACHE = ParseCache()
+        with SolutionFile('solution.trn') as sfile:
+            df = sfile.readdf()         #parsed and written to the cache
+        
+        with SolutionFile('solution.trn') as sfile:
+            df = sfile.readdf()         #read from the cache
+    """
+
+    FOLDER_NAME = '.fluentpy_cache'
+    _EXT = '.npz'
+    _HASH_BUFFER = 1024**2
+
+    def __init__(self,folder = None):
+        self.folder = folder
+    
+    @classmethod
+    def content_hash(cls,fname: str) -> str:
+        """
+        hash of the contents of the file
+        """
+        hasher = hashlib.blake2b(digest_size = 16)
+        with open(fname,'rb') as file:
+            for block in iter(lambda: file.read(cls._HASH_BUFFER),b''):
+                hasher.update(block)
+        
+        return hasher.hexdigest()
+
+    def _entry_file(self,fname: str,
+                         key = '') -> str:
+        """
+        the file containing the cache entry for the source file and key
+        """
+        fname = os.path.abspath(fname)
+        name = hashlib.blake2b('{}|{}'.format(fname,key).encode(),digest_size = 16).hexdigest()
+        folder = os.path.join(os.path.dirname(fname),self.FOLDER_NAME) if self.folder is None else self.folder
+        return os.path.join(folder,name + self._EXT)
+    
+    @staticmethod
+    def _read_entry(entry: str) -> tuple:
+        """
+        read the metadata and arrays from an entry
+        """
+        with np.load(entry,allow_pickle = False) as npz:
+            meta = json.loads(str(npz['meta']))
+            arrays = {key:npz[key] for key in npz.files if key != 'meta'}
+        
+        return meta,arrays
+    
+    def _is_valid(self,fname: str,
+                       meta: dict) -> bool:
+        """
+        check the fingerprint of the source file against the fingerprint 
+        stored in the entry
+        """
+        try:
+            stat = os.stat(fname)
+        except FileNotFoundError:
+            return False
+        
+        if stat.st_size != meta['size']:
+            return False
+        elif stat.st_mtime_ns == meta['mtime_ns']:
+            return True
+        else:
+            return self.content_hash(fname) == meta['hash']
+
+    def load(self,fname: str,
+                  key = '') -> tuple:
+        """
+        load the DataFrame and metadata from the cache
+
+        Parameters
+        ----------
+        fname : str
+                the source file name
+        key : str
+                additional key to distinguish entries of the same file (i.e. parsing options)
+        
+        Returns
+        ----------
+        df : pandas.DataFrame
+                the cached frame, None if there is no valid entry
+        metadata : dict
+                the cached metadata, None if there is no valid entry
+        """
+        entry = self._entry_file(fname,key = key)
+        try:
+            meta,arrays = self._read_entry(entry)
+        except (OSError,ValueError,KeyError):
+            return None,None
+
+        if not self._is_valid(fname,meta):
+            self.evict(fname,key = key)
+            return None,None
+        
+        index = pd.Index(arrays['index'],name = meta['index_name'])
+        df = pd.DataFrame({i:arrays['column_{}'.format(i)] for i in range(len(meta['columns']))},
+                          index = index)
+        df.columns = meta['columns']
+        return df,meta['metadata']
+
+    def store(self,fname: str,
+                   df: pd.DataFrame,
+                   metadata = None,
+                   key = '') -> bool:
+        """
+        write the DataFrame and metadata to the cache. The metadata must be
+        json serializable
+
+        Returns
+        ----------
+        stored : bool
+                False if the frame could not be cached
+        """
+        if df is None or not all(np.issubdtype(dtype,np.number) for dtype in list(df.dtypes) + [df.index.dtype]):
+            return False
+        
+        stat = os.stat(fname)
+        meta = {'path': os.path.abspath(fname),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'hash': self.content_hash(fname),
+                'columns': list(df.columns),
+                'index_name': df.index.name,
+                'metadata': {} if metadata is None else metadata}
+
+        arrays = {'column_{}'.format(i):df.iloc[:,i].to_numpy() for i in range(df.shape[1])}
+        arrays['index'] = df.index.to_numpy()
+        arrays['meta'] = np.array(json.dumps(meta))
+
+        entry = self._entry_file(fname,key = key)
+        os.makedirs(os.path.dirname(entry),exist_ok = True)
+        
+        #write to a temporary file first so that a partially written entry is never read
+        temp = entry + '.{}.tmp'.format(os.getpid())
+        with open(temp,'wb') as file:
+            np.savez(file,**arrays)
+        
+        os.replace(temp,entry)
+        return True
+
+    def update_metadata(self,fname: str,
+                             metadata: dict,
+                             key = '') -> bool:
+        """
+        update the metadata of an existing valid entry
+        """
+        df,_metadata = self.load(fname,key = key)
+        if df is None:
+            return False
+        
+        _metadata.update(metadata)
+        return self.store(fname,df,metadata = _metadata,key = key)
+
+    def evict(self,fname: str,
+                   key = '') -> None:
+        """
+        remove the entry of a file from the cache
+        """
+        try:
+            os.remove(self._entry_file(fname,key = key))
+        except FileNotFoundError:
+            pass
+
+    def clean(self,root = None) -> int:
+        """
+        remove all stale entries, i.e. entries whose source file has been changed
+        or removed. If the cache is written next to the source files, all cache folders
+        under root are cleaned
+
+        Returns
+        ----------
+        removed : int
+                the number of entries removed
+        """
+        if self.folder is not None:
+            folders = [self.folder]
+        elif root is None:
+            raise ValueError('a root folder must be provided to clean a cache written next to the source files')
+        else:
+            folders = [os.path.join(path,self.FOLDER_NAME) for path,dirs,_ in os.walk(root) 
+                       if self.FOLDER_NAME in dirs]
+
+        removed = 0
+        for folder in folders:
+            for entry in os.scandir(folder):
+                if not entry.name.endswith(self._EXT):
+                    continue
+                try:
+                    meta,_ = self._read_entry(entry.path)
+                    stale = not self._is_valid(meta['path'],meta)
+                except (OSError,ValueError,KeyError):
+                    stale = True
+                
+                if stale:
+                    os.remove(entry.path)
+                    removed += 1
+        
+        return removed
@@ -1,5 +1,5 @@
 #third party imports
-from io import StringIO
+from io import StringIO,BytesIO
 from posixpath import splitext
 from typing import Iterable,Union, List
 import more_itertools
@@ -14,15 +14,19 @@ from pandas.errors import ParserError
 from pathlib import WindowsPath,PosixPath
 import sys
 import os
+import time
+import json
 import warnings
+from concurrent.futures import ProcessPoolExecutor,ThreadPoolExecutor
 from sqlalchemy import column
 
 #package imports
-from ._file_scan import _get_text_between_phrase_lines
+from ._file_scan import _read_text_between_phrases,_mapped_file
 
 __all__ = [
            'ReportFileOut',
            'SolutionFile',
+           'RunStatus',
            'ReportFilesOut',
            'SolutionFiles',
            'PostDataFile',
@@ -62,6 +66,7 @@ class FluentFile(ABC):
     """
 
     LINE_BREAK = '\n'
+    PARSE_CACHE = None
 
     def __new__(cls,*args,**kwargs):
 
@@ -86,6 +91,8 @@ class FluentFile(ABC):
         self.file = None
         self.length = None
         self.__df = None
+        self.__deferred = None
+        self.__offset = 0
         
         self.__case_name = case_name
         
@@ -184,11 +191,23 @@ class FluentFile(ABC):
         tabular format convinient to store in a pandas data frame. The df property
         is meant to hold this data
         """
+        if self.__deferred is not None:
+            build,self.__deferred = self.__deferred,None
+            self.__df = build()
+        
         return self.__df
 
     @df.setter
     def df(self,df):
+        self.__deferred = None
         self.__df = df
+    
+    def _defer_df(self,build) -> None:
+        """
+        df is built by calling build() the next time it is accessed rather than
+        now, so that polling the file with refresh() does not rebuild df each poll
+        """
+        self.__deferred = build
 
     @abstractmethod
     def readdf(self):
@@ -198,17 +217,216 @@ class FluentFile(ABC):
         """
         pass
 
+    def _cache_key(self,**options) -> str:
+        """
+        key distinguishing the cache entries of the same file read by different
+        classes or with different options
+        """
+        return '{}{}'.format(self.__class__.__name__,repr(sorted(options.items())))
+
+    def _cache_metadata(self) -> dict:
+        """
+        side metadata written to the PARSE_CACHE along with df, must be json serializable.
+        Inherited files with information not contained in df should extend this
+        """
+        return {}
+    
+    def _restore_cache_metadata(self,metadata: dict) -> None:
+        """
+        restore the side metadata read from the PARSE_CACHE
+        """
+        pass
+
+    def _read_cache(self,**options) -> bool:
+        """
+        read df (and the side metadata) from the PARSE_CACHE if it is enabled and 
+        contains a valid entry for this file, returning True if successful
+        """
+        if self.PARSE_CACHE is None:
+            return False
+        
+        df,metadata = self.PARSE_CACHE.load(self.fname,key = self._cache_key(**options))
+        if df is None:
+            return False
+        
+        self.df = df
+        self._restore_cache_metadata(metadata)
+        return True
+    
+    def _write_cache(self,**options) -> None:
+        """
+        write df (and the side metadata) to the PARSE_CACHE if it is enabled
+        """
+        if self.PARSE_CACHE is not None:
+            self.PARSE_CACHE.store(self.fname,self.df,metadata = self._cache_metadata(),
+                                   key = self._cache_key(**options))
+
+    @property
+    def offset(self):
+        """
+        the byte offset in the file up to which data has been parsed by refresh()
+        """
+        return self.__offset
+    
+    @offset.setter
+    def offset(self,o):
+        self.__offset = o
+
+    def _reset_follow(self):
+        """
+        reset the state kept by refresh(). Inherited files which keep additional
+        state (i.e. parsed headers) should extend this
+        """
+        self.offset = 0
+
+    def _read_appended_text(self) -> tuple:
+        """
+        read the complete lines appended to the file since the stored offset. A partially 
+        written trailing line is not returned so that it may be read once it is complete.
+        If the file has shrunk (i.e. it was overwritten by a restarted job) the follow
+        state is reset and the file is read from the beginning. The offset is not advanced
+        here, the caller should advance the offset by the number of bytes it consumes
+
+        Returns
+        -------
+        text : str
+                the complete lines appended to the file
+        nbytes : int
+                the number of bytes in the file corresponding to text
+        """
+        if os.path.getsize(self.fname) < self.offset:
+            self._reset_follow()
+
+        with open(self.fname,'rb') as file:
+            file.seek(self.offset)
+            data = file.read()
+        
+        nbytes = data.rfind(self.LINE_BREAK.encode()) + 1
+        text = data[0:nbytes].decode(errors = 'replace').replace('\r\n',self.LINE_BREAK)
+        return text,nbytes
+
+    def refresh(self,**kwargs) -> pd.DataFrame:
+        """
+        inherited files which support tail following parse only the rows appended to the 
+        file since the last call here, appending them to df
+        """
+        raise NotImplementedError('refresh() is not supported for {}'.format(self.__class__.__name__))
+
+    def follow(self,interval = 1.0,
+                    timeout = None,
+                    **kwargs):
+        """
+        poll the file for newly appended rows, useful for monitoring a running job
+        without re-reading the whole file every poll
+
+        Parameters
+        ----------
+        interval : float
+                the time in seconds to wait between polls of the file when no new rows
+                are found
+        timeout : float
+                stop following once no new rows have been found for this many seconds.
+                if None, follow the file indefinitely
+        **kwargs : dict
+                key word arguments passed to refresh()
+        
+        Yields
+        ------
+        new : pandas.DataFrame
+                the newly appended rows. The full data is available in df
+        """
+        last = time.time()
+        while timeout is None or time.time() - last < timeout:
+            new = self.refresh(**kwargs)
+            if new is None or new.empty:
+                time.sleep(interval)
+            else:
+                last = time.time()
+                yield new
+
+def _parse_fluent_file(component_class,
+                       fname: str,
+                       **kwargs) -> pd.DataFrame:
+    """
+    parse a single fluent file into a DataFrame. This is defined at the module level
+    so that it may be sent to a process pool. kwargs are passed to the component class
+    (i.e. the parser of a SolutionFile)
+    """
+    with component_class(fname,**kwargs) as ffile:
+        return ffile.readdf()
+
+def _parse_fluent_file_last_row(component_class,
+                                fname: str,
+                                **kwargs) -> pd.DataFrame:
+    """
+    parse only the last row of a single fluent file into a DataFrame
+    """
+    return component_class(fname,**kwargs).read_last_row()
+
 class FluentFiles(dict):
 
+    """
+    Parameters
+    ----------
+    flist : list
+            the list of file names
+    max_workers : int
+            the number of workers used to parse the files. If None, the default 
+            of the pool is used, if 1, the files are parsed sequentially
+    pool : str
+            the kind of pool used to parse the files in parallel, either "thread"
+            or "process". Process pools are faster for very large batches, but
+            require that the calling script is guarded by if __name__ == '__main__'
+            on windows
+
+    Description
+    -----------
+    container for a batch of fluent files. All of the files are parsed exactly once 
+    by load(), and the parsed frames are kept in memory in "frames" so that get_variable(), 
+    columns, and readdf() do not re-read the files
+    """
+
+    POOLS = {'thread':ThreadPoolExecutor,
+             'process':ProcessPoolExecutor}
+
     def __init__(self,flist: list,
-                      *args,**kwargs):
+                      *args,
+                      max_workers = None,
+                      pool = 'thread',
+                      **kwargs):
 
         self.component_class = None
+        self.component_kwargs = {}
         self.keys = flist
         self.__data = {}
+        self.__frames = {}
         self.__df = None
         self.__columns = []
+        self.max_workers = max_workers
+        self.pool = pool
         super().__init__(*args,**kwargs)
+    
+    @property
+    def pool(self):
+        return self.__pool
+    
+    @pool.setter
+    def pool(self,p):
+        if p not in self.POOLS:
+            raise ValueError('pool must be one of: {}, not: {}'.format(','.join(self.POOLS.keys()),p))
+        
+        self.__pool = p
+    
+    @property
+    def frames(self):
+        """
+        the complete parsed DataFrame of each file, keyed by file name
+        """
+        return self.__frames
+    
+    @frames.setter
+    def frames(self,f):
+        self.__frames = f
 
     @property
     def data(self):
@@ -231,7 +449,7 @@ class FluentFiles(dict):
             raise NotImplementedError('Must set Class in subclasses of fluentFiles')
         
         for key in self.keys:
-            self.__setitem__(key,self.component_class(str(key))) 
+            self.__setitem__(key,self.component_class(str(key),**self.component_kwargs))
         
     def __setitem__(self,key,item):
         self.__dict__[key] = item
@@ -258,16 +476,45 @@ class FluentFiles(dict):
         
         return edict
 
+    def _parse_files(self,parser = _parse_fluent_file) -> dict:
+        """
+        parse each of the files in the batch, in parallel if requested
+        """
+        if self.max_workers == 1 or len(self.keys) <= 1:
+            return {key:parser(self.component_class,str(key),**self.component_kwargs) for key in self.keys}
+        
+        with self.POOLS[self.pool](max_workers = self.max_workers) as executor:
+            futures = {key:executor.submit(parser,self.component_class,str(key),**self.component_kwargs) 
+                       for key in self.keys}
+            
+            return {key:future.result() for key,future in futures.items()}
+
     #load the data set into a list of fluent files
     def load(self,convergedResult = True):
         
+        self.frames = self._parse_files()
+        self.columns = []
         for key in self.keys:
-            with self.__getitem__(key) as ffile:
-                if convergedResult:
-                    self.data[key] = ffile.readdf().iloc[-1]
-                else:
-                    self.data[key] = ffile.readdf().iloc[-1]
-                self.columns += list(ffile.df.columns)
+            self.__getitem__(key).df = self.frames[key]
+            if convergedResult:
+                self.data[key] = self.frames[key].iloc[-1]
+            else:
+                self.data[key] = self.frames[key].iloc[-1]
+            self.columns += list(self.frames[key].columns)
+        
+        self.columns = list(set(self.columns))
+
+    def load_converged(self):
+        """
+        load only the converged result (the last row) of each file into data, for component
+        classes which can read the last row without parsing the entire file (read_last_row()).
+        The complete frames are not read, so frames is left empty
+        """
+        last_rows = self._parse_files(parser = _parse_fluent_file_last_row)
+        self.columns = []
+        for key in self.keys:
+            self.data[key] = last_rows[key].iloc[-1]
+            self.columns += list(last_rows[key].columns)
         
         self.columns = list(set(self.columns))
 
@@ -280,14 +527,13 @@ class FluentFiles(dict):
         appear in some files but not another. This can be dangerous
         so I have made the default to NOT ignore missing
         """
-        if not self.data:
+        if not self.frames:
             self.load()
 
         dat = []
         for key in self.keys:
             try:
-                with self.__getitem__(key) as ffile:
-                    dat.append(ffile.readdf()[varname])
+                dat.append(self.frames[key][varname])
             except KeyError as ke:
                 if ignore_missing:
                     dat.append(None)
@@ -297,6 +543,161 @@ class FluentFiles(dict):
         data = pd.concat(dat,axis = 1)
         return data
     
+_SEGMENT_STATISTICS = {np.mean:'mean',
+                       np.average:'mean',
+                       np.sum:'sum',
+                       np.max:'max',
+                       np.amax:'max',
+                       np.min:'min',
+                       np.amin:'min',
+                       np.std:'std',
+                       np.var:'var',
+                       np.median:'median'}
+
+_WEIGHTED_STATISTICS = ['mean','sum','var','std']
+
+class _RowBuffer:
+    """
+    rows appended to a 2D array whose capacity doubles as it fills, so appending
+    rows costs (amortized) only the rows appended
+    """
+
+    def __init__(self):
+        self.__array = None
+        self.__size = 0
+    
+    def __len__(self):
+        return self.__size
+    
+    @property
+    def values(self) -> np.ndarray:
+        return None if self.__array is None else self.__array[0:self.__size]
+
+    def append(self,rows: np.ndarray) -> None:
+
+        if rows.shape[0] == 0:
+            return
+        
+        if self.__array is None:
+            self.__array = np.empty((max(2*rows.shape[0],64),rows.shape[1]))
+        elif rows.shape[1] != self.__array.shape[1]:
+            raise ValueError('cannot append rows with {} columns to rows with {} columns'.format(rows.shape[1],self.__array.shape[1]))
+        elif self.__size + rows.shape[0] > self.__array.shape[0]:
+            array = np.empty((max(2*self.__array.shape[0],self.__size + rows.shape[0]),self.__array.shape[1]))
+            array[0:self.__size] = self.__array[0:self.__size]
+            self.__array = array
+        
+        self.__array[self.__size:self.__size + rows.shape[0]] = rows
+        self.__size += rows.shape[0]
+
+    def clear(self) -> None:
+        self.__array = None
+        self.__size = 0
+
+def _segment_percentile(values: np.ndarray,
+                        starts: np.ndarray,
+                        counts: np.ndarray,
+                        q: float) -> np.ndarray:
+    """
+    the q-th percentile of each segment of the rows of values, using the same 
+    linear interpolation as np.percentile. The rows are sorted within each segment
+    once per column
+    """
+    segment = np.repeat(np.arange(starts.shape[0]),counts)
+    position = q/100.0*(counts - 1)
+    lower = np.floor(position).astype(int)
+    upper = np.ceil(position).astype(int)
+    fraction = position - lower
+    
+    data = np.empty([starts.shape[0],values.shape[1]])
+    for j in range(values.shape[1]):
+        ordered = values[np.lexsort((values[:,j],segment)),j]
+        data[:,j] = ordered[starts + lower] + fraction*(ordered[starts + upper] - ordered[starts + lower])
+    
+    return data
+
+def _segment_statistic(values: np.ndarray,
+                       starts: np.ndarray,
+                       statistic: Union[str,callable],
+                       weights = None) -> np.ndarray:
+    """
+    Parameters
+    ----------
+    values : np.ndarray
+            2D array of the values, rows are the observations
+    starts : np.ndarray
+            the (increasing) row index at which each segment starts, each segment 
+            ends at the start of the next
+    statistic : str | callable
+            one of "mean","sum","min","max","std","var","median","count" or "p<q>" for
+            the q-th percentile (i.e. "p95"). The corresponding numpy functions are
+            recognized, any other callable is applied to each segment as 
+            >> statistic(array,axis = 0)
+    weights : np.ndarray
+            optional weights of each row for the "mean","sum","var" and "std" statistics,
+            ignored by the other statistics
+    
+    Returns
+    -------
+    data : np.ndarray
+            2D array with a row for each segment
+
+    computes the statistic for all of the segments at once using the ufunc.reduceat
+    kernels rather than looping over each segment in python
+    """
+    name = _SEGMENT_STATISTICS.get(statistic,statistic)
+    offset = starts[0]
+    values = values[offset:]
+    starts = starts - offset
+    counts = np.diff(np.append(starts,values.shape[0]))
+    
+    if callable(name):
+        bounds = np.append(starts,values.shape[0])
+        return np.array([name(values[bounds[i]:bounds[i+1]],axis = 0) for i in range(starts.shape[0])])
+    
+    #the remaining statistics (i.e. min,max,percentiles) are not weighted
+    if weights is not None and name in _WEIGHTED_STATISTICS:
+        weights = np.asarray(weights,dtype = float)[offset:,None]
+    else:
+        weights = None
+    
+    if name == 'count':
+        return np.repeat(counts[:,None],values.shape[1],axis = 1).astype(float)
+    elif name == 'min':
+        return np.minimum.reduceat(values,starts,axis = 0)
+    elif name == 'max':
+        return np.maximum.reduceat(values,starts,axis = 0)
+    elif name == 'sum':
+        return np.add.reduceat(values if weights is None else values*weights,starts,axis = 0)
+    elif name in ['mean','var','std']:
+        if weights is None:
+            total = counts[:,None]
+            mean = np.add.reduceat(values,starts,axis = 0)/total
+        else:
+            total = np.add.reduceat(weights,starts,axis = 0)
+            mean = np.add.reduceat(values*weights,starts,axis = 0)/total
+        
+        if name == 'mean':
+            return mean
+        
+        deviation = (values - np.repeat(mean,counts,axis = 0))**2
+        if weights is not None:
+            deviation *= weights
+
+        var = np.add.reduceat(deviation,starts,axis = 0)/total
+        return var if name == 'var' else np.sqrt(var)
+    elif name == 'median':
+        return _segment_percentile(values,starts,counts,50.0)
+    elif isinstance(name,str) and name.startswith('p'):
+        try:
+            q = float(name[1:])
+        except ValueError:
+            raise ValueError('cannot interpret statistic: {}'.format(name))
+        
+        return _segment_percentile(values,starts,counts,q)
+    else:
+        raise ValueError('cannot interpret statistic: {}'.format(name))
+
 class SurfaceFile(FluentFile):
 
     """
@@ -396,6 +797,68 @@ class SurfaceFile(FluentFile):
             raise TypeError('Index error likely caused because the dataframe \
                 was not read correctly: \n {} \n {} '.format(self.df,str(ie)))
 
+    def iter_surfaces(self,chunksize = 100000,
+                           columns = None,
+                           dtype = float,
+                           **kwargs):
+        """
+        stream the surfaces in the file one at a time without reading the entire
+        table into memory. The file is read in chunks of chunksize rows and a new
+        surface is started each time the cellnumber restarts at 1, so at most a 
+        single surface (and a single chunk) is held in memory at a time
+
+        Parameters
+        ----------
+        chunksize : int
+                the number of rows read from the file at a time
+        columns : list
+                optional subset of the (field variable) columns to read, the cellnumber
+                is always read as the index
+        dtype : type
+                the data type of the columns
+        **kwargs : dict
+                additional keyword arguments for pandas pd.read_csv() function
+
+        Yields
+        ------
+        df : pd.DataFrame 
+                the values of the variables at each surface, the same as the 
+                entries of get_surface_list()
+        """
+        #the names in the header are padded with spaces
+        header = pd.read_csv(self.fname,sep = ',',nrows = 0).columns
+        names = {c.strip():c for c in header}
+        index_name = header[0]
+        if columns is None:
+            usecols = list(header)
+        else:
+            try:
+                usecols = [index_name] + [names[c] for c in columns if names[c] != index_name]
+            except KeyError as ke:
+                raise KeyError('column: {} not found in file: {}'.format(str(ke),self.fname))
+        
+        reader = pd.read_csv(self.fname,sep = ',',header = 0,index_col = 0,
+                             usecols = usecols,chunksize = chunksize,
+                             dtype = {c:dtype for c in usecols if c != index_name},
+                             **kwargs)
+
+        pieces = []
+        for chunk in reader:
+            chunk.columns = [c.strip() for c in chunk.columns]
+            chunk.index.name = chunk.index.name.strip()
+            starts = np.flatnonzero(chunk.index.to_numpy() == 1)
+            bounds = [0] + list(starts) + [chunk.shape[0]]
+            for i in range(len(bounds)-1):
+                if i > 0 and pieces:
+                    yield pd.concat(pieces,axis = 0) if len(pieces) > 1 else pieces[0]
+                    pieces = []
+                
+                if bounds[i+1] > bounds[i]:
+                    pieces.append(chunk.iloc[bounds[i]:bounds[i+1]])
+        
+        if pieces:
+            yield pd.concat(pieces,axis = 0) if len(pieces) > 1 else pieces[0]
+
     def _parse_from_table_input(array: Union[pd.DataFrame,np.ndarray],
                                 R: Union[np.ndarray,float]) -> pd.DataFrame:
 
@@ -755,17 +1218,119 @@ class SphereSliceFile(SurfaceFile):
     def readdf(self) -> pd.DataFrame:
         return super().readdf()
 
+    COORDINATE_COLS = ['x-coordinate','y-coordinate','z-coordinate']
+
+    def _coordinate_columns(self,columns: list,
+                                 dimension: int) -> list:
+        """
+        the coordinate columns of the data used to locate the center of the spheres
+        """
+        if dimension == 3:
+            return self.COORDINATE_COLS
+        elif dimension == 2:
+            for pair in itertools.combinations(self.COORDINATE_COLS,2):
+                if all(c in columns for c in pair):
+                    return list(pair)
+            
+            raise KeyError('no pair of coordinate columns found in the columns: {}'.format(','.join(columns)))
+        else:
+            raise ValueError('dimension must be 2 or 3, not: {}'.format(dimension))
+
+    def get_sphere_surface_statistics(self,
+                                      statistics: list,
+                                      dimension = 3,
+                                      stream = False,
+                                      chunksize = 100000,
+                                      weights = None) -> dict:
+        """
+        Parameters
+        ----------
+        statistics : list
+                the statistics to compute, any of the statistics accepted by
+                get_sphere_surface_data()
+        dimension : int
+                keyword argument showing the dimension of the data
+        stream : bool
+                compute the statistics on the surfaces streamed from iter_surfaces()
+                without reading the entire table into memory
+        chunksize : int
+                the number of rows read at a time if streaming
+        weights : str
+                optional name of a column (i.e. cell area or volume) to weight 
+                the "mean","sum","var" and "std" statistics by, this column is not
+                reported with the field variables
+        
+        Returns
+        -------
+        data : dict
+                the DataFrame of each statistic keyed by the statistic, see
+                get_sphere_surface_data()
+        
+        all of the statistics are computed for all of the spheres and variables at once
+        from the offsets at which the cellnumber restarts, and the data is only 
+        extracted from the table once for all of the statistics
+        """
+        #the weights are not a field variable of the spheres
+        EXCLUDE_COLS = self.COORDINATE_COLS + ['cellnumber'] + ([] if weights is None else [weights])
+        if stream:
+            blocks = ((df,np.array([0])) for df in self.iter_surfaces(chunksize = chunksize))
+        else:
+            if self.df is None:
+                self.readdf()
+            
+            blocks = [(self.df,np.flatnonzero(self.df.index == 1))]
+        
+        data = {statistic:[] for statistic in statistics}
+        columns = None
+        for df,starts in blocks:
+            if starts.shape[0] == 0:
+                raise TypeError('no surfaces found, likely caused because the dataframe \
+                    was not read correctly: \n {}'.format(df))
+            
+            columns = [column for column in df.columns if column != weights]
+            field_variables = [column for column in columns if 
+                               column not in EXCLUDE_COLS]
+            
+            center = _segment_statistic(df[self._coordinate_columns(columns,dimension)].to_numpy(dtype = float),
+                                        starts,'mean')
+            values = df[field_variables].to_numpy(dtype = float)
+            w = None if weights is None else df[weights].to_numpy(dtype = float)
+            for statistic in statistics:
+                array = np.zeros([starts.shape[0],len(columns)])
+                array[:,0:dimension] = center
+                array[:,dimension:dimension + len(field_variables)] = _segment_statistic(values,starts,statistic,
+                                                                                         weights = w)
+                data[statistic].append(array)
+        
+        return {statistic:pd.DataFrame(np.concatenate(arrays,axis = 0),columns = columns) 
+                for statistic,arrays in data.items()}
+
     def get_sphere_surface_data(self,
-                                statistic: callable,
-                                dimension = 3) -> pd.DataFrame:
+                                statistic: Union[str,callable],
+                                dimension = 3,
+                                stream = False,
+                                chunksize = 100000,
+                                weights = None) -> pd.DataFrame:
         """
         Parameters
         ----------
-        statistic : callable
+        statistic : callable | str
                 i.e. np.mean,np.max, ect... MUST have the signature 
                 >> statistic(array,axis = 0)
+                or one of "mean","sum","min","max","std","var","median","count" or
+                "p<q>" for the q-th percentile (i.e. "p95"). These (and the
+                corresponding numpy functions) are computed for all spheres at once
         dimension : int
                 keyword argument showing the dimension of the data
+        stream : bool
+                compute the statistic on the surfaces streamed from iter_surfaces()
+                without reading the entire table into memory
+        chunksize : int
+                the number of rows read at a time if streaming
+        weights : str
+                optional name of a column (i.e. cell area or volume) to weight 
+                the "mean","sum","var" and "std" statistics by, this column is not
+                reported with the field variables
         
         Returns
         -------
@@ -778,28 +1343,8 @@ class SphereSliceFile(SurfaceFile):
         row the result of that statistic applied to each variable in the dataframe
         the center of the sphere is taken as the mean
         """
-        
-        EXCLUDE_COLS = ['x-coordinate','y-coordinate','z-coordinate','cellnumber']
-        sl = self.get_surface_list()
-        data = np.zeros([len(sl),sl[0].shape[1]])
-        field_variables = [column for column in sl[0].columns if 
-                           column not in EXCLUDE_COLS]
-        
-        for i,df in enumerate(sl):
-            if dimension == 3:
-                data[i,0:dimension] = np.mean(df[['x-coordinate','y-coordinate','z-coordinate']],axis = 0)
-            elif dimension == 2:
-                try:
-                    data[i,0:dimension] = np.mean(df[['x-coordinate','y-coordinate']],axis = 0)
-                except KeyError:
-                    data[i,0:dimension] = np.mean(df[['x-coordinate','z-coordinate']],axis = 0)
-                except KeyError:
-                    data[i,0:dimension] = np.mean(df[['y-coordinate','z-coordinate']],axis = 0)
-
-            for k,var in enumerate(field_variables): 
-                data[i,dimension + k] = statistic(df[var],axis = 0)
-        
-        return pd.DataFrame(data,columns = sl[0].columns)
+        return self.get_sphere_surface_statistics([statistic],dimension = dimension,stream = stream,
+                                                  chunksize = chunksize,weights = weights)[statistic]
 
     @classmethod
     def write_fluent_input_from_table(cls, df: Union[pd.DataFrame,np.ndarray],
@@ -942,19 +1487,62 @@ class SurfacePointFile(SurfaceFile):
         return super().write_fluent_input_from_table(df,None,file_name,export_variables,
         prefix = prefix,seperator=  seperator,create_surfaces = create_surfaces)
     
-    def get_point_surface_data(self) -> pd.DataFrame:
+    def get_point_surface_data(self,stream = False,
+                                    chunksize = 100000) -> pd.DataFrame:
         """
         convinience function for turning the list of surfaces into an
-        array
+        array. If stream, the surfaces are streamed from iter_surfaces()
+        without reading the entire table into memory
         """
 
-        sl = self.get_surface_list()
-        data = np.zeros([len(sl),sl[0].shape[1]])
-        for i,df in enumerate(sl):
-            data[i,:] = np.squeeze(df.to_numpy())
+        sl = self.iter_surfaces(chunksize = chunksize) if stream else self.get_surface_list()
+        data = []
+        columns = None
+        for df in sl:
+            columns = df.columns if columns is None else columns
+            data.append(np.squeeze(df.to_numpy()))
         
-        return pd.DataFrame(data,columns = sl[0].columns)
+        return pd.DataFrame(np.array(data),columns = columns)
+    
+_WHITESPACE = b' \t\r\n'
+
+def _trim_block(buffer,
+                start: int,
+                end: int,
+                closing = b'') -> int:
+    """
+    the end of the block buffer[start:end] excluding trailing white space
+    and an (optional) closing character
+    """
+    while end > start and buffer[end-1:end] in _WHITESPACE:
+        end -= 1
+    
+    if closing and buffer[end-len(closing):end] == closing:
+        end -= len(closing)
+        while end > start and buffer[end-1:end] in _WHITESPACE:
+            end -= 1
+    
+    return end
+
+def _read_blocks(buffer,
+                 ranges: list,
+                 rows: list,
+                 sep: str) -> np.ndarray:
+    """
+    parse the numeric blocks of the buffer given by the (start,end) ranges 
+    into a single array with a single call to pd.read_csv(). If the number of rows
+    parsed does not match the expected rows, each block is parsed seperately
+    """
+    blocks = [buffer[start:end] for start,end in ranges if end > start]
+    data = pd.read_csv(BytesIO(b'\n'.join(blocks)),sep = sep,
+                       dtype = float,header = None).to_numpy()
+    
+    if data.shape[0] == sum(rows):
+        return data
     
+    return np.concatenate([pd.read_csv(BytesIO(block),sep = sep,dtype = float,header = None).to_numpy()
+                           for block in blocks],axis = 0)
+
 class XYDataFile(FluentFile):
     """
     class for representing the XYDataFile - data files that are exported from
@@ -988,11 +1576,25 @@ class XYDataFile(FluentFile):
     COLUMN_DELIM = '\t'
     SERIES_SPACING = 2
     DATA_END_LINE = ')'
+    _DELIM_EXPR = re.compile(re.escape(DATA_DELIM.encode()) + b'[^\n]*')
 
     def __init__(self, fname: str):
 
         super().__init__(fname)
         self.__data_names = {}
+        self.__offsets = {}
+        self.column_name = None
+    
+    @property
+    def offsets(self):
+        """
+        the byte offsets (start,end) of the data of each series in the file
+        """
+        return self.__offsets
+    
+    @offsets.setter
+    def offsets(self,o):
+        self.__offsets = o
 
     @property
     def data_names(self):
@@ -1002,53 +1604,51 @@ class XYDataFile(FluentFile):
     def data_names(self,dn):
         self.__data_names = dn
 
-    def _parse_text_block(self,txt_block: str) -> np.ndarray:
-        
-        return pd.read_csv(StringIO(txt_block),
-                          sep = self.COLUMN_DELIM,
-                          dtype= float, header = None).to_numpy()
-            
-    def _deliminate_data_file(self) -> pd.DataFrame:
+    def _index_file(self,buffer) -> list:
         """
-        main parsing logic for reading the data file
-        here. Iterates through the whole data file, and partitions
-        the various components based on pre-defined logic
+        a single pass over the (memory mapped) file recording the byte offsets of the data
+        of each series, and the number of rows in each series. This populates
+        data_names and offsets without parsing any of the data
+        
+        Returns
+        -------
+        rows : list
+                the number of rows of each series
         """
-        self.file.seek(0)
         len_data_delim = len(self.DATA_DELIM)+2
-        txt = ''
-        data = []
-        c = 0
-        name = None
-
-        column_name = next(self.file)[8:-3].strip()
-        next(self.file)
-        next(self.file)
+        title = bytes(buffer[0:buffer.find(b'\n')+1]).decode().replace('\r\n','\n')
+        self.column_name = title[8:-3].strip()
 
-        for line in self.file:
-            if self.DATA_DELIM in line:
-                if name is not None:
-                    
-                    dat = self._parse_text_block(txt)
-                    data.append(dat)
-                    self.data_names[name] = [c,c+dat.shape[0]]
-                    c += dat.shape[0]
-                    txt = ''
-            
-                name = line[len_data_delim:-3]
-                
-            else:
-                if line.strip() != self.DATA_END_LINE and line.strip() != '':
-                    txt += line
+        labels = list(self._DELIM_EXPR.finditer(buffer))
+        self.offsets = {}
+        self.data_names = {}
+        rows = []
+        c = 0
+        for i,label in enumerate(labels):
+            name = label.group(0).decode().rstrip('\r')[len_data_delim:-2]
+            start = label.end() + 1
+            end = labels[i+1].start() if i + 1 < len(labels) else len(buffer)
+            end = _trim_block(buffer,start,end,closing = self.DATA_END_LINE.encode())
             
-        dat = self._parse_text_block(txt)
-        self.data_names[name] = [c,-1]
-        data.append(dat)
+            n = buffer[start:end].count(b'\n') + 1 if end > start else 0
+            self.offsets[name] = (start,end)
+            self.data_names[name] = [c,c+n] if i + 1 < len(labels) else [c,-1]
+            rows.append(n)
+            c += n
+        
+        return rows
 
-        data = np.concatenate(data,axis = 0)
+    def _parse_indexed_file(self) -> pd.DataFrame:
+        """
+        single pass parser, the file is indexed by _index_file() and then all of
+        the data blocks are parsed with a single vectorized call
+        """
+        with _mapped_file(self.fname) as buffer:
+            rows = self._index_file(buffer)
+            data = _read_blocks(buffer,list(self.offsets.values()),rows,self.COLUMN_DELIM)
+        
         self.df = pd.DataFrame(data[:,1:],index = data[:,0],
-                              columns = [column_name])
-
+                               columns = [self.column_name])
         return self.df
 
     def readdf(self) -> pd.DataFrame:
@@ -1058,10 +1658,45 @@ class XYDataFile(FluentFile):
         df : pandas.DataFrame
                 returns all of the XY data concatenated as a single DataFrame
         """
-        return self._deliminate_data_file()
+        if self._read_cache():
+            return self.df
+        
+        self._parse_indexed_file()
+        self._write_cache()
+        return self.df
+
+    def _read_series(self,key) -> pd.DataFrame:
+        """
+        read a single series from the file using the offset index, without
+        reading the rest of the data
+        """
+        with _mapped_file(self.fname) as buffer:
+            if not self.offsets:
+                self._index_file(buffer)
+            
+            try:
+                start,end = self.offsets[key]
+            except KeyError:
+                raise KeyError('no domain entitled: {} in file'.format(key))
+            
+            data = pd.read_csv(BytesIO(buffer[start:end]),sep = self.COLUMN_DELIM,
+                               dtype = float,header = None).to_numpy()
+        
+        return pd.DataFrame(data[:,1:],index = data[:,0],
+                            columns = [self.column_name])
+    
+    def _cache_metadata(self) -> dict:
+        return {'data_names':self.data_names}
+    
+    def _restore_cache_metadata(self,metadata: dict) -> None:
+        self.data_names = metadata['data_names']
     
     def __getitem__(self,key):
         
+        #if the file has not been read, only read the requested series
+        if self.df is None:
+            return self._read_series(key)
+        
         try:
             if self.data_names[key][1] == -1:
                 return self.df.iloc[self.data_names[key][0]:]
@@ -1071,6 +1706,10 @@ class XYDataFile(FluentFile):
             raise KeyError('no domain entitled: {} in file'.format(key))
     
     def keys(self):
+        if not self.data_names:
+            with _mapped_file(self.fname) as buffer:
+                self._index_file(buffer)
+        
         return self.data_names.keys()
   
 class PostDataFile(FluentFile):
@@ -1108,11 +1747,26 @@ class PostDataFile(FluentFile):
     DATA_DELIM = '[Name]'
     DATA_START = '[Data]'
     COLUMN_DELIM = ','
+    _DELIM_EXPR = re.compile(re.escape(DATA_DELIM.encode()) + b'[^\n]*\n([^\n]*)')
+    _START_EXPR = re.compile(re.escape(DATA_START.encode()) + b'[^\n]*\n([^\n]*)')
 
     def __init__(self,fname):
 
         super().__init__(fname)
         self.__data_names = {}
+        self.__offsets = {}
+        self.columns = None
+    
+    @property
+    def offsets(self):
+        """
+        the byte offsets (start,end) of the data on each surface in the file
+        """
+        return self.__offsets
+    
+    @offsets.setter
+    def offsets(self,o):
+        self.__offsets = o
     
     @property
     def data_names(self):
@@ -1122,56 +1776,75 @@ class PostDataFile(FluentFile):
     def data_names(self,dn):
         self.__data_names = dn
     
-    def _parse_consistent_text_block(self,txt_block):
+    def _index_file(self,buffer) -> list:
+        """
+        a single pass over the (memory mapped) file recording the byte offsets of the data
+        on each surface, and the number of rows on each surface. This populates
+        data_names, offsets and columns without parsing any of the data
         
-        start = txt_block.find(self.DATA_START)+len(self.DATA_START) + 1
-        txt_block = txt_block[start:]
+        Returns
+        -------
+        rows : list
+                the number of rows on each surface
+        """
+        names = list(self._DELIM_EXPR.finditer(buffer))
+        self.offsets = {}
+        self.data_names = {}
+        rows = []
+        c = 0
+        for i,name_match in enumerate(names):
+            name = name_match.group(1).decode().strip()
+            end = names[i+1].start() if i + 1 < len(names) else len(buffer)
+            header = self._START_EXPR.search(buffer,name_match.end(),end)
+            if header is None:
+                raise ValueError('no data found on surface: {} in file: {}'.format(name,self.fname))
+            
+            #the columns are assumed consistent across surfaces
+            self.columns = [col.strip() for col in header.group(1).decode().split(self.COLUMN_DELIM)]
+            start = header.end() + 1
+            end = _trim_block(buffer,start,end)
+            
+            n = buffer[start:end].count(b'\n') + 1 if end > start else 0
+            self.offsets[name] = (start,end)
+            self.data_names[name] = [c,c+n] if i + 1 < len(names) else [c,-1]
+            rows.append(n)
+            c += n
         
-        columns_end = txt_block.find(self.LINE_BREAK)
-        columns = [c.strip() for c in txt_block[0:columns_end].split(self.COLUMN_DELIM)]
-        txt_block = txt_block[columns_end+1:].strip() + self.LINE_BREAK
+        return rows
 
-        return columns, pd.read_csv(StringIO(txt_block), 
-                                     sep = self.COLUMN_DELIM,
-                                     dtype = float,header = None).to_numpy()
+    def _parse_indexed_file(self) -> pd.DataFrame:
+        """
+        single pass parser, the file is indexed by _index_file() and then all of
+        the data blocks are parsed with a single vectorized call
+        """
+        with _mapped_file(self.fname) as buffer:
+            rows = self._index_file(buffer)
+            data = _read_blocks(buffer,list(self.offsets.values()),rows,self.COLUMN_DELIM)
         
-    def _deliminate_consistent_data_file(self):
+        self.df = pd.DataFrame(data,columns = self.columns)
+        return self.df
 
+    def _read_series(self,key) -> pd.DataFrame:
         """
-        main parsing logic here. Will scan the whole file looking
-        for pre-defined breaks in the file, and mark the lines 
-        at which those breaks occur. Records all of the deliminitated
-        data into a single dataframe, that can be seperated based upon
-        the retained delimination markings.
+        read the data on a single surface from the file using the offset index, without
+        reading the rest of the data
         """
-        self.file.seek(0)
-        name = None
-        txt = ''
-        data = []
-        c = 0
-        for line in self.file:
-            if self.DATA_DELIM in line:
-                if name is not None:
-                    _,dat = self._parse_consistent_text_block(txt)
-                    data.append(dat)
-                    self.data_names[name] = [c,c+dat.shape[0]]
-                    c += dat.shape[0]
-                    txt = ''
-                
-                _line = next(self.file)
-                txt = _line
-                name = _line.strip()
-                
-            else:
-                txt += line
+        with _mapped_file(self.fname) as buffer:
+            if not self.offsets:
+                self._index_file(buffer)
+            
+            try:
+                start,end = self.offsets[key]
+            except KeyError:
+                raise KeyError('no domain entitled: {} in file'.format(key))
+            
+            data = pd.read_csv(BytesIO(buffer[start:end]),sep = self.COLUMN_DELIM,
+                               dtype = float,header = None).to_numpy()
         
-        columns,dat = self._parse_consistent_text_block(txt)
-        self.data_names[name] = [c,-1]
-        data.append(dat)
+        first = self.data_names[key][0]
+        return pd.DataFrame(data,columns = self.columns,
+                            index = pd.RangeIndex(first,first + data.shape[0]))
 
-        data = np.concatenate(data,axis = 0)
-        self.df = pd.DataFrame(data,columns = columns)
-    
     def readdf(self) -> pd.DataFrame:
         """
         Returns
@@ -1181,11 +1854,25 @@ class PostDataFile(FluentFile):
                 concatenate as a DataFrame. To seperate data by surface name
                 access class using keys.
         """
-        self._deliminate_consistent_data_file()
+        if self._read_cache():
+            return self.df
+        
+        self._parse_indexed_file()
+        self._write_cache()
         return self.df
     
+    def _cache_metadata(self) -> dict:
+        return {'data_names':self.data_names}
+    
+    def _restore_cache_metadata(self,metadata: dict) -> None:
+        self.data_names = metadata['data_names']
+    
     def __getitem__(self,key):
         
+        #if the file has not been read, only read the requested surface
+        if self.df is None:
+            return self._read_series(key)
+        
         try:
             if self.data_names[key][1] == -1:
                 return self.df.iloc[self.data_names[key][0]:]
@@ -1195,6 +1882,10 @@ class PostDataFile(FluentFile):
             raise KeyError('no domain entitled: {} in file'.format(key))
     
     def keys(self):
+        if not self.data_names:
+            with _mapped_file(self.fname) as buffer:
+                self._index_file(buffer)
+        
         return self.data_names.keys()
 
 class ReportFileOut(FluentFile):
@@ -1220,19 +1911,34 @@ class ReportFileOut(FluentFile):
 
         print(df)
 
+    the report file of a running job may be followed, parsing only the rows
+    appended since the last poll
+
+    .. code-block:: python
+
+        rfile = ReportFileOut(my_out_file)
+        for new_rows in rfile.follow(interval = 5.0,timeout = 600):
+            print(rfile.df.tail())
+
     """
     _STR_REMOVE = [')','"','\n','(']
     _HEADER_LINE = 2
     _DATA_START = 3
+    TAIL_BLOCK = 4096
 
     def __init__(self,fname):
 
         super().__init__(fname)
+        self.__headers = None
+        self.__chunks = []
 
     #get headers in a custom fashion because .out files are annoying
     def _get_headers(self):
         iterdat = islice(self.file,self._HEADER_LINE,self._DATA_START)
-        listHeaders = list(next(iterdat).split("\" \""))
+        return self._parse_header_line(next(iterdat))
+    
+    def _parse_header_line(self,line: str) -> list:
+        listHeaders = list(line.split("\" \""))
         for i,lh in enumerate(listHeaders):
             for char in self._STR_REMOVE:
                 listHeaders[i] = listHeaders[i].replace(char,'')
@@ -1263,7 +1969,10 @@ class ReportFileOut(FluentFile):
         else:
             skiprows = kwargs.pop('skiprows')
             
-        
+        #only the last row is needed, which is read from the tail of the file
+        if isinstance(skiprows,str) and skiprows.lower() == 'converged':
+            return self.read_last_row(**kwargs)
+
         #parse skip rows and such key words
         skiprows = self._parse_skip_rows(skiprows)
         #reset file
@@ -1286,19 +1995,235 @@ class ReportFileOut(FluentFile):
                 headers named appropriately. The index is the iteration number supplied
                 in the file
         """
+        if self._read_cache(**kwargs):
+            return self.df
 
         self.df = self._get_data_frame(**kwargs)
+        self._write_cache(**kwargs)
         return self.df
 
-class SolutionFile(FluentFile):
-    """
-    Class for representing the "solution" files in Fleunt i.e. transcripts
-    usuaully output with a .trn extension. Useful for examining convergence of a solution
+    def read_last_row(self,**kwargs) -> pd.DataFrame:
+        """
+        read only the last complete row (i.e. the converged result) of the file. The header
+        lines are read from the start of the file and the last row from a block at the end of
+        the file, so that the time taken does not depend upon the number of iterations in the file.
+        The block is grown until it contains a complete row. A partially written trailing row
+        is ignored unless it has a value for each of the headers
 
-    Parameters
-    ------------
-    fname : str
-            the file name of the solution file
+        Parameters
+        ----------
+        **kwargs : dict
+                key word arguments for pandas read_csv() function
+
+        Returns
+        -------
+        df : pandas.DataFrame 
+                containing the last row of the report file, with the iteration number as the
+                index. Empty if the file contains no rows
+        """
+        line_break = self.LINE_BREAK.encode()
+        with open(self.fname,'rb') as file:
+            header_lines = [file.readline() for _ in range(self._DATA_START)]
+            data_start = file.tell()
+            headers = self._parse_header_line(header_lines[self._HEADER_LINE].decode(errors = 'replace'))
+
+            size = file.seek(0,os.SEEK_END)
+            block = self.TAIL_BLOCK
+            while True:
+                start = max(data_start,size - block)
+                file.seek(start)
+                data = file.read(size - start)
+                
+                #the first line of the block may be cut unless the block starts the data
+                lines = data.split(line_break)
+                if start > data_start:
+                    lines = lines[1:]
+                
+                trailing = lines.pop() if lines else b''
+                if trailing.strip() and len(trailing.split()) == len(headers):
+                    row = trailing
+                    break
+
+                lines = [line for line in lines if line.strip()]
+                if lines:
+                    row = lines[-1]
+                    break
+                
+                if start == data_start:
+                    row = b''
+                    break
+
+                block *= 2
+        
+        return pd.read_csv(StringIO(row.decode(errors = 'replace').replace('\r','')),header = None,names = headers,
+                           index_col = 0,sep = ' ',**kwargs)
+
+    def _reset_follow(self):
+        super()._reset_follow()
+        self.__headers = None
+        self.__chunks = []
+
+    def _concatenate_refreshed(self) -> pd.DataFrame:
+        """
+        concatenate the rows parsed by refresh() into df, once, when df is accessed
+        """
+        df = self.__chunks[0] if len(self.__chunks) == 1 else pd.concat(self.__chunks,axis = 0)
+        self.__chunks = [df]
+        return df
+
+    def refresh(self,**kwargs) -> pd.DataFrame:
+        """
+        parse only the rows appended to the file since the last call to refresh(),
+        and append these to df. The first call parses the entire file and replaces df. 
+        Partially written trailing rows are left until they are complete. The parsed 
+        rows are only concatenated into df when df is next accessed, so polling the 
+        file costs only the rows appended
+
+        Parameters
+        ----------
+        **kwargs : dict
+                key word arguments for pandas read_csv() function
+
+        Returns
+        -------
+        new : pandas.DataFrame 
+                the newly appended rows, or None if no new rows were found
+        """
+        text,nbytes = self._read_appended_text()
+        replace = self.__headers is None
+        if replace:
+            lines = text.split(self.LINE_BREAK)
+            #wait until the header line has been completely written
+            if len(lines) <= self._DATA_START:
+                return None
+            
+            self.__headers = self._parse_header_line(lines[self._HEADER_LINE])
+            text = self.LINE_BREAK.join(lines[self._DATA_START:])
+        
+        self.offset += nbytes
+        if not text.strip():
+            return None
+        
+        new = pd.read_csv(StringIO(text),header = None,names = self.__headers,
+                          index_col = 0,sep = ' ',**kwargs)
+        
+        if replace:
+            self.__chunks = []
+        
+        self.__chunks.append(new)
+        self._defer_df(self._concatenate_refreshed)
+        return new
+
+class RunStatus:
+
+    """
+    Compact record of the state of a fluent run, built from a single streaming pass over
+    its transcript by SolutionFile.run_status()
+
+    Parameters
+    ----------
+    requested_iterations : int
+            the total number of iterations requested by the iterate commands in the transcript
+    executed_iterations : int
+            the number of distinct iterations that were executed (re-printed iterations are not counted)
+    last_iteration : int
+            the last iteration number found
+    remaining_iterations : int
+            the number of iterations remaining reported in the last row of the iteration table, 
+            None if no rows were found
+    converged : bool
+            the convergence criteria were met
+    diverged : bool
+            divergence was detected by the solver
+    floating_point_error : bool
+            a floating point error/exception was reported
+    wall_clock_per_iteration : float
+            the average wall-clock time per iteration reported by the performance timer, None if not reported
+    data_written : bool
+            a data file was written
+    """
+
+    FIELDS = ['requested_iterations',
+              'executed_iterations',
+              'last_iteration',
+              'remaining_iterations',
+              'converged',
+              'diverged',
+              'floating_point_error',
+              'wall_clock_per_iteration',
+              'data_written']
+
+    def __init__(self,requested_iterations = 0,
+                      executed_iterations = 0,
+                      last_iteration = None,
+                      remaining_iterations = None,
+                      converged = False,
+                      diverged = False,
+                      floating_point_error = False,
+                      wall_clock_per_iteration = None,
+                      data_written = False):
+
+        self.requested_iterations = requested_iterations
+        self.executed_iterations = executed_iterations
+        self.last_iteration = last_iteration
+        self.remaining_iterations = remaining_iterations
+        self.converged = converged
+        self.diverged = diverged
+        self.floating_point_error = floating_point_error
+        self.wall_clock_per_iteration = wall_clock_per_iteration
+        self.data_written = data_written
+    
+    def __repr__(self):
+        return 'RunStatus({})'.format(', '.join('{} = {}'.format(f,getattr(self,f)) for f in self.FIELDS))
+
+    def __eq__(self,other):
+        return isinstance(other,RunStatus) and self.to_dict() == other.to_dict()
+
+    @property
+    def termination_reason(self):
+        """
+        the reason the solver stopped: "diverged", "floating point error", "converged"
+        or "iterations" (all requested iterations were executed), None if the run has not
+        terminated (yet). If the iterate commands were not echoed to the transcript (i.e. runs
+        from workbench), all of the iterations were executed once none are remaining
+        """
+        if self.diverged:
+            return 'diverged'
+        elif self.floating_point_error:
+            return 'floating point error'
+        elif self.converged:
+            return 'converged'
+        elif self.requested_iterations > 0 and self.executed_iterations >= self.requested_iterations:
+            return 'iterations'
+        elif self.requested_iterations == 0 and self.remaining_iterations == 0:
+            return 'iterations'
+        else:
+            return None
+
+    @property
+    def completed(self):
+        """
+        the solution either converged or executed all of the requested iterations, without 
+        diverging or floating point errors
+        """
+        return self.termination_reason in ['converged','iterations']
+
+    def to_dict(self) -> dict:
+        return {f:getattr(self,f) for f in self.FIELDS}
+    
+    @classmethod
+    def from_dict(cls,d: dict):
+        return cls(**{f:d[f] for f in cls.FIELDS if f in d})
+
+class SolutionFile(FluentFile):
+    """
+    Class for representing the "solution" files in Fleunt i.e. transcripts
+    usuaully output with a .trn extension. Useful for examining convergence of a solution
+
+    Parameters
+    ------------
+    fname : str
+            the file name of the solution file
 
     Examples
     ---------
@@ -1311,11 +2236,29 @@ class SolutionFile(FluentFile):
         
         print(df)
 
-    BUGS 11.16.2021 - STATUS Property is not being determined properly
+    the parsing of the iteration rows may be done with either the original
+    line by line "python" parser, or the "vectorized" parser which locates all
+    of the iteration rows with a single compiled regular expression and reads
+    them in a single call to pandas.read_csv(). Both produce the same DataFrame,
+    the vectorized parser is much faster on large transcripts
+
+    .. code-block:: python
+
+        with SolutionFile(my_file,parser = 'vectorized') as sfile:
+            df = sfile.readdf()
+
     The STATUS property of the SolutionFile indicates if the solution has 
-    completed or not, determined by the logic in _get_status()
+    completed or not, determined from the run status record (see run_status())
     False - solution is not finished
     True - solution is finished
+
+    .. code-block:: python
+
+        status = SolutionFile(my_file).run_status()
+        print(status.termination_reason,status.executed_iterations)
+    
+    The run status is found in a single pass over the transcript and cached in a
+    file beside it, so that later checks only read the text appended since the last check
     """
 
     _PARAM_PHRASE = r'WB->Fluent:Parameter name:'
@@ -1329,11 +2272,43 @@ class SolutionFile(FluentFile):
     
     _SKIP_CHARS = set(['\n','!'])
     _END_CHARS = set(['>'])
-    
-    def __init__(self,fname):
+    _SKIP_PHRASES = ['Solution']
+
+    _CONVERGED_PHRASE = 'solution is converged'
+    _DIVERGENCE_PHRASE = 'divergence detected'
+    _FLOATING_POINT_PHRASES = ['floating point exception','floating point error']
+    _WALL_CLOCK_PHRASE = 'Average wall-clock time per iteration:'
+    _DATA_WRITE_PHRASE = 'Writing "'
+    _DATA_EXT = '.dat'
+    STATUS_EXT = '.status'
+
+    PARSERS = ['python','vectorized']
+
+    def __init__(self,fname,
+                      parser = 'python'):
 
         super().__init__(fname)
         self.__STATUS = None
+        self.__status_state = None
+        self.parser = parser
+        self.__columns = None
+        self.__finished = False
+        self.__rows = _RowBuffer()
+        self.__open = _RowBuffer()
+        self.__counts = {}
+        self.__fresh = []
+        self._reset_open_block()
+
+    @property
+    def parser(self):
+        return self.__parser
+
+    @parser.setter
+    def parser(self,p):
+        if p not in self.PARSERS:
+            raise ValueError('parser must be one of: {}, not: {}'.format(','.join(self.PARSERS),p))
+
+        self.__parser = p
     
     @property
     def STATUS(self):
@@ -1370,7 +2345,7 @@ class SolutionFile(FluentFile):
                 line = solution_text[e2.start():e1.start()+1].strip() +'\n'
                 try:
                     #check to see if we should consider this line
-                    if line[0] in self._SKIP_CHARS or 'Solution' in line:
+                    if line[0] in self._SKIP_CHARS or any(phrase in line for phrase in self._SKIP_PHRASES):
                         continue
                     #check to see if this line indicates an end to the data we are interested in
                     elif line[0] in self._END_CHARS:
@@ -1396,15 +2371,22 @@ class SolutionFile(FluentFile):
         
         return cleanedText
 
+    def _get_solution_text(self) -> str:
+        """
+        locate the text containing the residual information in the file. The file
+        is memory mapped and only the located text is decoded
+        """
+        return _read_text_between_phrases(self.fname,
+                                          [self._SOL_START_PHRASE ,self._SOL_END_PHRASE],
+                                          include_pairs = True)
+
     def _get_data(self):
         """
         iteratively retrieve data, examining all of the iteration
         blocks found in the file
         """
         columns = []
-        solution_text = _get_text_between_phrase_lines(self.file,
-                                                        [self._SOL_START_PHRASE ,self._SOL_END_PHRASE],
-                                                        include_pairs = True)
+        solution_text = self._get_solution_text()
 
         eol = itertools.tee(re.finditer('\n',solution_text))
         eol1 = peekable(eol[0])
@@ -1425,39 +2407,102 @@ class SolutionFile(FluentFile):
         
         return chunks,columns
 
-    def readdf(self,error_on_parser = False) -> pd.DataFrame:
+    @classmethod
+    def _row_expressions(cls) -> tuple:
         """
-        main reading of data frame occurs here which goes through four main phases: 
-        1. the text containing the residual information is located
-        2. the solution text is parsed according to the annoying format presented\
-            into digestable form - essentially space delimited rows
-        3. the text is converted to a numpy array - allowing for empty end rows
-        4. the numpy data frame is converted into a pandas dataframe using the columns\
-            gleaned from the np array converter
-        
+        compiled regular expressions for the vectorized parser. The first
+        matches the lines that end a block of iterations (any line starting with ">"), 
+        the second matches an iteration row, capturing the row up to (but not including)
+        the time/iter column. Lines containing any of the _SKIP_PHRASES are ignored by both,
+        mirroring the logic in _parse_solution_text()
+        """
+        skip = '|'.join([re.escape(phrase) for phrase in cls._SKIP_PHRASES])
+        end_chars = ''.join([re.escape(char) for char in cls._END_CHARS])
+        block_end = re.compile(r'^[^\S\n]*[{}](?![^\n]*(?:{}))[^\n]*$'.format(end_chars,skip),
+                               re.MULTILINE)
+        row = re.compile(r'^[^\S\n]*(\d(?![^\n]*(?:{}))[^:\n]*)[^\S\n](?:[^\s:]*:[^\n]*|[^\s:]+[^\S\n]*)$'.format(skip),
+                         re.MULTILINE)
+        return block_end,row
+
+    def _get_data_vectorized(self):
+        """
+        vectorized counterpart to _get_data(). Instead of walking the solution text
+        line by line, the text is only trimmed to the complete lines following the 
+        iteration header (as is the case in _get_data()), and the rows are found
+        later on with a single compiled regular expression search
+
         Returns
         -------
-        df : pandas.DataFrame
-                returns the solution file information as a DataFrame. If information
-                is missing from any column, this is filled with nan.
-        """
+        body : str
+                the complete lines of the solution text following the header
+        columns : list
+                the columns found in the iteration header
+        """
+        solution_text = self._get_solution_text()
+        first = solution_text.find(self.LINE_BREAK)
+        if first == -1:
+            raise AttributeError('no columns found in file - ensure that the file with name: {} is a solution file'.format(self.fname))
+
+        columns = re.split('\s+',solution_text[0:first].strip())[0:-1]
+        last = solution_text.rfind(self.LINE_BREAK)
         
-        cleaned_chunks,columns = self._get_data()
-        data = []
-        for chunk in cleaned_chunks:
+        return solution_text[first:last],columns
+
+    def _read_rows(self,body: str,
+                        error_on_parser = False) -> np.ndarray:
+        """
+        parse the iteration rows in the body into a single array. All rows are handed 
+        to a single call of pd.read_csv(). If this fails, or the rows are ragged, 
+        the body is split into blocks of iterations and each block is parsed individually
+        so that malformed blocks are treated identically to the original line by line parser
+        """
+        block_end,row = self._row_expressions()
+        rows = row.findall(body)
+        if rows:
             try:
-                data.append(
-                    pd.read_csv(StringIO(chunk), sep = '\s+',
-                          dtype = float, header = None).to_numpy()
-                )
-            except (ValueError,pd.errors.EmptyDataError) as pd_error:
-                if error_on_parser:
-                    raise ValueError(str(pd_error))
-                else:
-                    warnings.warn(str(pd_error))
+                array = pd.read_csv(StringIO(self.LINE_BREAK.join(rows)), sep = '\s+',
+                                    dtype = float, header = None).to_numpy()
+                if not np.isnan(array).any():
+                    return array
+            except (ValueError,pd.errors.EmptyDataError):
+                pass
+        
+        chunks = []
+        for block in block_end.split(body):
+            rows = row.findall(block)
+            chunks.append(self.LINE_BREAK.join(rows) + self.LINE_BREAK if rows else '')
+
+        return self._concatenate_chunks(chunks,error_on_parser = error_on_parser)
+
+    def _concatenate_chunks(self,chunks: list,
+                                 error_on_parser = False) -> np.ndarray:
+        """
+        parse each block of cleaned text seperately and concatenate the results
+        """
+        data = [self._parse_chunk(chunk,error_on_parser = error_on_parser) for chunk in chunks]
+        return np.concatenate([array for array in data if array is not None],axis =0)
+
+    def _parse_chunk(self,chunk: str,
+                          error_on_parser = False) -> np.ndarray:
+        """
+        parse a single block of cleaned text, returning None if the block cannot be parsed
+        """
+        try:
+            return pd.read_csv(StringIO(chunk), sep = '\s+',
+                               dtype = float, header = None).to_numpy()
+        except (ValueError,pd.errors.EmptyDataError) as pd_error:
+            if error_on_parser:
+                raise ValueError(str(pd_error))
+            else:
+                warnings.warn(str(pd_error))
         
-        array = np.concatenate(data,axis =0)
+        return None
 
+    def _frame_from_array(self,array: np.ndarray,
+                               columns: list) -> pd.DataFrame:
+        """
+        convert the parsed array into a DataFrame indexed by iteration
+        """
         #the index will be the first column of the array
         index_dat = array[:,0].astype(int)
 
@@ -1468,148 +2513,417 @@ class SolutionFile(FluentFile):
         #conditions are applied, and then next assuming they do not exist and only returning the
         #data that excludes the convergence conditions
         try:
-            self.df = pd.DataFrame(array[:,1:],
+            df = pd.DataFrame(array[:,1:],
                                 index = pd.Series(index_dat,name = columns[0]),
                                 columns = columns[1:],dtype = float)
         except ValueError:
             len_diff = len(columns) - array.shape[1]
-            self.df = pd.DataFrame(array[:,1:],
+            df = pd.DataFrame(array[:,1:],
                                    index = pd.Series(index_dat, name =columns[0]),
                                    columns = columns[1:-len_diff],dtype = float)
 
         #it could be the case that there are duplicate iteration numbers - because ANSYS re-prints
         #the previous iteration values if something changes so we have to remove these values
-        self.df = self.df[~self.df.index.duplicated()]
+        return df[~df.index.duplicated()]
+
+    def readdf(self,error_on_parser = False,
+                    parser = None) -> pd.DataFrame:
+        """
+        main reading of data frame occurs here which goes through four main phases: 
+        1. the text containing the residual information is located
+        2. the solution text is parsed according to the annoying format presented\
+            into digestable form - essentially space delimited rows
+        3. the text is converted to a numpy array - allowing for empty end rows
+        4. the numpy data frame is converted into a pandas dataframe using the columns\
+            gleaned from the np array converter
         
-        return self.df
+        Parameters
+        ----------
+        error_on_parser : bool
+                raise an error if a block of iterations cannot be parsed, otherwise
+                the block is skipped with a warning
+        parser : str
+                optionally override the parser provided at instantiation, either
+                "python" or "vectorized"
 
-    def _get_status(self):
+        Returns
+        -------
+        df : pandas.DataFrame
+                returns the solution file information as a DataFrame. If information
+                is missing from any column, this is filled with nan.
         """
-        get the status of the solution file
-        False - solution is not finished
-        True - solution is finished
         
-        the strategy here is to find all instances of the phrase:
-        solve/iterate (or simply iterate) with an integer number after the phrase
-        and ensure that the sum of these integers equals the length of the dataframe read
+        parser = self.parser if parser is None else parser
+        if self._read_cache(error_on_parser = error_on_parser,parser = parser):
+            return self.df
+        
+        if parser == 'vectorized':
+            body,columns = self._get_data_vectorized()
+            array = self._read_rows(body,error_on_parser = error_on_parser)
+        elif parser == 'python':
+            cleaned_chunks,columns = self._get_data()
+            array = self._concatenate_chunks(cleaned_chunks,error_on_parser = error_on_parser)
+        else:
+            raise ValueError('parser must be one of: {}, not: {}'.format(','.join(self.PARSERS),parser))
 
-        BUGS 10.06.2021
+        self.df = self._frame_from_array(array,columns)
+        self._write_cache(error_on_parser = error_on_parser,parser = parser)
+        return self.df
+    
+    def _cache_metadata(self) -> dict:
+        return {} if self.__STATUS is None else {'STATUS':self.__STATUS}
+    
+    def _restore_cache_metadata(self,metadata: dict) -> None:
+        if 'STATUS' in metadata:
+            self.__STATUS = metadata['STATUS']
 
-        This is not reliably letting me know if the simulation is completed or not - there
-        is some flaw in the logic here.
+    def _find_solution_end(self,text: str) -> int:
         """
+        the position in the text at which the solution text ends, or -1 if the 
+        end phrase has not been written (yet)
+        """
+        end = re.search(self._SOL_END_PHRASE,text)
+        return -1 if end is None else end.end()
 
-        total = 1
-        self.file.seek(0)
-        txt = self.file.read()
-        
-        for p in self._ITERATE_PHRASES:
-            rexp = re.finditer(p,txt)
-            r,rexp = more_itertools.spy(rexp,n=1)
-            if r:
-                break
+    def _reset_follow(self):
+        super()._reset_follow()
+        self.__columns = None
+        self.__finished = False
+        self.__rows.clear()
+        self.__counts = {}
+        self.__fresh = []
+        self._reset_open_block()
+
+    def _reset_open_block(self):
+        self.__open.clear()
+        self.__open_width = None
+        self.__open_lines = 0
+        self.__open_error = None
+        self.__polled = []
+
+    def _count_first(self,array: np.ndarray) -> np.ndarray:
+        """
+        count the iterations in the array, returning the rows which are the first 
+        occurence of their iteration (the rows kept by _frame_from_array())
+        """
+        first = np.zeros(array.shape[0],dtype = bool)
+        for i,iteration in enumerate(array[:,0].astype(int)):
+            count = self.__counts.get(iteration,0)
+            first[i] = count == 0
+            self.__counts[iteration] = count + 1
         
-        for i,r in enumerate(rexp):
-            line = txt[r.end():]
-            total += int(line.partition(self.LINE_BREAK)[0].strip())
+        return array[first]
+
+    def _fail_open_block(self,error: str) -> None:
+        """
+        the block of iterations that has not yet ended cannot be parsed, so its
+        rows are removed and the rest of the block is skipped
+        """
+        values = self.__open.values
+        if values is not None:
+            for iteration in values[:,0].astype(int):
+                self.__counts[iteration] -= 1
         
-        if i == 1:
-            total +=1
+        self.__open.clear()
+        self.__polled = []
+        self.__open_error = error
 
-        self.file.seek(0)
-        if self.df is None:
-            self.readdf()
+    def _extend_open_block(self,rows: list) -> None:
+        """
+        parse the rows appended to the block of iterations that has not yet ended and 
+        add them to the block. As in readdf(), the number of fields in the block is set by its first 
+        row, shorter rows are padded with nan and the block cannot be parsed if a row is longer
+        """
+        self.__open_lines += len(rows)
+        if not rows or self.__open_error is not None:
+            return
         
-        if total == self.df.shape[0]:
-            self.STATUS = True
-        else:
-            self.STATUS = False
+        fields = [len(row.split()) for row in rows]
+        if self.__open_width is None:
+            self.__open_width = fields[0]
+        
+        for i,n in enumerate(fields):
+            if n > self.__open_width:
+                self._fail_open_block('Expected {} fields in line {}, saw {}'.format(self.__open_width,
+                                                                                    self.__open_lines - len(rows) + i + 1,n))
+                return
+        
+        try:
+            array = pd.read_csv(StringIO(self.LINE_BREAK.join(rows)), sep = '\s+',dtype = float, 
+                                header = None,names = list(range(self.__open_width))).to_numpy()
+        except (ValueError,pd.errors.EmptyDataError) as pd_error:
+            self._fail_open_block(str(pd_error))
+            return
+        
+        self.__open.append(array)
+        self.__polled.append(self._count_first(array))
 
-        return self.STATUS
+    def _commit_open_block(self,error_on_parser = False) -> None:
+        """
+        the block of iterations has ended, add it to the parsed blocks. Blocks which 
+        cannot be parsed are warned about (or raise) here, once
+        """
+        if self.__open_error is not None:
+            if error_on_parser:
+                raise ValueError(self.__open_error)
+            else:
+                warnings.warn(self.__open_error)
+        elif len(self.__open) > 0:
+            self.__rows.append(self.__open.values)
+            self.__fresh.extend(self.__polled)
+        
+        self._reset_open_block()
 
-class TransientSolutionFile(SolutionFile): 
+    def _refreshed_df(self) -> pd.DataFrame:
+        """
+        the frame of all of the rows parsed by refresh(), built when df is accessed
+        """
+        arrays = [buffer.values for buffer in [self.__rows,self.__open] if len(buffer) > 0]
+        return self._frame_from_array(np.concatenate(arrays,axis = 0),self.__columns)
 
-    _ITERATE_PHRASES = set(['> solve/dual-time-iterate',
-                            'solve/dual-time-iterate'])
-    
+    def refresh(self,error_on_parser = False) -> pd.DataFrame:
+        """
+        parse only the iteration rows appended to the file since the last call to refresh(), 
+        and update df. The first call locates the iteration header and replaces df. 
+        
+        The rows are split into blocks of iterations as in readdf(), up until the end phrase 
+        is written. Only the appended rows are parsed, and these are added to a growing buffer 
+        which is converted into df when df is next accessed. df is therefore the same as readdf() on 
+        the file read so far, regardless of when the file is polled. Partially written trailing 
+        lines are left until they are complete
 
-    def __init__(self,fname):
+        Parameters
+        ----------
+        error_on_parser : bool
+                raise an error if a block of iterations cannot be parsed, otherwise
+                the block is skipped with a warning
 
-        super().__init__(fname)
+        Returns
+        -------
+        new : pandas.DataFrame
+                the newly found iterations, or None if no new iterations were found
+        """
+        text,nbytes = self._read_appended_text()
+        replace = self.__columns is None
+        if self.__finished:
+            self.offset += nbytes
+            return None
+        
+        if replace:
+            start = text.find(self._SOL_START_PHRASE)
+            if start == -1:
+                self.offset += nbytes
+                return None
+            
+            header_end = text.find(self.LINE_BREAK,start)
+            self.__columns = re.split('\s+',text[start:header_end].strip())[0:-1]
+            text = text[header_end:]
+        
+        self.offset += nbytes
+        end = self._find_solution_end(text)
+        if end != -1:
+            self.__finished = True
+            text = text[0:end]
+
+        block_end,row = self._row_expressions()
+        segments = block_end.split(text)
+        self._extend_open_block(row.findall(segments[0]))
+        for segment in segments[1:]:
+            self._commit_open_block(error_on_parser = error_on_parser)
+            self._extend_open_block(row.findall(segment))
+        
+        if len(self.__rows) > 0 or len(self.__open) > 0:
+            self._defer_df(self._refreshed_df)
+        
+        arrays = [array for array in self.__fresh + self.__polled if array.shape[0] > 0]
+        self.__fresh,self.__polled = [],[]
+        if not arrays:
+            return None
+        
+        try:
+            return self._frame_from_array(np.concatenate(arrays,axis = 0),self.__columns)
+        except ValueError:
+            return pd.concat([self._frame_from_array(array,self.__columns) for array in arrays],axis = 0)
 
-    def _parse_solution_text(self,solution_text: str,
-                                  eol1: Iterable,
-                                  eol2: Iterable):
+    def _get_status(self):
+        """
+        get the status of the solution file
+        False - solution is not finished
+        True - solution is finished
         
+        the status is determined from the run status record, the solution is finished if 
+        it converged or all of the requested iterations were executed without the solver diverging.
+        The run status is not cached on disk here
         """
-        parse the solution folder file in post into a pandas dataframe with the
-        columns being the various values tracked over the course of the solver
-        and the rows the iterations.
+        self.STATUS = self.run_status().completed
+        return self.STATUS
 
-        ** This function is pretty slow, considering that every line must be iterated
-        over in python, and each character of each line must be examined in python. However,
-        SolutionFiles tend to be on the order of 1e3-1e4 lines and kb of data, so this is probably
-        not a performance bottleneck. In the future, it could be useful to write this parsing procedure 
-        in cython but this is not a priority at the moment 12.28.2021. 
+    @property
+    def status_file(self):
+        """
+        the file beside the transcript in which the run status is cached
         """
+        folder,name = os.path.split(self.fname)
+        return os.path.join(folder,'.' + name + self.STATUS_EXT)
 
-        if not solution_text:
-            return ''
+    def run_status(self,cache = False) -> RunStatus:
+        """
+        the run status of the transcript, found in a single streaming pass over the file. 
         
-        else:
-            cleanedText = ''
-            for e2,e1 in zip(eol2,eol1):
-                line = solution_text[e2.start():e1.start()+1].strip() +'\n'
-                try:
-                    #check to see if we should consider this line
-                    if line[0] in self._SKIP_CHARS or 'Solution' in line or 'Flow time' in line or 'more time steps' in line:
-                        continue
-                    else:
-                        try:
-                            int(line[0])
+        The state of the pass is kept along with the size and modification time of the transcript. 
+        If the transcript is unchanged the kept record is returned, and if the transcript has grown 
+        (i.e. the run is ongoing) only the appended text is scanned
 
-                            #ugly block here deals with annoying time/iter format
-                            #data at the last column
-                            _temp_end = line.find(':')
-                            _i = 1
-                            while line[_temp_end - _i] != ' ':
-                                _i +=1
-                            line = line[0:_temp_end-_i] + '\n'
-                            
-                            #add okay line to the cleaned text
-                            cleanedText += line
-                        except ValueError:
-                            continue
-                except IndexError:
-                    continue
+        Parameters
+        ----------
+        cache : bool
+                also read and write the state in a file beside the transcript (status_file), so that
+                it is kept between instances/processes. If False, the state is only kept by this instance
         
-        return cleanedText
-
-    def _get_data(self):
+        Returns
+        -------
+        status : RunStatus
+                the run status record
+        """
+        stat = os.stat(self.fname)
+        state = self._check_status_state(self._read_status_cache() if cache else self.__status_state,stat)
+        if state is None or state['size'] != stat.st_size or state['mtime_ns'] != stat.st_mtime_ns:
+            state = self._scan_status(state)
+            state['size'],state['mtime_ns'] = stat.st_size,stat.st_mtime_ns
+            if cache:
+                self._write_status_cache(state)
+        
+        self.__status_state = state
+        return RunStatus.from_dict(state['status'])
+    
+    def _read_status_cache(self) -> dict:
         """
-        iteratively retrieve data, examining all of the iteration
-        blocks found in the file
+        read the cached state of the status scan, None if there is no cache
         """
-        columns = []
-        solution_text = self.file.read()
-        eol = itertools.tee(re.finditer('solve/dual-time-iterate',solution_text))
-        eol1 = peekable(eol[0])
-        eol2 = peekable(eol[1])
         try:
-            columns = re.split('\s+',solution_text[0:next(eol1).start()].strip())[0:-1]
-        except StopIteration:
-            raise AttributeError('no columns found in file - ensure that the file with name: {} is a solution file'.format(self.fname))
+            with open(self.status_file,'r') as file:
+                return json.load(file)
+        except (OSError,ValueError):
+            return None
+    
+    def _check_status_state(self,state: dict,
+                                 stat: os.stat_result) -> dict:
+        """
+        the state of the status scan, None if there is no state or the transcript was 
+        overwritten since (it has shrunk or the text before the offset of the state has changed)
+        """
+        if state is None or stat.st_size < state['offset']:
+            return None
+        
+        with open(self.fname,'rb') as file:
+            file.seek(max(state['offset'] - len(bytes.fromhex(state['tail'])),0))
+            if file.read(len(bytes.fromhex(state['tail']))).hex() != state['tail']:
+                return None
+        
+        return state
+    
+    def _write_status_cache(self,state: dict) -> None:
+        
+        try:
+            temp = self.status_file + '.{}.tmp'.format(os.getpid())
+            with open(temp,'w') as file:
+                json.dump(state,file)
+            
+            os.replace(temp,self.status_file)
+        except OSError:
+            warnings.warn('could not write the run status of: {}'.format(self.fname))
 
-        chunks = []
-        while True:
-            try:
-                eol1.peek()
-                eol2.peek()
-                chunks.append(self._parse_solution_text(solution_text,eol1,eol2))
-            except StopIteration:
-                break
+    @classmethod
+    def _iterate_expression(cls):
+        """
+        compiled regular expression matching the iterate commands, capturing the number
+        of iterations requested
+        """
+        phrases = sorted(cls._ITERATE_PHRASES,key = len,reverse = True)
+        return re.compile(r'^\s*(?:{})\s+(\d+)'.format('|'.join(re.escape(p) for p in phrases)))
+
+    def _scan_status(self,state = None) -> dict:
+        """
+        stream the lines of the transcript from the offset of the state (from the start if None)
+        updating the run status record. Only complete lines are consumed
+        """
+        if state is None:
+            state = {'offset': 0,'in_block': False,'status': RunStatus().to_dict()}
         
-        return chunks,columns
+        status = state['status']
+        iterate = self._iterate_expression()
+        row = self._row_expressions()[1]
+        line_break = self.LINE_BREAK.encode()
+        tail = b''
+        with open(self.fname,'rb') as file:
+            file.seek(state['offset'])
+            for raw in file:
+                if not raw.endswith(line_break):
+                    break
+                
+                state['offset'] += len(raw)
+                tail = (tail + raw)[-32:]
+                line = raw.decode(errors = 'replace').rstrip()
+                lower = line.lower()
+
+                if self._SOL_START_PHRASE in line:
+                    state['in_block'] = True
+                elif state['in_block'] and (line.strip()[0:1] in self._END_CHARS or line.startswith(self._DATA_WRITE_PHRASE)):
+                    state['in_block'] = False
+                elif state['in_block'] and row.match(line):
+                    fields = line.split()
+                    iteration = int(fields[0])
+                    if status['last_iteration'] is None or iteration > status['last_iteration']:
+                        status['executed_iterations'] += 1
+                        status['last_iteration'] = iteration
+                    
+                    if fields[-1].isdigit():
+                        status['remaining_iterations'] = int(fields[-1])
+                
+                match = iterate.match(line)
+                if match:
+                    status['requested_iterations'] += int(match.group(1))
+                elif self._CONVERGED_PHRASE in lower:
+                    status['converged'] = True
+                elif self._DIVERGENCE_PHRASE in lower:
+                    status['diverged'] = True
+                elif any(phrase in lower for phrase in self._FLOATING_POINT_PHRASES):
+                    status['floating_point_error'] = True
+                elif self._WALL_CLOCK_PHRASE in line:
+                    status['wall_clock_per_iteration'] = float(line.split(':')[1].split()[0])
+                elif line.startswith(self._DATA_WRITE_PHRASE) and self._DATA_EXT in line:
+                    status['data_written'] = True
+        
+        if tail or 'tail' not in state:
+            state['tail'] = tail.hex() if tail else ''
+        
+        return state
+
+class TransientSolutionFile(SolutionFile): 
+
+    _ITERATE_PHRASES = set(['> solve/dual-time-iterate',
+                            'solve/dual-time-iterate'])
+    _SKIP_PHRASES = ['Solution','Flow time','more time steps']
+    
+
+    def __init__(self,fname,
+                      parser = 'python'):
+
+        super().__init__(fname,parser = parser)
+
+    def _find_solution_end(self,text: str) -> int:
+        return -1
+
+    def _get_solution_text(self) -> str:
+        """
+        transient solutions write data files periodically, so the residual information
+        continues from the first iteration header to the end of the file
+        """
+        return _read_text_between_phrases(self.fname,
+                                          [self._SOL_START_PHRASE,None],
+                                          include_pairs = True,
+                                          strip = False)
+
 class DesignPointExportFile(FluentFile):
 
     """
@@ -1717,7 +3031,13 @@ class ReportFilesOut(FluentFiles):
         self._set_component_class()
     
     def readdf(self) -> pd.DataFrame:
-        self.load(convergedResult= True)
+        """
+        table of the converged result of each of the report files. Only the last row of each
+        file is read unless the files have already been loaded
+        """
+        if not self.frames and not self.data:
+            self.load_converged()
+        
         for key,df in self.data.items():
             self.data[key] = df.squeeze()
         
@@ -1726,11 +3046,22 @@ class ReportFilesOut(FluentFiles):
     
 class SolutionFiles(FluentFiles): 
 
+    """
+    Parameters
+    ----------
+    parser : str
+            the parser used for each of the solution files, either "python" 
+            or "vectorized" (see SolutionFile)
+    """
+
     def __init__(self,flist:list,
-                      *args,**kwargs): 
+                      *args,
+                      parser = 'python',
+                      **kwargs): 
 
         super().__init__(flist,*args,**kwargs)
         self.component_class = SolutionFile
+        self.component_kwargs = {'parser':parser}
         self._set_component_class()
 
 
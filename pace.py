@@ -5,8 +5,11 @@ from typing import Tuple, Union, Any, List
 import re
 import os
 import shutil
+import filecmp
 import time
-from datetime import datetime,timedelta
+import asyncio
+import shlex
+import weakref
 
 """
 Author: Michael Lanahan
@@ -126,6 +129,143 @@ class CheckJob(PaceCommunication):
         super().__init__(jobid,pace_command= CheckJobCommand,
                                 pace_out = CheckJobOutput)
 
+class BulkStatusCommand(PaceCommand):
+    """
+    Issue a single command to the scheduler requesting the state of 
+    many jobs at once. The command is a template with a {jobids} field
+    that is filled in with the seperated job ids
+    """
+    def __init__(self,jobids: List[str],
+                      command: str,
+                      seperator = ',') -> None:
+
+        super().__init__(jobids)
+        self.jobids = [str(jobid) for jobid in jobids]
+        self.command = command
+        self.seperator = seperator
+    
+    def __str__(self) -> str:
+        return self.command.format(jobids = self.seperator.join(self.jobids))
+
+class BulkStatusOutput(PaceOut):
+    """
+    Collect the output from a bulk status command, one job per line with
+    the job id and state in the columns specified. States are normalized to 
+    the names reported by checkjob i.e. Queued, Running, Completed where known,
+    and jobs that are not reported are assigned the missing_state (squeue and qstat 
+    stop reporting jobs once they leave the queue)
+    """
+
+    STATES = {'PENDING': 'Queued','CONFIGURING': 'Queued','REQUEUED': 'Queued','SUSPENDED': 'Queued',
+              'RUNNING': 'Running','COMPLETING': 'Running',
+              'COMPLETED': 'Completed',
+              'FAILED': 'Failed','CANCELLED': 'Failed','TIMEOUT': 'Failed','NODE_FAIL': 'Failed',
+              'OUT_OF_MEMORY': 'Failed','PREEMPTED': 'Failed','BOOT_FAIL': 'Failed','DEADLINE': 'Failed',
+              'Q': 'Queued','H': 'Queued','W': 'Queued','T': 'Queued',
+              'R': 'Running','E': 'Running','B': 'Running',
+              'C': 'Completed','F': 'Completed','X': 'Completed',
+              'IDLE': 'Queued','QUEUED': 'Queued','REMOVED': 'Failed','VACATED': 'Failed'}
+
+    def __init__(self,output:Union[str,StringIO],
+                      jobids: List[str],
+                      columns = (0,1),
+                      delimiter = None,
+                      missing_state = None):
+
+        super().__init__(output)
+        self.jobids = [str(jobid) for jobid in jobids]
+        self.columns = columns
+        self.delimiter = delimiter
+        self.missing_state = missing_state
+        self.__data = {}
+
+    @classmethod
+    def normalize_state(cls,state: str) -> str:
+        #scheduler states may carry a suffix i.e. "CANCELLED by 1234"
+        state = state.strip().split(' ')[0]
+        return cls.STATES.get(state.upper(),state)
+
+    def parse_output(self) -> str:
+        
+        requested = set(self.jobids)
+        for line in re.split(self.LINEBREAK,self.output):
+            items = line.strip().split(self.delimiter)
+            try:
+                jobid = items[self.columns[0]].strip().split('.')[0]
+                state = items[self.columns[1]]
+            except IndexError:
+                continue
+            
+            if jobid in requested:
+                self.__data[jobid] = self.normalize_state(state)
+        
+        if self.missing_state is not None:
+            for jobid in self.jobids:
+                if jobid not in self.__data:
+                    self.__data[jobid] = self.missing_state
+            
+    @property
+    def json_data(self):
+        return self.__data
+
+class BulkJobStatus(PaceCommunication):
+
+    """
+    Class for querying the state of many jobs with one call to the scheduler.
+    The scheduler may be one of the presets in SCHEDULERS (by the submit command
+    or the name of the query) or the query may be specified directly, allowing 
+    a stand-in scheduler to be used
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        status = BulkJobStatus(['1234','1235'],scheduler = 'sbatch')()
+        print(status)
+        > {'1234': 'Running','1235': 'Queued'}
+    
+    tasks of an array job (i.e. 1236_0 or 1236[0]) are queried once through 
+    the array job and reported individually
+    """
+
+    SCHEDULERS = {'squeue': {'command': 'squeue -h -r -o "%i %T" -j {jobids}',
+                             'seperator': ',','columns': (0,1),'delimiter': None,'missing_state': 'Completed'},
+                  'sacct': {'command': 'sacct -n -X -P -o JobID,State -j {jobids}',
+                            'seperator': ',','columns': (0,1),'delimiter': '|','missing_state': None},
+                  'qstat': {'command': 'qstat -x -t {jobids}',
+                            'seperator': ' ','columns': (0,4),'delimiter': None,'missing_state': 'Completed'}}
+    
+    SCHEDULERS['sbatch'] = SCHEDULERS['squeue']
+    SCHEDULERS['qsub'] = SCHEDULERS['qstat']
+
+    def __init__(self,jobids: List[str],
+                      scheduler = 'sbatch',
+                      **query):
+
+        try:
+            settings = dict(self.SCHEDULERS[scheduler])
+        except KeyError:
+            raise ValueError('scheduler must be one of: {}, not: {}'.format(', '.join(self.SCHEDULERS),scheduler))
+        
+        settings.update(query)
+        array_jobids = list(dict.fromkeys([array_job_id(jobid) for jobid in jobids]))
+        super().__init__(array_jobids,command = settings['command'],seperator = settings['seperator'],
+                         pace_command = BulkStatusCommand,pace_out = BulkStatusOutput)
+        
+        self.jobids = jobids
+        self.settings = settings
+    
+    def __call__(self) -> dict:
+        if not self.jobids:
+            return {}
+
+        return super().__call__(self.jobids,
+                                columns = self.settings['columns'],
+                                delimiter = self.settings['delimiter'],
+                                missing_state = self.settings['missing_state'])
+
+
 class PaceScript:
 
     LINEBREAK = '\n'
@@ -160,13 +300,24 @@ class PaceScript:
                 txt = self.script_modifications(txt)
             
             _,file_name = os.path.split(self.script)
-            with open(os.path.join(self.target_dir,file_name),'w') as file:
+            target = os.path.join(self.target_dir,file_name)
+            try:
+                #leave an unchanged script alone
+                with open(target,'r') as file:
+                    if file.read() == txt:
+                        return
+            except FileNotFoundError:
+                pass
+            
+            with open(target,'w') as file:
                 file.write(txt)
     
     def _setup_lib(self) -> None:
         for lib in self.libs:
             if os.path.exists(lib):
-                shutil.copy2(lib,self.target_dir)
+                target = os.path.join(self.target_dir,os.path.split(lib)[1])
+                if not os.path.exists(target) or not filecmp.cmp(lib,target,shallow = True):
+                    shutil.copy2(lib,self.target_dir)
             else:
                 print('WARNING::could not find library: {}'.format(lib))
     
@@ -222,18 +373,14 @@ class QueuedJobs(ABC):
         self.pbs_files = pbs_files
         self.__queue = self.make_queue(pbs_files)
     
-    @abstractmethod
-    def exit_queue_condition(self):
-        pass
-
     @abstractmethod
     def make_queue(self):
         pass
 
-    def submit_job(self):
+    def submit_job(self,options = ''):
 
         #run the .pbs script in question in question
-        cmd = 'qsub ' + next(self.__queue)
+        cmd = 'qsub ' + (options + ' ' if options else '') + next(self.__queue)
         output = subprocess.run(cmd,shell= True,
                                 capture_output= True,
                                 text= True)
@@ -241,8 +388,6 @@ class QueuedJobs(ABC):
 
 class SquentialJobs(QueuedJobs):
 
-    time_format = "%H:%M:%S"
-
     def __init__(self,first_pbs_file: str,
                       second_pbs_file: str,
                       check_time = 10.0):
@@ -250,52 +395,312 @@ class SquentialJobs(QueuedJobs):
         super().__init__([first_pbs_file,second_pbs_file])
         self.check_time = check_time
 
-    def exit_queue_condition(self):
+    def make_queue(self,pbs_files: List[str]):
+        return iter(pbs_files)
 
-        exit_status = False
-        wall_time = self.get_wall_time()
-        t0 = time.time()
-        status = ''
-        while True:
-            if status.lower() == 'completed':
-                exit_status = True
-                break
-            else:
-                time.sleep(self.check_time)
-                status = get_job_status(self.first_job_id)
-                if status is None:
-                    status = ''
-
-            t1 = time.time()
-            dt = t1-t0
-            if dt > wall_time:
-                break
+    def run_jobs(self):
 
-        return exit_status
-                
-    def get_wall_time(self):
-
-        with open(self.pbs_files[0],'r') as file:
-            for line in file.readlines():
-                if 'walltime' in line:
-                    line = line.split('=')[1].strip()
-                    t = datetime.strptime(line,self.time_format)
-                    delta = timedelta(hours = t.hours,minuties = t.minute,
-                                      second = t.second)
-                    break
+        #the scheduler holds the second job until the first job exits so 
+        #there is no need to wait on the first job here
+        output = self.submit_job()
+        self.first_job_id = output.split('.')[0].strip()
+        self.submit_job(options = '-W depend=afterany:' + self.first_job_id)
         
-        return delta.total_seconds()
 
-    def run_jobs(self):
+class BatchMonitor:
 
-        output = self.submit_job()
-        self.first_job_id = output.stdout.split('.')[0]
-        exit_status = self.exit_queue_condition()
-        if not exit_status:
-            print('First job in sequntial job series did not finish before specified walltime') 
+    """
+    Event driven monitor for a batch of jobs logged in a job file as 
+    lines of "folder,jobid". Each poll fetches the state of every job with a single
+    bulk call to the scheduler and diffs these against the previous states in memory.
+    Jobs that start (or finish) without writing the solution file within check_time 
+    are cancelled and resubmitted up to num_resubmit times. The time between polls
+    grows by the backoff factor (up to max_check_time) while nothing changes and
+    resets whenever a job changes state. 
+
+    The scheduler is pluggable through the backend (submission), cancel_command and
+    the query used by BulkJobStatus, so that a stand-in scheduler can be used for testing.
+
+    If the jobs are the tasks of an array job, the array_file is the script of the array job
+    and the folder_file lists the folder of each task, and failed tasks are resubmitted
+    individually from the array_file. This is only supported with slurm (sbatch), as a PBS
+    array cannot be resubmitted as a single task of the array.
+
+    A job may be logged for more than one folder (i.e. a packed submission running several 
+    cases in one allocation). Such a job is never cancelled, and the cases that did not write a 
+    solution file are resubmitted from their own folder once the job has finished.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        monitor = BatchMonitor('solution.trn','fluent.pbs',backend = 'qsub',check_time = 120)
+        monitor.run()
+    """
+
+    JOB_FILE = 'jobid.txt'
+    CANCEL_COMMANDS = {'sbatch': 'scancel','qsub': 'qdel'}
+    ARRAY_RESUBMIT = {'sbatch': '--array={}'}
+    STARTED_STATES = ['Running','Completed','Failed']
+    TERMINAL_STATES = ['Completed','Failed']
+
+    def __init__(self,solution_file_name: str,
+                      submit_file: str,
+                      backend = 'sbatch',
+                      check_time = 120.0,
+                      max_check_time = None,
+                      backoff = 2.0,
+                      num_resubmit = 5,
+                      scheduler = None,
+                      cancel_command = None,
+                      root = '.',
+                      query = {},
+                      sleep = time.sleep,
+                      verbose = True,
+                      array_file = None,
+                      folder_file = 'array_folders.txt'):
+
+        self.solution_file_name = solution_file_name
+        self.submit_file = submit_file
+        self.backend = backend
+        self.check_time = check_time
+        self.max_check_time = 8*check_time if max_check_time is None else max_check_time
+        self.backoff = backoff
+        self.num_resubmit = num_resubmit
+        self.scheduler = backend if scheduler is None else scheduler
+        self.cancel_command = self.CANCEL_COMMANDS.get(backend) if cancel_command is None else cancel_command
+        self.root = root
+        self.query = query
+        self.sleep = sleep
+        self.verbose = verbose
+        self.array_file = array_file
+        self.folder_file = folder_file
+        if array_file is not None and backend not in self.ARRAY_RESUBMIT:
+            raise ValueError('array jobs may only be resubmitted with: {}, not: {}'.format(', '.join(self.ARRAY_RESUBMIT),backend))
+
+        self.jobs = {}
+        self.states = {}
+        self.pending = {}
+        self.resubmissions = {}
+        self.abandoned = []
+        self.__job_file_mtime = None
+
+    @property
+    def job_file(self) -> str:
+        return os.path.join(self.root,self.JOB_FILE)
+
+    @property
+    def done(self) -> bool:
+        """
+        all logged jobs have left the queue and either wrote a solution file
+        or could not be resubmitted again
+        """
+        queued = [jobid for jobid in self.jobs.values() if self.states.get(jobid,'Queued') == 'Queued']
+        return bool(self.jobs) and not self.pending and not queued
+
+    def _print(self,txt: str) -> None:
+        if self.verbose:
+            print(txt)
+
+    def read_jobs(self,force = False) -> dict:
+        """
+        read the job file, only if it was modified since last read as
+        jobs may still be logged while the monitor is running
+        """
+        try:
+            mtime = os.stat(self.job_file).st_mtime_ns
+        except FileNotFoundError:
+            return self.jobs
         
-        self.submit_job()
+        if force or mtime != self.__job_file_mtime:
+            self.__job_file_mtime = mtime
+            with open(self.job_file,'r') as jobfile:
+                for line in jobfile.readlines():
+                    try:
+                        job_folder,job_id = line.split(',')
+                    except ValueError:
+                        continue
+
+                    self.jobs[job_folder.strip()] = job_id.strip()
         
+        return self.jobs
+    
+    def write_jobs(self) -> None:
+
+        jobs = dict(self.jobs)
+        self.read_jobs(force = True)
+        self.jobs.update(jobs)
+        with open(self.job_file,'w') as jobfile:
+            for job_folder,job_id in self.jobs.items():
+                jobfile.write(job_folder + ',' + job_id + '\n')
+        
+        self.__job_file_mtime = os.stat(self.job_file).st_mtime_ns
+    
+    def poll(self) -> List[Tuple]:
+        """
+        query the scheduler once for all jobs and return the state transitions
+        as a list of (folder,jobid,previous state,state)
+        """
+        self.read_jobs()
+        folders = {}
+        for folder,jobid in self.jobs.items():
+            folders.setdefault(jobid,[]).append(folder)
+
+        status = BulkJobStatus(list(folders.keys()),scheduler = self.scheduler,**self.query)()
+        
+        events = []
+        for jobid,state in status.items():
+            previous = self.states.get(jobid)
+            if state != previous:
+                self.states[jobid] = state
+                events.extend([(folder,jobid,previous,state) for folder in folders[jobid]])
+        
+        return events
+    
+    def shared(self,jobid: str) -> bool:
+        """
+        the job runs the cases of more than one folder i.e. a packed submission
+        """
+        return list(self.jobs.values()).count(jobid) > 1
+    
+    def _has_solution(self,folder: str) -> bool:
+        return os.path.exists(os.path.join(self.root,folder,self.solution_file_name))
+
+    def handle_events(self,events: List[Tuple]) -> None:
+        """
+        jobs that have started are checked for the solution file until it is found,
+        and resubmitted if it is not written within check_time or the job finished
+        """
+        now = time.time()
+        for folder,jobid,_,state in events:
+            self._print('job in folder: {} with id: {} is {}'.format(folder,jobid,state))
+            if state in self.STARTED_STATES and folder not in self.pending:
+                self.pending[folder] = now
+
+        for folder,started in list(self.pending.items()):
+            jobid = self.jobs[folder]
+            if self._has_solution(folder):
+                self.pending.pop(folder)
+            elif self.states[jobid] in self.TERMINAL_STATES or \
+                (now - started >= self.check_time and not self.shared(jobid)):
+                #the other cases of a shared job are left to finish
+                self.pending.pop(folder)
+                self.resubmit(folder,jobid)
+    
+    def array_index(self,folder: str) -> int:
+        """
+        the index of the folder in the folder file of an array job
+        """
+        with open(os.path.join(self.root,self.folder_file),'r') as file:
+            return [line.strip() for line in file.readlines()].index(folder)
+
+    def format_submit(self,folder: str) -> str:
+        """
+        the command resubmitting the job of the folder, or the single task
+        of the folder if the jobs are the tasks of an array job
+        """
+        if self.array_file is None:
+            return self.backend + ' ' + self.submit_file
+        
+        option = self.ARRAY_RESUBMIT[self.backend].format(self.array_index(folder))
+        return ' '.join([self.backend,option,self.array_file])
+
+    def submit(self,folder: str) -> str:
+
+        if self.array_file is None:
+            output = subprocess.run(self.format_submit(folder),shell = True,
+                                    capture_output = True,text = True,
+                                    cwd = os.path.join(self.root,folder))
+            return parse_job_id(output.stdout)
+        
+        #resubmit the single task of the array job
+        output = subprocess.run(self.format_submit(folder),shell = True,
+                                capture_output = True,text = True,cwd = self.root)
+        return array_task_id(parse_job_id(output.stdout),self.array_index(folder))
+
+    def cancel(self,jobid: str) -> None:
+
+        if self.cancel_command is not None:
+            subprocess.run(self.cancel_command + ' ' + jobid,shell = True,
+                           capture_output = True,text = True,cwd = self.root)
+    
+    def resubmit(self,folder: str,
+                      jobid: str) -> Union[str,None]:
+        
+        count = self.resubmissions.get(folder,0)
+        if count >= self.num_resubmit:
+            self._print('job in folder: {} failed to start after {} re-submissions'.format(folder,count))
+            self.abandoned.append(folder)
+            return None
+        
+        self._print('Re-submitting job in folder: {} with id: {}'.format(folder,jobid))
+        if not self.shared(jobid):
+            self.cancel(jobid)
+        
+        new_jobid = self.submit(folder)
+        self.resubmissions[folder] = count + 1
+        self.jobs[folder] = new_jobid
+        self.write_jobs()
+        return new_jobid
+
+    def step(self) -> List[Tuple]:
+        events = self.poll()
+        self.handle_events(events)
+        return events
+
+    def run(self,max_polls = None) -> dict:
+        """
+        poll until all of the jobs have been submitted succesfully, returning
+        the final job ids
+        """
+        interval = self.check_time
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            self.sleep(interval)
+            polls += 1
+            self._print('Checking for failed job submissions...{}'.format(polls))
+            events = self.step()
+            if self.done:
+                self._print('All Jobs have been submitted successfully')
+                break
+
+            if events:
+                interval = self.check_time
+            else:
+                interval = min(interval*self.backoff,self.max_check_time)
+        
+        return self.jobs
+
+def array_job_id(jobid: str) -> str:
+    """
+    the id of the array job of a task i.e. 1234_5 -> 1234 (slurm)
+    or 1234[5] -> 1234[] (PBS). Ids of other jobs are unchanged
+    """
+    if '[' in jobid:
+        return jobid[0:jobid.index('[')] + '[]'
+    
+    return jobid.split('_')[0]
+
+def array_task_id(jobid: str,
+                  index: int) -> str:
+    """
+    the id of the task of an array job with the index
+    """
+    if jobid.endswith('[]'):
+        return jobid[0:-2] + '[{}]'.format(index)
+    
+    return '{}_{}'.format(jobid,index)
+
+def parse_job_id(output: str) -> str:
+    """
+    parse the job id from the output of a submission, i.e.
+    "1234.sched-pbs" (qsub) or "Submitted batch job 1234" (sbatch)
+    """
+    try:
+        return output.strip().split()[-1].split('.')[0]
+    except IndexError:
+        return ''
 
 def get_job_name(jobid: str) -> Union[str,None]:
     """
@@ -322,6 +727,182 @@ def get_job_status(jobid: str) -> Union[str,None]:
     except KeyError:
         return None
     
+class AsyncPaceCommand(PaceCommand):
+    """
+    Base class for issuing a command on PACE without blocking. The command
+    is executed directly (not through a shell) using the arguments of the command string
+    """
+
+    def args(self) -> List[str]:
+        return shlex.split(self.__str__())
+
+    async def run(self,timeout = None) -> str:
+        """
+        run the command, killing it and raising a TimeoutError if it 
+        does not complete within timeout seconds
+        """
+        process = await asyncio.create_subprocess_exec(*self.args(),
+                                                       stdout = asyncio.subprocess.PIPE,
+                                                       stderr = asyncio.subprocess.PIPE)
+        try:
+            stdout,_ = await asyncio.wait_for(process.communicate(),timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise TimeoutError('command: {} did not complete within {} seconds'.format(self.__str__(),timeout))
+        
+        return stdout.decode()
+    
+    async def __call__(self):
+        return await self.run()
+
+class AsyncPaceRunner:
+    """
+    Runs asynchronous PACE commands with at most max_concurrent commands
+    running at once. Results are cached by the command string for ttl seconds, and 
+    identical commands issued while one is running wait on the same process, so that
+    repeated queries for the same job are coalesced into a single call
+    """
+
+    _DEFAULT_RUNNERS = weakref.WeakKeyDictionary()
+    MAX_CACHE = 1024
+
+    def __init__(self,max_concurrent = 16,
+                      timeout = 30.0,
+                      ttl = 5.0):
+
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.ttl = ttl
+        self.__semaphore = None
+        self.__cache = {}
+    
+    @classmethod
+    def default(cls):
+        """
+        the runner shared by the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in cls._DEFAULT_RUNNERS:
+            cls._DEFAULT_RUNNERS[loop] = cls()
+        
+        return cls._DEFAULT_RUNNERS[loop]
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        #created on first use so that it belongs to the running loop
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        return self.__semaphore
+
+    def clear(self) -> None:
+        self.__cache = {}
+
+    async def _run(self,command: AsyncPaceCommand,
+                        timeout: float) -> str:
+        
+        async with self.semaphore:
+            return await command.run(timeout = timeout)
+
+    async def run(self,command: AsyncPaceCommand,
+                       timeout = None) -> str:
+        
+        key = str(command)
+        now = time.monotonic()
+        try:
+            started,task = self.__cache[key]
+            if now - started < self.ttl:
+                return await asyncio.shield(task)
+        except KeyError:
+            pass
+        
+        if len(self.__cache) >= self.MAX_CACHE:
+            self.__cache = {k: v for k,v in self.__cache.items() if now - v[0] < self.ttl}
+
+        timeout = self.timeout if timeout is None else timeout
+        task = asyncio.ensure_future(self._run(command,timeout))
+        self.__cache[key] = (now,task)
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            #failures are not cached
+            if self.__cache.get(key,(None,None))[1] is task:
+                self.__cache.pop(key)
+            raise
+
+class AsyncPaceCommunication(PaceCommunication):
+    """
+    Base class for the asynchronous communication between PACE and a python 
+    script, using an AsyncPaceRunner to run the command
+    """
+    def __init__(self,*args,
+                       pace_command = AsyncPaceCommand,
+                       pace_out = PaceOut,
+                       runner = None,
+                       timeout = None,
+                       **kwargs):
+
+        super().__init__(*args,pace_command = pace_command,
+                               pace_out = pace_out,**kwargs)
+        self.runner = runner
+        self.timeout = timeout
+
+    async def __call__(self, *args,**kwargs):
+        runner = AsyncPaceRunner.default() if self.runner is None else self.runner
+        txt = await runner.run(self.pace_command,timeout = self.timeout)
+        self.pace_out = self.pace_out_cls(txt,*args,**kwargs)
+        self.pace_out.parse_output()
+        return self.pace_out.json_data
+
+class AsyncCheckJobCommand(AsyncPaceCommand,CheckJobCommand):
+    """
+    Issue a "check job" command to PACE without blocking
+    """
+    pass
+
+class AsyncCheckJob(AsyncPaceCommunication):
+
+    """
+    Class for issuing the "Check Job" command on pace asynchronously
+    and then collecting the subsequent outpout
+    """
+    def __init__(self,jobid: str,
+                      runner = None,
+                      timeout = None):
+
+        super().__init__(jobid,pace_command= AsyncCheckJobCommand,
+                               pace_out = CheckJobOutput,
+                               runner = runner,
+                               timeout = timeout)
+
+async def async_get_job_status(jobid: str,
+                               runner = None) -> Union[str,None]:
+    """
+    asynchronous version of get_job_status. Calls for the same job 
+    are coalesced by the runner
+    """
+    json_data = await AsyncCheckJob(jobid,runner = runner)()
+    try:
+        return json_data['State']
+    except KeyError:
+        return None
+
+def get_job_statuses(jobids: List[str],
+                     max_concurrent = 16,
+                     timeout = 30.0) -> dict:
+    """
+    get the status of many jobs submitted on PACE concurrently, jobs that 
+    could not be checked within the timeout have a status of None
+    """
+    async def _get_job_statuses():
+        runner = AsyncPaceRunner(max_concurrent = max_concurrent,timeout = timeout)
+        statuses = await asyncio.gather(*[async_get_job_status(jobid,runner = runner) for jobid in jobids],
+                                        return_exceptions = True)
+        return {jobid: None if isinstance(status,Exception) else status for jobid,status in zip(jobids,statuses)}
+    
+    return asyncio.run(_get_job_statuses())
+
 def main():
 
     filename = 'test/pace-files/checkjob_output.txt'
@@ -0,0 +1,74 @@
+import sys
+import os
+import re
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+stand-in for fluent that reads TUI commands from stdin so that the pooled
+FluentEngine can be tested without fluent (or a license). Supports reading case/data,
+surface integrals (writes a surface integral file with one value per boundary id),
+displaying string-append expressions and exiting.
+
+usage: python fake_fluent.py [3ddp] [-tN] [-g]
+"""
+
+DISPLAY_EXPR = re.compile(r'\(display \(string-append "([^"]*)" "([^"]*)"\)\)')
+SURFACE_INTEGRAL_PREFIX = '/report/surface-integrals/'
+
+#the header is written without the blank line following the title, as SurfaceIntegralFile
+#reads the type and the name of the integral from the second and third lines of the file
+SURFACE_INTEGRAL_TEXT = """                         "Surface Integral Report"
+        {}
+              {}                  (k)
+-------------------------------- --------------------
+{}                ---------------- --------------------
+                             Net            {}
+"""
+
+def write_surface_integral(surface_type: str,
+                           ids: list,
+                           variable: str,
+                           file_name: str) -> None:
+
+    values = [float(id) for id in ids]
+    txt = ''.join(['{:>32} {:>20}\n'.format(id,value) for id,value in zip(ids,values)])
+    with open(file_name,'w') as file:
+        file.write(SURFACE_INTEGRAL_TEXT.format(surface_type,variable,txt,max(values)))
+
+def main():
+
+    print('Welcome to fake fluent, pid: {}'.format(os.getpid()),flush = True)
+    lines = iter(sys.stdin.readline,'')
+    for line in lines:
+        line = line.strip()
+        print('> ' + line,flush = True)
+        if line == 'exit':
+            break
+        elif line.startswith('file/read-case-data'):
+            print('Reading "{}"...'.format(line.split(' ',1)[1]),flush = True)
+        elif line.startswith(SURFACE_INTEGRAL_PREFIX):
+            surface_type = line[len(SURFACE_INTEGRAL_PREFIX):]
+            ids = []
+            for id in lines:
+                if id.strip() == ',':
+                    break
+                ids.append(id.strip())
+
+            variable = next(lines).strip()
+            while variable == ',':
+                variable = next(lines).strip()
+
+            next(lines)
+            write_surface_integral(surface_type,ids,variable,next(lines).strip())
+        else:
+            match = DISPLAY_EXPR.search(line)
+            if match:
+                print(match.group(1) + match.group(2),flush = True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import sys
+import os
+import json
+import subprocess
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+stand-in for a slurm like scheduler so that the batch monitor can be tested locally.
+The state of the scheduler is kept in a json file. Each status query advances every
+job by one state: PENDING -> RUNNING (the submitted script is run in the job folder) -> COMPLETED,
+and like squeue, jobs that have completed are no longer reported
+
+usage: python fake_scheduler.py state_file submit file
+       python fake_scheduler.py state_file status id1,id2,...
+       python fake_scheduler.py state_file cancel id
+"""
+
+def read_state(state_file: str) -> dict:
+
+    if not os.path.exists(state_file):
+        return {'next': 1000,'jobs': {},'queries': 0}
+
+    with open(state_file,'r') as file:
+        return json.load(file)
+
+def write_state(state_file: str,
+                state: dict) -> None:
+
+    with open(state_file,'w') as file:
+        json.dump(state,file)
+
+def main():
+
+    state_file,command,arg = sys.argv[1:4]
+    state = read_state(state_file)
+    if command == 'submit':
+        jobid = str(state['next'])
+        state['next'] += 1
+        state['jobs'][jobid] = {'folder': os.getcwd(),'file': arg,'state': 'PENDING'}
+        print('Submitted batch job {}'.format(jobid))
+    elif command == 'cancel':
+        state['jobs'][arg]['state'] = 'CANCELLED'
+    elif command == 'status':
+        state['queries'] += 1
+        for jobid in arg.split(','):
+            job = state['jobs'][jobid]
+            if job['state'] == 'PENDING':
+                job['state'] = 'RUNNING'
+                subprocess.run(['sh',job['file']],cwd = job['folder'])
+            elif job['state'] == 'RUNNING':
+                job['state'] = 'COMPLETED'
+
+            if job['state'] in ['PENDING','RUNNING']:
+                print('{} {}'.format(jobid,job['state']))
+
+    write_state(state_file,state)
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,9 @@
-from fluentpy._file_scan import _get_repeated_text_phrase_lines,_get_text_between_phrase_lines
+from fluentpy._file_scan import _get_repeated_text_phrase_lines,_get_text_between_phrase_lines,\
+                                 _mapped_file,_find_text_between_phrases,_iter_repeated_phrase_blocks,\
+                                 _read_text_between_phrases
 import unittest
+import tempfile
+import os
 
 """
 
@@ -55,5 +59,50 @@ class TestgetRepeatedTextPhraseLines(unittest.TestCase):
         
         self.assertEqual(text,check)
 
+class TestMappedFileScan(unittest.TestCase):
+
+    buffer = 1024**2
+    start_phrase = 'START OF THE TEXT'
+    end_phrase = 'END OF THE TEXT'
+    repeated_phrase = 'WB->Fluent:Parameter name:'
+
+    def _write_test_file(self,folder):
+        """
+        write a file with the phrases split across the 1 MiB buffer boundary
+        of the buffered search
+        """
+        fname = os.path.join(folder,'scan.txt')
+        padding = 'x'*(self.buffer - 5) + '\n'
+        with open(fname,'w') as file:
+            file.write(padding + self.start_phrase + '\n')
+            file.write('text between\n')
+            file.write(padding + self.end_phrase + '\n')
+            file.write('{0} a\n{0} b\nno phrase\n{0} c\n'.format(self.repeated_phrase))
+        
+        return fname
+
+    def test_text_between_boundary(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            fname = self._write_test_file(folder)
+            with _mapped_file(fname) as buffer:
+                start,end = _find_text_between_phrases(buffer,[self.start_phrase,self.end_phrase],include_pairs = True)
+                with memoryview(buffer)[start:end] as view:
+                    self.assertTrue(view.tobytes().startswith(self.start_phrase.encode()))
+                    self.assertTrue(view.tobytes().endswith(self.end_phrase.encode()))
+            
+            text = _read_text_between_phrases(fname,[self.start_phrase,self.end_phrase])
+            self.assertTrue(text.startswith('text between'))
+
+    def test_repeated_phrase_blocks(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            fname = self._write_test_file(folder)
+            with _mapped_file(fname) as buffer:
+                blocks = [buffer[start:end] for start,end in _iter_repeated_phrase_blocks(buffer,self.repeated_phrase)]
+        
+        self.assertEqual(len(blocks),2)
+        self.assertEqual(blocks[0].count(self.repeated_phrase.encode()),2)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -3,11 +3,16 @@ import pandas as pd
 import numpy as np
 import unittest
 import pickle
+import tempfile
+import os
+import shutil
 
 #pacakge imports
 from fluentpy.fluentio import ReportFileOut,SolutionFile,PostDataFile,\
                                       XYDataFile,SurfacePointFile,SurfaceIntegralFile,\
-                                      SphereSliceFile
+                                      SphereSliceFile,FluentFile,ReportFilesOut,SolutionFiles,\
+                                      TransientSolutionFile
+from fluentpy.disk import ParseCache
 
 """
 -- Creation -- 
@@ -26,6 +31,53 @@ Checking the function of the io classes
 
 DIFF_TOL = 1e-10
 
+ITERATION_HEADER = '  iter  continuity  x-velocity  y-velocity      energy     time/iter'
+
+def iteration_rows(iterations: list,
+                   rng: np.random.Generator) -> list:
+    """
+    rows of the iteration table, counting down the iterations remaining in the last column
+    """
+    return ['{:>6d}  {:.4e}  {:.4e}  {:.4e}  {:.4e}  0:00:0{}  {:>4d}'.format(iteration,*rng.random(4),i % 10,len(iterations) - i - 1)
+            for i,iteration in enumerate(iterations)]
+
+def write_restarted_solution(fname: str) -> None:
+    """
+    a transcript in which the solver re-prints the last iteration after settings change, 
+    and is then restarted from the first iteration after the case is read again
+    """
+    rng = np.random.default_rng(3)
+    lines = ['> /solve/iterate 5','',ITERATION_HEADER] + iteration_rows(range(1,6),rng)
+    lines += ['> /define/boundary-conditions/velocity-inlet inlet no 2','> /solve/iterate 5','',ITERATION_HEADER]
+    lines += iteration_rows(range(5,11),rng)
+    lines += ['> /file/read-case-data test.cas','> /solve/iterate 3','',ITERATION_HEADER]
+    lines += iteration_rows(range(1,4),rng)
+    lines += ['> /file/write-data test.dat','Writing "| gzip -2cf > test.dat.gz"...','Done.']
+    with open(fname,'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
+def write_transient_solution(fname: str,
+                             time_steps = 3,
+                             iterations = 4) -> None:
+    """
+    a transient transcript, with the iteration table re-printed at each time step and a second
+    dual time iterate command which re-prints the last iteration
+    """
+    rng = np.random.default_rng(5)
+    lines = ['> /solve/dual-time-iterate {} {}'.format(time_steps,iterations),'']
+    for step in range(time_steps):
+        first = step*iterations + 1
+        lines += ['Updating solution at time level N...',' done.',ITERATION_HEADER]
+        lines += iteration_rows(range(first,first + iterations),rng)
+        lines += ['Flow time = {:.4e}s, time step = {}'.format(1e-3*(step + 1),step + 1),
+                  '{} more time steps'.format(time_steps - step - 1),'']
+    
+    lines += ['> /solve/dual-time-iterate 1 {}'.format(iterations),'',ITERATION_HEADER]
+    lines += iteration_rows(range(time_steps*iterations,(time_steps + 1)*iterations + 1),rng)
+    lines += ['Flow time = {:.4e}s, time step = {}'.format(1e-3*(time_steps + 1),time_steps + 1),'0 more time steps']
+    with open(fname,'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
 class ReportFileTests(unittest.TestCase):
 
     test_file_name = 'test-files\\wb-folder-test\\wb-folder-test_files\\dp0\\FFF\\Fluent\\report-file-0.out'
@@ -60,6 +112,71 @@ class ReportFileTests(unittest.TestCase):
             check_skip = pd.read_pickle(self.check_skip_rows)
             self.assertLess(np.linalg.norm(check_skip-rfile.df),DIFF_TOL)
 
+    def test_refresh(self):
+
+        with open(self.test_file_name,'r') as file:
+            text = file.read()
+        
+        with tempfile.TemporaryDirectory() as folder:
+            live_file = os.path.join(folder,'report-file-0.out')
+            rfile = ReportFileOut(live_file)
+            for end in [len(text)//3 + 7,len(text)//2 + 11,len(text)]:                 #cut part way through a row
+                with open(live_file,'w') as file:
+                    file.write(text[0:end])
+                rfile.refresh()
+        
+        with ReportFileOut(self.test_file_name) as check_rfile:
+            self.assertTrue(check_rfile.readdf().equals(rfile.df))                   #incremental parse equals full parse
+
+    def test_read_last_row(self):
+
+        with ReportFileOut(self.test_file_name) as check_rfile:
+            check_row = check_rfile.readdf().iloc[-1]
+
+        with open(self.test_file_name,'r') as file:
+            text = file.read()
+
+        with tempfile.TemporaryDirectory() as folder:
+            live_file = os.path.join(folder,'report-file-0.out')
+            with open(live_file,'w') as file:
+                file.write(text + '822 1.0 1.0')                                    #partially written row
+            
+            rfile = ReportFileOut(live_file)
+            rfile.TAIL_BLOCK = 16                                                   #grow the block to a complete row
+            self.assertTrue(rfile.read_last_row().iloc[-1].equals(check_row))
+
+            files = ReportFilesOut([self.test_file_name,live_file],max_workers = 1)
+            df = files.readdf()
+            self.assertFalse(files.frames)                                          #only the last rows are read
+            self.assertTrue(df.loc[live_file].equals(check_row))
+
+class ParseCacheTests(unittest.TestCase):
+
+    test_file_name = 'test-files\\wb-folder-test\\wb-folder-test_files\\dp0\\FFF\\Fluent\\report-file-0.out'
+
+    def tearDown(self):
+        FluentFile.PARSE_CACHE = None
+
+    def test_cache_readdf(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            source_file = os.path.join(folder,'report-file-0.out')
+            shutil.copy(self.test_file_name,source_file)
+            with ReportFileOut(source_file) as rfile:
+                check_df = rfile.readdf()
+            
+            FluentFile.PARSE_CACHE = ParseCache()
+            for _ in range(2):                                                      #parse and write, then read from the cache
+                with ReportFileOut(source_file) as rfile:
+                    self.assertTrue(check_df.equals(rfile.readdf()))
+            
+            self.assertEqual(len(os.listdir(os.path.join(folder,ParseCache.FOLDER_NAME))),1)
+            
+            with open(source_file,'a') as file:                                     #modifying the source invalidates the entry
+                file.write('822 1.0 1.0 1.0 1.0\n')
+            
+            self.assertEqual(ParseCache().clean(folder),1)
+
 class SolutionFileTests(unittest.TestCase):
 
     solution_file = 'test-files\\wb-folder-test\\wb-folder-test_files\\progress_files\\dp0\\FFF\\Fluent\\Solution.trn'
@@ -76,6 +193,170 @@ class SolutionFileTests(unittest.TestCase):
 
             self.assertLess(np.linalg.norm(np.array(check_solution_file,dtype = float)-np.array(sfile.df,dtype = float)),DIFF_TOL)
 
+    def test_readdf_vectorized(self):
+
+        for solution_string in [self.solution_file,self.solution_file2]:
+            with SolutionFile(solution_string) as sfile:
+                python_df = sfile.readdf(parser = 'python')
+                vector_df = sfile.readdf(parser = 'vectorized')
+
+            self.assertTrue(python_df.equals(vector_df))                                #both parsers should produce identical frames
+
+    def test_readdf_vectorized_restarted(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            solution_file = os.path.join(folder,'Solution.trn')
+            write_restarted_solution(solution_file)
+            python_df = SolutionFile(solution_file).readdf(parser = 'python')
+            vector_df = SolutionFile(solution_file).readdf(parser = 'vectorized')
+
+        self.assertListEqual(vector_df.index.tolist(),list(range(1,11)))               #repeated iterations are dropped
+        self.assertListEqual(list(vector_df.columns),['continuity','x-velocity','y-velocity','energy'])
+        self.assertTrue(python_df.equals(vector_df))
+
+    def test_readdf_vectorized_transient(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            solution_file = os.path.join(folder,'Solution.trn')
+            write_transient_solution(solution_file)
+            python_df = TransientSolutionFile(solution_file).readdf(parser = 'python')
+            vector_df = TransientSolutionFile(solution_file).readdf(parser = 'vectorized')
+
+        self.assertListEqual(vector_df.index.tolist(),list(range(1,17)))               #every time step is read
+        self.assertTrue(python_df.equals(vector_df))
+
+    def test_refresh(self):
+
+        with open(self.solution_file2,'r') as file:
+            text = file.read()
+        
+        with tempfile.TemporaryDirectory() as folder:
+            live_file = os.path.join(folder,'Solution.trn')
+            sfile = SolutionFile(live_file)
+            for end in [len(text)//3 + 7,len(text)//2 + 11,len(text)]:                 #cut part way through a line
+                with open(live_file,'w') as file:
+                    file.write(text[0:end])
+                sfile.refresh()
+        
+        with SolutionFile(self.solution_file2) as check_sfile:
+            self.assertTrue(check_sfile.readdf().equals(sfile.df))                   #incremental parse equals full parse
+
+    def test_refresh_changing_columns(self):
+
+        solution_file = 'test-files\\test\\difficult_solution.trn'                      #the number of columns changes part way through
+        with open(solution_file,'rb') as file:
+            data = file.read()
+        
+        with SolutionFile(solution_file,parser = 'vectorized') as check_sfile:
+            check_df = check_sfile.readdf()
+
+        rng = np.random.default_rng(7)
+        for splits in [[len(data)],[200000,len(data)],
+                       sorted(rng.choice(len(data),size = 25,replace = False).tolist()) + [len(data)]]:
+            with tempfile.TemporaryDirectory() as folder:
+                live_file = os.path.join(folder,'Solution.trn')
+                sfile = SolutionFile(live_file)
+                start = 0
+                for end in splits:
+                    with open(live_file,'ab') as file:
+                        file.write(data[start:end])
+                    start = end
+                    sfile.refresh()
+            
+            self.assertTrue(check_df.equals(sfile.df))                                  #independent of how the polls split the file
+
+    def test_run_status(self):
+
+        status = SolutionFile('test-files\\test\\difficult_solution.trn').run_status(cache = False)
+        self.assertEqual(status.requested_iterations,1300)
+        self.assertEqual(status.executed_iterations,1300)
+        self.assertAlmostEqual(status.wall_clock_per_iteration,14.579)
+        self.assertEqual(status.termination_reason,'iterations')
+        self.assertTrue(status.completed)
+
+        status = SolutionFile(self.solution_file2).run_status(cache = False)
+        self.assertEqual(status.executed_iterations,150)
+        self.assertTrue(status.data_written)
+        self.assertEqual(status.requested_iterations,0)                             #workbench does not echo the iterate command
+        self.assertEqual(status.remaining_iterations,0)
+        self.assertTrue(status.completed)                                           #so completion is read from the iteration table
+        
+        status = SolutionFile(self.solution_file).run_status()
+        self.assertEqual(status.remaining_iterations,909)
+        self.assertFalse(status.completed)
+
+    def test_run_status_cache(self):
+
+        with open('test-files\\test\\difficult_solution.trn','r') as file:
+            text = file.read()
+        
+        with tempfile.TemporaryDirectory() as folder:
+            live_file = os.path.join(folder,'Solution.trn')
+            with open(live_file,'w') as file:
+                file.write(text[0:len(text)//2])
+            
+            sfile = SolutionFile(live_file)
+            self.assertFalse(sfile.STATUS)
+            self.assertFalse(os.path.exists(sfile.status_file))                     #not cached on disk unless requested
+            self.assertFalse(sfile.run_status(cache = True).completed)
+            self.assertTrue(os.path.exists(sfile.status_file))
+            
+            with open(live_file,'a') as file:                                       #only the appended text is scanned
+                file.write(text[len(text)//2:])
+            
+            self.assertEqual(SolutionFile(live_file).run_status(cache = True),SolutionFile(live_file).run_status())
+            self.assertTrue(SolutionFile(live_file).STATUS)
+            
+            with open(live_file,'a') as file:
+                file.write('Divergence detected in AMG solver: k\n')
+            
+            self.assertEqual(sfile.run_status().termination_reason,'diverged')
+            self.assertEqual(sfile.run_status(cache = True).termination_reason,'diverged')
+
+            with open(live_file,'w') as file:                                       #overwritten by a restarted run
+                file.write('> solve/iterate 10\n')
+
+            status = sfile.run_status(cache = True)
+            self.assertEqual(status.requested_iterations,10)
+            self.assertFalse(status.diverged)
+            status = sfile.run_status()
+            self.assertEqual(status.requested_iterations,10)
+            self.assertFalse(status.diverged)
+
+class FluentFilesTests(unittest.TestCase):
+
+    solution_files = [SolutionFileTests.solution_file,SolutionFileTests.solution_file2,
+                      'test-files\\test\\difficult_solution.trn']
+    report_files = [ReportFileTests.test_file_name,'test-files\\test\\report-file-0.out']
+
+    def assertFramesEqual(self,files,check_files):
+
+        self.assertListEqual(sorted(files.columns),sorted(check_files.columns))
+        for key in files.keys:
+            self.assertTrue(files.frames[key].equals(check_files.frames[key]))
+            self.assertTrue(files[key].df.equals(check_files.frames[key]))
+
+    def test_solution_files_pool(self):
+        
+        check_files = SolutionFiles(self.solution_files,max_workers = 1)
+        check_files.load()
+        for parser in SolutionFile.PARSERS:
+            for pool in ['thread','process']:
+                files = SolutionFiles(self.solution_files,max_workers = 2,pool = pool,parser = parser)
+                files.load()
+                self.assertEqual(files[self.solution_files[0]].parser,parser)       #the parser is passed to the pool
+                self.assertFramesEqual(files,check_files)                           #same as parsing sequentially
+
+    def test_report_files_pool(self):
+
+        check_files = ReportFilesOut(self.report_files,max_workers = 1)
+        check_files.load()
+        for pool in ['thread','process']:
+            files = ReportFilesOut(self.report_files,max_workers = 2,pool = pool)
+            files.load()
+            self.assertFramesEqual(files,check_files)
+            self.assertTrue(files.readdf().equals(check_files.readdf()))
+
 class TestPostOutputFile(unittest.TestCase): 
 
     file = 'test-files\\test\\yplus_and_htc_data.csv'
@@ -114,6 +395,16 @@ class TestXYOutputFile(unittest.TestCase):
                 checkdf = pd.read_pickle(self.check_file.format(key))
                 self.assertLess(np.linalg.norm(np.array(df,dtype = float) - np.array(checkdf,dtype = float)),DIFF_TOL)
 
+    def test_random_access(self):
+
+        xydf = XYDataFile(self.file)
+        for key in xydf.keys():                                                     #series read from the offset index only
+            df = xydf[key]
+            checkdf = pd.read_pickle(self.check_file.format(key))
+            self.assertLess(np.linalg.norm(np.array(df,dtype = float) - np.array(checkdf,dtype = float)),DIFF_TOL)
+        
+        self.assertIsNone(xydf.df)
+
 class TestSurfacePointFile(unittest.TestCase):
 
     create_file = 'test-files\\check\\test_surface_point_file.spf'
@@ -173,6 +464,87 @@ class TestSphereSliceFile(unittest.TestCase):
         check = pd.read_pickle(self.check_output).to_numpy()
         self.assertLess(np.linalg.norm(df.to_numpy()- check),DIFF_TOL)
 
+    def write_output(self,fname: str,
+                          sizes = [5,1,12,7,30,2]) -> pd.DataFrame:
+        """
+        write a sphere slice output file with spheres of sizes cells, the cellnumber
+        restarting at 1 on each sphere as written by fluent
+        """
+        rng = np.random.default_rng(3)
+        n = sum(sizes)
+        df = pd.DataFrame({'x-coordinate': rng.normal(size = n),
+                           'y-coordinate': rng.normal(size = n),
+                           'z-coordinate': rng.normal(size = n),
+                           'temperature': 300.0 + 100.0*rng.random(n),
+                           'cell-area': rng.random(n) + 0.1},
+                          index = pd.Index(np.concatenate([np.arange(1,size + 1) for size in sizes]),
+                                           name = 'cellnumber'))
+        
+        df.to_csv(fname,float_format = '%.9E')
+        return df
+    
+    def group_statistic(self,df: pd.DataFrame,
+                             statistic: str) -> pd.DataFrame:
+        """
+        the statistic of the temperature on each sphere from a pandas groupby
+        """
+        grouped = df.groupby(np.cumsum(df.index == 1))
+        center = grouped[['x-coordinate','y-coordinate','z-coordinate']].mean()
+        if statistic == 'weighted-mean':
+            value = grouped.apply(lambda g: np.average(g['temperature'],weights = g['cell-area']))
+        elif statistic == 'p95':
+            value = grouped['temperature'].quantile(0.95)
+        else:
+            value = grouped['temperature'].agg(statistic)
+        
+        return center.assign(temperature = value).reset_index(drop = True)
+
+    def test_iter_surfaces(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            output_file = os.path.join(folder,'test_output.ssf.so')
+            self.write_output(output_file)
+            with SphereSliceFile(output_file) as ssf:
+                surface_list = ssf.get_surface_list()
+                check = ssf.get_sphere_surface_data(np.mean)
+            
+            ssf = SphereSliceFile(output_file)
+            streamed = list(ssf.iter_surfaces(chunksize = 7))                       #small chunks so surfaces span multiple chunks
+            self.assertEqual(len(streamed),len(surface_list))
+            for df,check_df in zip(streamed,surface_list):
+                self.assertTrue(df.equals(check_df))
+            
+            df = ssf.get_sphere_surface_data(np.mean,stream = True,chunksize = 7)
+        
+        self.assertLess(np.linalg.norm(df.to_numpy()- check.to_numpy()),DIFF_TOL)
+
+    def test_sphere_surface_statistics(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            output_file = os.path.join(folder,'test_output.ssf.so')
+            written = self.write_output(output_file)
+            percentile = lambda array,axis: np.percentile(array,95,axis = axis)    #not recognized, applied to each sphere
+            with SphereSliceFile(output_file) as ssf:
+                df = ssf.readdf()
+                data = ssf.get_sphere_surface_statistics([np.max,'p95','min','std',percentile])
+                weighted = ssf.get_sphere_surface_data('mean',weights = 'cell-area')
+                streamed = ssf.get_sphere_surface_data('mean',weights = 'cell-area',stream = True,chunksize = 7)
+        
+        self.assertLess(np.linalg.norm(df.to_numpy() - written.to_numpy()),1e-6*np.abs(written.to_numpy()).max())
+        columns = ['x-coordinate','y-coordinate','z-coordinate','temperature']
+        for statistic,check in [(np.max,'max'),('p95','p95'),('min','min'),(percentile,'p95')]:
+            self.assertListEqual(list(data[statistic].columns),columns + ['cell-area'])
+            check_df = self.group_statistic(df,check)
+            self.assertLess(np.linalg.norm(data[statistic][columns].to_numpy() - check_df.to_numpy()),DIFF_TOL)
+        
+        check_std = df.groupby(np.cumsum(df.index == 1))['temperature'].std(ddof = 0).to_numpy()
+        self.assertLess(np.linalg.norm(data['std']['temperature'].to_numpy() - check_std),DIFF_TOL)
+
+        self.assertListEqual(list(weighted.columns),columns)                           #the weights are not reported
+        check_df = self.group_statistic(df,'weighted-mean')
+        self.assertLess(np.linalg.norm(weighted.to_numpy() - check_df.to_numpy()),DIFF_TOL)
+        self.assertLess(np.linalg.norm(streamed.to_numpy() - check_df.to_numpy()),DIFF_TOL)
+
 class TestSurfaceIntegralFile(unittest.TestCase):
 
     test_file = 'test-files\\test\\surface_integral_file_test.sif'
@@ -1,6 +1,7 @@
 from unittest import TestCase,main
-from fluentpy.batch.table_parse import _parse_udf_from_str
+from fluentpy.batch.table_parse import _parse_udf_from_str,partition_boundary_table,make_boundary_condition_from_series
 from fluentpy.tui import WallBoundaryCondition
+import pandas as pd
 
 class TestUDFStringParse(TestCase):
 
@@ -15,5 +16,43 @@ class TestUDFStringParse(TestCase):
 
         print(wall())
 
+class TestPartitionBoundaryTable(TestCase):
+
+    def make_table(self) -> pd.DataFrame:
+
+        return pd.DataFrame({'outlet:pressure:pressure-outlet': [1e6,2e6,1e6,'2e6'],
+                             'outlet:turb_intensity:pressure-outlet': [5,5,5,5],
+                             'outlet:turb_hydraulic_diam:pressure-outlet': [0.01,0.01,0.01,0.01],
+                             'inlet:mass_flow:mass-flow-inlet': [0.1,0.2,0.1,0.2],
+                             'inlet:turb_intensity:mass-flow-inlet': [5,5,5,5],
+                             'inlet:turb_hydraulic_diam:mass-flow-inlet': [0.01,0.01,0.01,0.01],
+                             'inlet:temperature:mass-flow-inlet': [300,300,300,300],
+                             'wall:convective_heat_transfer_coefficient:wall': ['<test.c#convection_coefficient#udf#HTC::LIBUDF>']*4})
+
+    def test_row_construction(self):
+        
+        df = self.make_table()
+        bdf = partition_boundary_table(df,'ke-standard')
+        self.assertListEqual(list(bdf.columns),['outlet:pressure-outlet','inlet:mass-flow-inlet','wall:wall'])
+        
+        #same boundary conditions as those made from each row
+        for i in df.index:
+            for name in bdf.columns:
+                _name,btype = name.split(':')
+                cols = [c for c in df.columns if c.startswith(_name + ':')]
+                row = df.loc[i,cols]
+                row.index = [c.split(':')[1] for c in cols]
+                bc = make_boundary_condition_from_series(btype,_name,row.to_dict(),{c: c for c in row.index},
+                                                         'ke-standard',['energy','viscous'])
+                self.assertEqual(bdf.loc[i,name](),bc())
+
+    def test_shared_rows(self):
+
+        bdf = partition_boundary_table(self.make_table(),'ke-standard')
+        self.assertIs(bdf.loc[0,'inlet:mass-flow-inlet'],bdf.loc[2,'inlet:mass-flow-inlet'])
+        self.assertIsNot(bdf.loc[0,'inlet:mass-flow-inlet'],bdf.loc[1,'inlet:mass-flow-inlet'])
+        self.assertIs(bdf.loc[1,'outlet:pressure-outlet'],bdf.loc[3,'outlet:pressure-outlet'])
+        self.assertEqual(len(set(id(bc) for bc in bdf['wall:wall'])),1)
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
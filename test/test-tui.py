@@ -1,11 +1,15 @@
 from multiprocessing.sharedctypes import Value
 from fluentpy.tui import MeshScale, TempCaseIO, WallBoundaryCondition,UDF,MassFlowInlet,PressureOutlet,Solver,Solver_Iterator,\
                                 FluentJournal,ConvergenceConditions,Discritization,NISTRealGas,ScalarRelaxation,\
-                                EquationRelaxation, VelocityInlet,MeshRotation, MeshTranslation, TUIBase, SurfaceIntegralFile
+                                EquationRelaxation, VelocityInlet,MeshRotation, MeshTranslation, TUIBase, SurfaceIntegralFile,\
+                                SurfaceIntegrals,FluentEnginePool,FluentJournal,JournalTemplate,BatchCaseReader
 from fluentpy.util import _surface_construction_arg_validator
 
 from unittest import TestCase,main
 import shutil
+import tempfile
+import sys
+import os
 
 """
 -- Creation -- 
@@ -284,5 +288,59 @@ class TestTuiBaseClass(TestCase):
 
 
     
+class TestFluentEnginePool(TestCase):
+
+    fake_fluent = 'fake_fluent.py'
+
+    def test_pooled_surface_integrals(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            case_files = []
+            for i in range(4):
+                os.mkdir(os.path.join(folder,str(i)))
+                case_files.append(os.path.join(folder,str(i),'result.cas'))
+            
+            def surface_integral(case_file):
+                si = SurfaceIntegrals(case_file,[[10,11],12],['temperature','temperature'],
+                                      ['area-weighted-avg','vertex-max'],engine = pool)
+                return [sif.read() for sif in si()]
+
+            with FluentEnginePool(2,command = [sys.executable,os.path.abspath(self.fake_fluent)],timeout = 30) as pool:
+                results = pool.map(surface_integral,case_files)
+                self.assertTrue(all(session.alive for session in pool.sessions))       #sessions persist between cases
+            
+            self.assertEqual(len(results),4)
+            for attrs in results:
+                self.assertListEqual([attr['value'] for attr in attrs],[[12.0,12.0],[10.0,11.0,11.0]])
+
+class TestJournalTemplate(TestCase):
+
+    class CountingBoundaryCondition:
+
+        def __init__(self,name: str):
+            self.name = name
+            self.calls = 0
+        
+        def __call__(self):
+            self.calls += 1
+            return '/define/boundary-conditions/' + self.name + '\n'
+
+    def test_journals(self):
+
+        wall = self.CountingBoundaryCondition('wall')
+        inlets = [self.CountingBoundaryCondition('inlet-{}'.format(i)) for i in range(3)]
+        template = JournalTemplate(FluentJournal('test.cas',reader = BatchCaseReader))
+        journals = [template.journal([wall,inlet],pwd = 'test-{}'.format(i)) for i,inlet in enumerate(inlets)]
+
+        for i,journal in enumerate(journals):
+            check = FluentJournal('test.cas',reader = BatchCaseReader)
+            check.reader.pwd = 'test-{}'.format(i)
+            check.boundary_conditions = [wall,inlets[i]]
+            self.assertEqual(journal(),check())
+        
+        self.assertEqual(wall.calls,3 + 1)                                  #once for the template, once per check
+        self.assertTrue(all(inlet.calls == 2 for inlet in inlets))
+        self.assertNotIn('journal_template',journals[0]._dict_representation())
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
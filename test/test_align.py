@@ -0,0 +1,73 @@
+from fluentpy.batch.align import RaggedSeries,nan_statistic
+
+from unittest import TestCase,main
+import pandas as pd
+import numpy as np
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the alignment of the ragged histories of the cases of a batch
+"""
+
+class TestRaggedSeries(TestCase):
+
+    def make_series(self) -> dict:
+
+        return {'test-0': pd.Series([1.0,2.0,3.0,4.0],index = [1,2,3,4]),
+                'test-1': pd.Series([10.0,20.0],index = [1,3]),
+                'test-2': ([2,3,4,5,6],[0.5,0.4,0.3,0.2,0.1])}
+
+    def test_pack(self):
+
+        series = RaggedSeries(self.make_series())
+        self.assertListEqual(series.index.tolist(),[1,2,3,4,5,6])
+        self.assertEqual(series.shape,(6,3))
+        
+        check = pd.concat([s if isinstance(s,pd.Series) else pd.Series(s[1],index = s[0]) 
+                           for s in self.make_series().values()],axis = 1)
+        np.testing.assert_array_equal(series.values,check.to_numpy())              #same as aligning with pandas
+        self.assertListEqual(series.counts().tolist(),[2,2,3,2,1,1])
+        self.assertListEqual(series.lengths().tolist(),[4,2,5])
+        self.assertListEqual(series.last().tolist(),[4.0,20.0,0.1])
+
+    def test_envelope(self):
+
+        series = RaggedSeries(self.make_series())
+        lower,upper,center = series.envelope()
+        self.assertListEqual(lower.tolist(),[1.0,0.5,0.4,0.3,0.2,0.1])
+        self.assertListEqual(upper.tolist(),[10.0,2.0,20.0,4.0,0.2,0.1])
+        self.assertAlmostEqual(center[2],(3.0 + 20.0 + 0.4)/3.0)
+
+        q1,median,q2 = series.envelope(0.25,'median',0.75)
+        np.testing.assert_allclose(median,np.nanmedian(series.values,axis = 1))
+        np.testing.assert_allclose(q1,np.nanquantile(series.values,0.25,axis = 1))
+        self.assertTrue(np.all(q1 <= q2))
+
+        with self.assertRaises(ValueError):
+            series.envelope('mode')
+
+    def test_from_frames(self):
+
+        frames = {'test-0': pd.DataFrame({'energy': [1.0,0.1],'k': [2.0,0.2]},index = [1,2]),
+                  'test-1': pd.DataFrame({'energy': [1.0,0.5,0.01]},index = [1,2,3])}
+        
+        aligned = RaggedSeries.from_frames(frames,['energy','k'],ignore_missing = True)
+        self.assertEqual(aligned['energy'].shape,(3,2))
+        self.assertListEqual(aligned['k'].names,['test-0'])
+        with self.assertRaises(KeyError):
+            RaggedSeries.from_frames(frames,['k'])
+
+    def test_empty(self):
+
+        series = RaggedSeries({'test-0': ([],[])})
+        self.assertEqual(series.shape,(0,1))
+        self.assertTrue(np.isnan(series.last()[0]))
+        self.assertIs(nan_statistic(np.max),np.nanmax)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+from fluentpy.batch.submit import PaceBatchSubmission,PaceFluentSubmission
+from fluentpy.batch.fluent import FluentSlurm,FluentArrayScript
+from fluentpy.tui import FluentJournal,BatchCaseReader
+from fluentpy.pace import BulkStatusOutput,BatchMonitor,array_job_id,array_task_id
+
+from unittest import TestCase,main
+import tempfile
+import sys
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the submission of a batch as the tasks of a single array job
+"""
+
+def make_slurm(name = 'test') -> FluentSlurm:
+
+    return FluentSlurm(name = name,
+                       WALLTIME = 6*60*60,
+                       N_PROCESSORS= 4,
+                       MEMORY= 4,
+                       version = '2021R1',
+                       specification= '2ddp',
+                       account = 'GT-my14-paid')
+
+class TestFluentArrayScript(TestCase):
+
+    def test_format_call(self):
+
+        array_script = FluentArrayScript(make_slurm(),['case-0','case-1','case-2'],
+                                         max_concurrent = 2,name = 'array')
+        text = array_script()
+        self.assertIn('#SBATCH  -Jarray\n',text)
+        self.assertIn('#SBATCH  --array=0-2%2\n',text)
+        self.assertIn('FOLDER=$(sed -n "$(($SLURM_ARRAY_TASK_ID + 1))p" array_folders.txt)\ncd $FOLDER\n',text)
+        self.assertLess(text.index('cd $FOLDER'),text.index('fluent 2ddp'))
+
+class TestPaceArraySubmission(TestCase):
+
+    num_cases = 3
+
+    def test_generate_submission(self):
+
+        if sys.platform != 'win32':
+            self.skipTest('journal files are written with windows paths')
+
+        submissions = []
+        for i in range(self.num_cases):
+            journal = FluentJournal('test.cas',reader = BatchCaseReader)
+            submissions.append(PaceFluentSubmission(journal,make_slurm('test-{}'.format(i))))
+
+        batch = PaceBatchSubmission(submissions,prefix = 'test',array = True,max_concurrent = 2)
+        with tempfile.TemporaryDirectory() as folder:
+            batch.generate_submission(folder)
+
+            folders = ['test-{}'.format(i) for i in range(self.num_cases)]
+            with open(os.path.join(folder,'array_folders.txt'),'r') as file:
+                self.assertListEqual(file.read().split(),folders)
+
+            for f in folders:                                              #only the journal in the task folders
+                self.assertListEqual(sorted(os.listdir(os.path.join(folder,f))),['.folderhash','fluent.input'])
+
+            with open(os.path.join(folder,batch.BATCH_EXE_FNAME),'r') as file:
+                text = file.read()
+
+            self.assertEqual(text.count('sbatch'),1)                        #submitted once
+            self.assertIn('ID=$(sbatch --parsable fluent_array.pbs)\n',text)
+            self.assertIn('echo "$FOLDER,${ID}_$i" >> jobid.txt\n',text)
+
+            with open(os.path.join(folder,'batch_deploy.py'),'r') as file:
+                self.assertIn("array_file = 'fluent_array.pbs'",file.read())
+
+class TestArrayResubmission(TestCase):
+
+    def test_format_submit(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            with open(os.path.join(folder,'array_folders.txt'),'w') as file:
+                file.write('test-0\ntest-1\ntest-2\n')
+
+            monitor = BatchMonitor('solution.trn','fluent.pbs',backend = 'sbatch',root = folder,
+                                   array_file = 'fluent_array.pbs',verbose = False)
+            self.assertEqual(monitor.format_submit('test-2'),'sbatch --array=2 fluent_array.pbs')
+        
+        monitor = BatchMonitor('solution.trn','fluent.pbs',backend = 'qsub',verbose = False)
+        self.assertEqual(monitor.format_submit('test-2'),'qsub fluent.pbs')
+
+    def test_qsub_array(self):
+
+        with self.assertRaises(ValueError):                                 #PBS array tasks cannot be resubmitted alone
+            BatchMonitor('solution.trn','fluent.pbs',backend = 'qsub',array_file = 'fluent_array.pbs')
+        
+        with self.assertRaises(ValueError):
+            PaceBatchSubmission([],submit_command = 'qsub',array = True)
+
+class TestArrayJobStatus(TestCase):
+
+    def test_array_ids(self):
+
+        self.assertEqual(array_job_id('1234_5'),'1234')
+        self.assertEqual(array_job_id('1234[5]'),'1234[]')
+        self.assertEqual(array_job_id('1234'),'1234')
+        self.assertEqual(array_task_id('1234',5),'1234_5')
+        self.assertEqual(array_task_id('1234[]',5),'1234[5]')
+
+    def test_task_status(self):
+
+        output = BulkStatusOutput('1234_0 RUNNING\n1234_1 PENDING\n',['1234_0','1234_1','1234_2'],
+                                  missing_state = 'Completed')
+        output.parse_output()
+        self.assertDictEqual(output.json_data,{'1234_0': 'Running','1234_1': 'Queued','1234_2': 'Completed'})
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+from fluentpy.pace import AsyncPaceCommand,AsyncPaceCommunication,AsyncPaceRunner,CheckJobOutput
+
+from unittest import TestCase,main
+import asyncio
+import tempfile
+import sys
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the asynchronous PACE communication, using a python command that
+writes the checkjob output used by the other pace tests
+"""
+
+class CatCheckJobCommand(AsyncPaceCommand):
+
+    def __init__(self,count_file: str,
+                      delay = 0.0):
+
+        super().__init__()
+        self.count_file = count_file
+        self.delay = delay
+    
+    def __str__(self) -> str:
+        #log the call, wait and then write the output of checkjob
+        code = 'import time;open(r"{}","a").write("1");time.sleep({});print(open(r"{}").read())'.format(
+                self.count_file,self.delay,os.path.abspath('pace-files/checkjob_output.txt'))
+        return '"{}" -c \'{}\''.format(sys.executable,code)
+
+class AsyncCheckJobTests(TestCase):
+
+    def test_coalesced_status(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            count_file = os.path.join(folder,'count')
+            async def check_jobs():
+                runner = AsyncPaceRunner(max_concurrent = 4)
+                communication = [AsyncPaceCommunication(count_file,0.2,pace_command = CatCheckJobCommand,
+                                                        pace_out = CheckJobOutput,runner = runner) for _ in range(50)]
+                return await asyncio.gather(*[c() for c in communication])
+            
+            statuses = asyncio.run(check_jobs())
+            with open(count_file,'r') as file:
+                self.assertEqual(file.read(),'1')                                   #one process for all of the queries
+
+        self.assertListEqual([status['State'] for status in statuses],['Running']*50)
+    
+    def test_timeout(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            async def check_job():
+                runner = AsyncPaceRunner(timeout = 0.2)
+                return await AsyncPaceCommunication(os.path.join(folder,'count'),5.0,pace_command = CatCheckJobCommand,
+                                                    pace_out = CheckJobOutput,runner = runner)()
+            
+            with self.assertRaises(TimeoutError):
+                asyncio.run(check_job())
+
+if __name__ == '__main__':
+    main()
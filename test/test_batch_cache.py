@@ -0,0 +1,86 @@
+from fluentpy.batch.submit import BatchCache,PaceFluentSubmission
+from fluentpy.batch.fluent import FluentSlurm
+from fluentpy.tui import FluentJournal,BatchCaseReader
+
+from unittest import TestCase,main
+import pandas as pd
+import tempfile
+import sqlite3
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the single file batch cache
+"""
+
+def make_submission(processors: int) -> PaceFluentSubmission:
+
+    slurm = FluentSlurm(name = 'test',
+                        WALLTIME = 6*60*60,
+                        N_PROCESSORS= processors,
+                        MEMORY= 4,
+                        version = '2021R1',
+                        specification= '2ddp',
+                        account = 'GT-my14-paid')
+
+    return PaceFluentSubmission(FluentJournal('test.cas',reader = BatchCaseReader),slurm)
+
+class TestBatchCache(TestCase):
+
+    num_cases = 6
+
+    def make_cache(self,folder: str) -> dict:
+
+        submission_object = {'test-{}'.format(i): make_submission(1 + i % 2) for i in range(self.num_cases)}
+        df = pd.DataFrame({'temperature': [300.0 + i for i in range(self.num_cases)]})
+        BatchCache(folder).cache_batch(submission_object,df,prefix = 'test',seperator = '-')
+        return submission_object
+
+    def test_single_file(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            self.make_cache(folder)
+            batch_cache = BatchCache(folder)
+            self.assertListEqual(os.listdir(batch_cache.batch_cache),[BatchCache._STORE_FILE])
+
+            with sqlite3.connect(batch_cache.store) as conn:
+                deltas = dict(conn.execute('SELECT folder,length(delta) FROM submissions').fetchall())
+                template = conn.execute("SELECT length(value) FROM meta WHERE key = 'template'").fetchone()[0]
+
+            self.assertTrue(all(delta < template for delta in deltas.values()))
+            self.assertEqual(deltas['test-0'],deltas['test-2'])                    #same as the template
+
+    def test_read(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            submission_object = self.make_cache(folder)
+            batch_cache = BatchCache(folder)
+            self.assertListEqual(batch_cache.folders(),list(submission_object.keys()))
+
+            submissions = batch_cache.read_submission_object_cache()
+            for key,submission in submissions.items():
+                self.assertIsInstance(submission,PaceFluentSubmission)
+                self.assertEqual(submission.fluent_pbs(),submission_object[key].fluent_pbs())
+
+            self.assertDictEqual(batch_cache.read_formatting_cache(),{'prefix': 'test','seperator': '-'})
+            self.assertListEqual(list(batch_cache.read_df_cache()['temperature']),
+                                 [300.0 + i for i in range(self.num_cases)])
+
+    def test_lazy_read(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            submission_object = self.make_cache(folder)
+            submissions = BatchCache(folder).read_submission_object_cache(lazy = True)
+            self.assertEqual(len(submissions),self.num_cases)
+            self.assertEqual(submissions['test-3'].fluent_pbs.N_PROCESSORS,2)
+            self.assertIs(submissions['test-3'],submissions['test-3'])
+            with self.assertRaises(KeyError):
+                submissions['test-{}'.format(self.num_cases)]
+
+if __name__ == '__main__':
+    main()
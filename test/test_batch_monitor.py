@@ -0,0 +1,87 @@
+from fluentpy.pace import BatchMonitor,BulkStatusOutput
+
+from unittest import TestCase,main
+import tempfile
+import json
+import sys
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the bulk status parsing and the event driven batch monitor,
+using fake_scheduler.py in place of slurm
+"""
+
+#the first attempt in each folder "fails" to start fluent and writes no solution file
+RUN_SCRIPT = """if [ -f attempt ]; then
+    touch solution.trn
+else
+    touch attempt
+fi
+"""
+
+class TestBulkStatusOutput(TestCase):
+
+    def test_squeue(self):
+
+        output = BulkStatusOutput('1234 RUNNING\n1235 PENDING\n',['1234','1235','1236'],
+                                  missing_state = 'Completed')
+        output.parse_output()
+        self.assertDictEqual(output.json_data,{'1234': 'Running','1235': 'Queued','1236': 'Completed'})
+
+    def test_qstat(self):
+
+        output = BulkStatusOutput('Job id  Name  User  Time Use S Queue\n' +
+                                  '1234.sched  fluent  user  00:01:00 R batch\n' +
+                                  '1235.sched  fluent  user  0 F batch\n',['1234','1235'],
+                                  columns = (0,4))
+        output.parse_output()
+        self.assertDictEqual(output.json_data,{'1234': 'Running','1235': 'Completed'})
+
+class TestBatchMonitor(TestCase):
+
+    fake_scheduler = 'fake_scheduler.py'
+    num_jobs = 5
+
+    def test_resubmission(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            state_file = os.path.join(folder,'scheduler.json')
+            scheduler = '"{}" "{}" "{}"'.format(sys.executable,os.path.abspath(self.fake_scheduler),state_file)
+            monitor = BatchMonitor('solution.trn','run.sh',
+                                   backend = scheduler + ' submit',
+                                   cancel_command = scheduler + ' cancel',
+                                   scheduler = 'squeue',
+                                   query = {'command': scheduler + ' status {jobids}'},
+                                   check_time = 0.0,
+                                   root = folder,
+                                   sleep = lambda t: None,
+                                   verbose = False)
+
+            with open(os.path.join(folder,BatchMonitor.JOB_FILE),'w') as jobfile:
+                for i in range(self.num_jobs):
+                    os.mkdir(os.path.join(folder,str(i)))
+                    with open(os.path.join(folder,str(i),'run.sh'),'w') as file:
+                        file.write(RUN_SCRIPT)
+
+                    jobfile.write('{},{}\n'.format(i,monitor.submit(str(i))))
+
+            jobs = monitor.run(max_polls = 10)
+            self.assertTrue(monitor.done)
+            self.assertDictEqual(monitor.resubmissions,{str(i): 1 for i in range(self.num_jobs)})
+            for i in range(self.num_jobs):
+                self.assertTrue(os.path.exists(os.path.join(folder,str(i),'solution.trn')))
+
+            with open(state_file,'r') as file:
+                state = json.load(file)
+
+            self.assertEqual(state['queries'],2)                                    #one query per poll for all jobs
+            self.assertDictEqual(monitor.read_jobs(force = True),jobs)
+
+if __name__ == '__main__':
+    main()
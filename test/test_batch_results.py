@@ -0,0 +1,110 @@
+from fluentpy.batch.results import BatchResults
+from fluentpy.batch.submit import BatchCache
+
+from unittest import TestCase,main
+import pandas as pd
+import tempfile
+import shutil
+import time
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the batch-wide results store
+"""
+
+REPORT_FILE = os.path.join('test-files','test','report-file-0.out')
+SOLUTION_FILE = os.path.join('test-files','test','difficult_solution.trn')
+SURFACE_INTEGRAL_FILE = os.path.join('test-files','test','surface_integral_file_test.sif')
+
+def write_report_file(fname: str,
+                      max_temp: float) -> None:
+
+    with open(REPORT_FILE,'r') as file:
+        lines = file.readlines()
+    
+    values = lines[-1].split()
+    values[3] = str(max_temp)
+    with open(fname,'w') as file:
+        file.write(''.join(lines[:-1]) + ' '.join(values) + '\n')
+
+def write_surface_export(fname: str) -> None:
+    """
+    a small surface export (.so) file, written here as .so files are not tracked
+    """
+    with open(fname,'w') as file:
+        file.write('cellnumber,    x-coordinate,    y-coordinate,    z-coordinate,     temperature\n')
+        for i,temperature in enumerate([360.0,365.0,370.0]):
+            file.write('{:>10d}, {:.9E}, {:.9E}, {:.9E}, {:.9E}\n'.format(i + 1,0.1*i,0.0,0.0,temperature))
+
+class TestBatchResults(TestCase):
+
+    num_cases = 3
+
+    def make_batch(self,folder: str) -> None:
+
+        batch_cache = BatchCache(folder)
+        batch_cache.cache_df(pd.DataFrame({'inlet:temperature:mass-flow-inlet': [300.0,310.0,320.0]}))
+        batch_cache.cache_batch_formatting({'prefix': 'test','seperator': '-'})
+        for i in range(self.num_cases):
+            case = os.path.join(folder,'test-{}'.format(i))
+            os.mkdir(case)
+            write_report_file(os.path.join(case,'report-file-0.out'),500.0 + 100*i)
+            shutil.copy(SURFACE_INTEGRAL_FILE,os.path.join(case,'vertex-temp.srp'))
+        
+        shutil.copy(SOLUTION_FILE,os.path.join(folder,'test-0','Solution.trn'))
+        write_surface_export(os.path.join(folder,'test-0','test_output.so'))
+
+    def test_update(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            self.make_batch(folder)
+            results = BatchResults(folder,workers = 2)
+            self.assertListEqual(results.update(),['test-0','test-1','test-2'])
+            self.assertListEqual(results.update(),[])                               #nothing changed
+            self.assertIn('max-temp',results.variables())
+            self.assertIn('test_output:temperature:mean',results.variables())
+            self.assertEqual(results.query(columns = ['test_output:temperature:max']).loc['test-0','test_output:temperature:max'],370.0)
+
+            time.sleep(0.01)
+            write_report_file(os.path.join(folder,'test-2','report-file-0.out'),1000.0)
+            os.remove(os.path.join(folder,'test-1','vertex-temp.srp'))
+            self.assertListEqual(results.update(),['test-1','test-2'])
+            
+            df = results.query(columns = ['max-temp','vertex-temp:cool-surf1'])
+            self.assertListEqual(df['max-temp'].tolist(),[500.0,600.0,1000.0])
+            self.assertTrue(pd.isnull(df.loc['test-1','vertex-temp:cool-surf1']))
+
+    def test_query(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            self.make_batch(folder)
+            results = BatchResults(folder)
+            results.update()
+
+            df = results.query(columns = ['inlet:temperature:mass-flow-inlet','max-temp'],
+                               where = [('max-temp','>',550.0)])
+            self.assertListEqual(list(df.columns),['inlet:temperature:mass-flow-inlet','max-temp'])
+            self.assertListEqual(list(df.index),['test-1','test-2'])
+            self.assertListEqual(df['inlet:temperature:mass-flow-inlet'].tolist(),[310.0,320.0])
+
+            df = results.query(columns = ['max-temp'],
+                               where = [('inlet:temperature:mass-flow-inlet','<=',310.0),('max-temp','!=',500.0)])
+            self.assertListEqual(list(df.index),['test-1'])
+
+            df = results.query(columns = ['completed','termination_reason','executed_iterations'],
+                               where = [('completed','==',True)])
+            self.assertListEqual(list(df.index),['test-0'])
+            self.assertEqual(df.loc['test-0','termination_reason'],'iterations')
+            self.assertEqual(df.loc['test-0','executed_iterations'],1300)
+
+            with self.assertRaises(ValueError):
+                results.query(where = [('max-temp','=>',550.0)])
+
+if __name__ == '__main__':
+    main()
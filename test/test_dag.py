@@ -0,0 +1,103 @@
+from fluentpy.batch.dag import JobGraph,DryRunBackend,PBSBackend
+from fluentpy.batch.pbs import PythonPBS
+from fluentpy.pace import PaceScript
+
+from unittest import TestCase,main
+import tempfile
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the dependency graph submission with the dry run backend
+"""
+
+class TestJobGraph(TestCase):
+
+    script = 'test-files/test/pace_hw.py'
+
+    def make_graph(self) -> JobGraph:
+        
+        graph = JobGraph(backend = DryRunBackend())
+        for i in range(2):
+            graph.add_job('fluent-{}'.format(i),PythonPBS(PaceScript(self.script,None)),retries = 1)
+            graph.add_job('mechanical-{}'.format(i),PythonPBS(PaceScript(self.script,None)),
+                          depends_on = ['fluent-{}'.format(i)],retries = 1)
+        
+        graph.add_job('post',PythonPBS(PaceScript(self.script,None)),depends_on = ['mechanical-0','mechanical-1'])
+        return graph
+
+    def test_native_dependencies(self):
+
+        graph = self.make_graph()
+        with tempfile.TemporaryDirectory() as folder:
+            jobids = graph.submit(folder)
+            for name in graph.nodes:
+                self.assertTrue(os.path.exists(os.path.join(folder,name,'python.pbs')))
+        
+        commands = [command for command,_ in graph.backend.commands]
+        self.assertEqual(commands[-1],'sbatch --parsable --dependency=afterok:{}:{} python.pbs'.format(
+                         jobids['mechanical-0'],jobids['mechanical-1']))
+        self.assertEqual(PBSBackend().format_submit('fluent.pbs',['1','2']),'qsub -W depend=afterok:1:2 fluent.pbs')
+    
+    def test_retry_and_partial_failure(self):
+
+        graph = self.make_graph()
+        states = graph.backend.states
+        with tempfile.TemporaryDirectory() as folder:
+            jobids = graph.submit(folder)
+            states[jobids['fluent-0']] = 'Failed'                                   #retried along with downstream jobs
+            states[jobids['fluent-1']] = 'Completed'
+            graph.update()
+        
+        self.assertNotEqual(graph.nodes['fluent-0'].jobid,jobids['fluent-0'])
+        self.assertNotEqual(graph.nodes['post'].jobid,jobids['post'])
+        self.assertEqual(graph.nodes['mechanical-1'].jobid,jobids['mechanical-1'])
+        
+        states[graph.nodes['fluent-0'].jobid] = 'Failed'                            #out of retries
+        states[jobids['mechanical-1']] = 'Completed'
+        self.assertDictEqual(graph.update(),{'fluent-0': 'Failed','mechanical-0': 'Skipped',
+                                             'fluent-1': 'Completed','mechanical-1': 'Completed',
+                                             'post': 'Skipped'})
+        self.assertTrue(graph.done)
+    
+    def test_retry_with_failed_branch(self):
+
+        graph = self.make_graph()
+        graph.nodes['mechanical-1'].retries = 0
+        states = graph.backend.states
+        with tempfile.TemporaryDirectory() as folder:
+            jobids = graph.submit(folder)
+            states[jobids['fluent-1']] = 'Completed'
+            states[jobids['mechanical-1']] = 'Failed'                               #out of retries
+            graph.update()
+            self.assertEqual(graph.nodes['post'].state,'Skipped')
+
+            states[jobids['fluent-0']] = 'Failed'                                   #retried, post stays skipped
+            graph.update()
+        
+        self.assertEqual(graph.nodes['post'].jobid,jobids['post'])
+        self.assertEqual(graph.nodes['post'].state,'Skipped')
+        self.assertNotEqual(graph.nodes['mechanical-0'].jobid,jobids['mechanical-0'])
+        
+        states[graph.nodes['fluent-0'].jobid] = 'Completed'
+        states[graph.nodes['mechanical-0'].jobid] = 'Completed'
+        self.assertDictEqual(graph.update(),{'fluent-0': 'Completed','mechanical-0': 'Completed',
+                                             'fluent-1': 'Completed','mechanical-1': 'Failed',
+                                             'post': 'Skipped'})
+        self.assertTrue(graph.done)
+
+    def test_cyclic(self):
+
+        graph = JobGraph(backend = DryRunBackend())
+        graph.add_job('a',PythonPBS(PaceScript(self.script,None)),depends_on = ['b'])
+        graph.add_job('b',PythonPBS(PaceScript(self.script,None)),depends_on = ['a'])
+        with self.assertRaises(ValueError):
+            graph.order()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+from fluentpy.batch.filesystem import FileSystemIndex,TableFileSystem
+from fluentpy.batch.submit import BatchSubmissionSummary
+
+from unittest import TestCase,main
+from pathlib import Path
+import tempfile
+import time
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the in memory index of the batch file system
+"""
+
+def make_batch(folder: str) -> None:
+
+    open(os.path.join(folder,'test.cas'),'w').close()
+    for i,files in enumerate([['test.dat','test.cas','solution.trn','report-file.out'],
+                              ['test.cas','solution.trn'],
+                              ['fluent.input']]):
+        os.mkdir(os.path.join(folder,'test-{}'.format(i)))
+        for f in files:
+            open(os.path.join(folder,'test-{}'.format(i),f),'w').close()
+    
+    os.mkdir(os.path.join(folder,'_batchcache_'))
+
+class TestFileSystemIndex(TestCase):
+
+    def test_find(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            make_batch(folder)
+            index = FileSystemIndex(folder,Path = Path)
+            self.assertListEqual(sorted(index.folders),['_batchcache_','test-0','test-1','test-2'])
+            self.assertListEqual(index.root_files,['test.cas'])
+            found = index.find('.trn')
+            self.assertListEqual(sorted(found),[Path(folder,'test-0'),Path(folder,'test-1')])
+            self.assertListEqual(found[Path(folder,'test-0')],[Path(folder,'test-0','solution.trn')])
+            self.assertListEqual(list(index.find('.out',tag = 'report-file')),[Path(folder,'test-0')])
+            self.assertDictEqual(index.find('.out',tag = 'other'),{})
+    
+    def test_refresh(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            make_batch(folder)
+            index = FileSystemIndex(folder,Path = Path)
+            self.assertListEqual(sorted(index.refresh()),['_batchcache_','test-0','test-1','test-2'])
+            self.assertListEqual(index.refresh(),[])                         #nothing changed
+            
+            time.sleep(0.01)
+            open(os.path.join(folder,'test-2','solution.trn'),'w').close()
+            self.assertListEqual(index.refresh(),['test-2'])
+            self.assertIn('.trn',index.suffixes('test-2'))
+
+    def test_query_after_change(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            make_batch(folder)
+            index = FileSystemIndex(folder,Path = Path)
+            self.assertListEqual(sorted(index.find('.trn')),[Path(folder,'test-0'),Path(folder,'test-1')])
+            
+            time.sleep(0.01)
+            open(os.path.join(folder,'test-2','solution.trn'),'w').close()       #created after the first query
+            self.assertIn('solution.trn',index.files('test-2'))
+            self.assertIn(Path(folder,'test-2'),index.find('.trn'))
+
+            os.mkdir(os.path.join(folder,'test-3'))                             #folder created after the first query
+            open(os.path.join(folder,'test-3','solution.trn'),'w').close()
+            self.assertIn('test-3',index.folders)
+            self.assertIn(Path(folder,'test-3'),index.find('.trn'))
+
+            with self.assertRaises(FileNotFoundError):
+                index.files('test-4')
+
+class TestTableFileSystem(TestCase):
+
+    def test_map_submit_folders(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            make_batch(folder)
+            fs = TableFileSystem(folder)
+            fs.map_submit_folders(check_contents = ['.dat'])
+            self.assertListEqual(fs.submission_folder_list,[fs.Path(folder,'test-0')])
+            fs.map_submit_folders()
+            self.assertListEqual(sorted(f.name for f in fs.submission_folder_list),['test-0','test-1','test-2'])
+            self.assertEqual(fs.case_file,fs.Path(folder,'test.cas'))
+
+    def test_summary(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            make_batch(folder)
+            summary = BatchSubmissionSummary(folder)
+            summary.get_folders_with_completed_solution = lambda: []
+            df = summary.make_summary()
+            self.assertListEqual([f.name for f in df.index],['test-0','test-1'])
+            self.assertListEqual(df['data'].tolist(),[True,False])
+            self.assertListEqual(df['case'].tolist(),[True,True])
+            self.assertListEqual(df['report'].tolist(),[True,False])
+            self.assertListEqual(df['completed'].tolist(),[False,False])
+
+if __name__ == '__main__':
+    main()
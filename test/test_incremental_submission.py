@@ -0,0 +1,127 @@
+from fluentpy.batch.submit import PaceBatchSubmission,PaceFluentSubmission,_link_file,_sync_folder
+from fluentpy.batch.fluent import FluentSlurm
+from fluentpy.tui import FluentJournal,BatchCaseReader
+
+from unittest import TestCase,main
+import tempfile
+import shutil
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the concurrent and incremental writing of the folders of a batch submission
+"""
+
+def make_slurm(processors: int) -> FluentSlurm:
+
+    return FluentSlurm(name = 'test',
+                       WALLTIME = 6*60*60,
+                       N_PROCESSORS= processors,
+                       MEMORY= 4,
+                       version = '2021R1',
+                       specification= '2ddp',
+                       account = 'GT-my14-paid')
+
+def write_script(folder: str,
+                 submission: PaceFluentSubmission) -> None:
+    submission.fluent_pbs.write(os.path.join(folder,PaceBatchSubmission.PACE_PBS))
+
+class TestIncrementalSubmission(TestCase):
+
+    num_cases = 8
+
+    def make_batch(self) -> PaceBatchSubmission:
+
+        submissions = [PaceFluentSubmission(FluentJournal('test.cas',reader = BatchCaseReader),make_slurm(1))
+                       for i in range(self.num_cases)]
+
+        return PaceBatchSubmission(submissions,prefix = 'test')
+
+    def test_write_folders(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            batch = self.make_batch()
+            written = batch._write_folders(folder,write = write_script,workers = 4)
+            self.assertTrue(all(written.values()))
+            for key in batch.submission_object:
+                self.assertTrue(os.path.exists(os.path.join(folder,key,PaceBatchSubmission.PACE_PBS)))
+
+            #only the changed folder is rewritten
+            batch.submission_object['test-3'].fluent_pbs.script_header.name = 'changed'
+            written = batch._write_folders(folder,write = write_script,workers = 4)
+            self.assertListEqual([key for key,value in written.items() if value],['test-3'])
+            with open(os.path.join(folder,'test-3',PaceBatchSubmission.PACE_PBS),'r') as file:
+                self.assertIn('-Jchanged',file.read())
+
+            written = batch._write_folders(folder,write = write_script,workers = 4,overwrite = True)
+            self.assertTrue(all(written.values()))                              #every folder is rewritten
+
+    def test_sync_folder(self):
+
+        with tempfile.TemporaryDirectory() as src,tempfile.TemporaryDirectory() as dst:
+            with open(os.path.join(src,'fluent.input'),'w') as file:
+                file.write('test')
+
+            self.assertTrue(_sync_folder(src,dst))
+            self.assertFalse(_sync_folder(src,dst))
+            with open(os.path.join(src,'fluent.input'),'w') as file:
+                file.write('changed')
+
+            self.assertTrue(_sync_folder(src,dst))
+            self.assertTrue(_sync_folder(src,dst,force = True))                 #forced to copy unchanged files
+
+    def test_sync_folder_edited(self):
+
+        with tempfile.TemporaryDirectory() as src,tempfile.TemporaryDirectory() as dst:
+            with open(os.path.join(src,'fluent.input'),'w') as file:
+                file.write('test')
+
+            _sync_folder(src,dst)
+            with open(os.path.join(dst,'fluent.input'),'w') as file:            #copy edited after the sync
+                file.write('edited')
+            
+            self.assertTrue(_sync_folder(src,dst))
+            with open(os.path.join(dst,'fluent.input'),'r') as file:
+                self.assertEqual(file.read(),'test')
+
+            os.remove(os.path.join(dst,'fluent.input'))                         #copy deleted after the sync
+            self.assertTrue(_sync_folder(src,dst))
+            self.assertTrue(os.path.exists(os.path.join(dst,'fluent.input')))
+            self.assertFalse(_sync_folder(src,dst))
+
+    def test_sync_folder_stale(self):
+
+        with tempfile.TemporaryDirectory() as src,tempfile.TemporaryDirectory() as dst:
+            os.mkdir(os.path.join(src,'lib'))
+            for fname in ['fluent.input','fluent.pbs',os.path.join('lib','pace.py')]:
+                with open(os.path.join(src,fname),'w') as file:
+                    file.write('test')
+
+            _sync_folder(src,dst)
+            with open(os.path.join(dst,'solution.trn'),'w') as file:              #output of the run
+                file.write('output')
+            
+            os.rename(os.path.join(src,'fluent.pbs'),os.path.join(src,'fluent.slurm'))
+            shutil.rmtree(os.path.join(src,'lib'))
+            self.assertTrue(_sync_folder(src,dst))
+            self.assertListEqual(sorted(os.listdir(dst)),['.folderhash','fluent.input','fluent.slurm','solution.trn'])
+            self.assertFalse(_sync_folder(src,dst))
+
+    def test_link_file(self):
+
+        with tempfile.TemporaryDirectory() as src,tempfile.TemporaryDirectory() as dst:
+            case_file = os.path.join(src,'test.cas')
+            with open(case_file,'w') as file:
+                file.write('case')
+
+            _link_file(case_file,dst)
+            _link_file(case_file,dst)                                   #linking again is a no-op
+            self.assertTrue(os.path.samefile(case_file,os.path.join(dst,'test.cas')))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+from fluentpy.batch.fluent import FluentSlurm,FluentPBS,FluentPackedScript
+from fluentpy.batch.batch_util import pack_processors
+from fluentpy.pace import BatchMonitor
+
+from unittest import TestCase,main
+import subprocess
+import tempfile
+import json
+import sys
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the packing of several small cases into a single allocation
+"""
+
+#stand-in for fluent, writing the cores it was pinned to as the solution file
+FAKE_FLUENT = """#!/bin/sh
+grep Cpus_allowed_list /proc/self/status | cut -f2 > solution.trn
+"""
+
+def make_slurm(processors: int,
+               walltime = 6*60*60) -> FluentSlurm:
+
+    return FluentSlurm(name = 'test',
+                       WALLTIME = walltime,
+                       N_PROCESSORS= processors,
+                       MEMORY= 4,
+                       version = '2021R1',
+                       specification= '2ddp',
+                       account = 'GT-my14-paid')
+
+class TestPackProcessors(TestCase):
+
+    def test_first_fit_decreasing(self):
+
+        self.assertListEqual(pack_processors([4,2,1,3,2],4),[[0],[2,3],[1,4]])
+        self.assertListEqual(pack_processors([1,1,1],24),[[0,1,2]])
+
+    def test_capacity(self):
+
+        with self.assertRaises(ValueError):
+            pack_processors([2,8],4)
+
+class TestFluentPackedScript(TestCase):
+
+    def test_header(self):
+
+        packed = FluentPackedScript([make_slurm(2),make_slurm(1)],['case-0','case-1'],name = 'pack')
+        text = packed()
+        self.assertIn('#SBATCH  -Jpack\n',text)
+        self.assertIn('#SBATCH  -N1 --ntasks-per-node=3\n',text)
+        self.assertEqual(text.count('module load ansys/2021R1'),1)
+        self.assertEqual(text.count(' &\n'),2)
+        self.assertEqual(text.count('export I_MPI_HYDRA_BOOTSTRAP="slurm"'),1)                #environment of the scheduler set once
+        self.assertLess(text.index('FLUENTNODES='),text.index('fluent 2ddp'))
+        self.assertEqual(text.count('-cnf=$FLUENTNODES'),2)
+
+    def test_header_resources(self):
+
+        packed = FluentPackedScript([make_slurm(1,walltime = 60*60),make_slurm(1,walltime = 10*60*60)],
+                                    ['case-0','case-1'])
+        self.assertIn('#SBATCH  -t10:00:00\n',packed())
+        self.assertIn('#SBATCH  --mem-per-cpu=4G\n',packed())
+
+        scripts = [FluentPBS(name = 'test',WALLTIME = 60*60*(i + 1),N_PROCESSORS = 1,MEMORY = 2 + i,
+                             version = '2021R1',memory_request = 't') for i in range(3)]
+        text = FluentPackedScript(scripts,['case-0','case-1','case-2'])()
+        self.assertIn('#PBS  -l walltime=03:00:00\n',text)
+        self.assertIn('#PBS  -l mem=9gb\n',text)
+        self.assertEqual(scripts[0].script_header.memory_amount,2)                       #cases are unchanged
+
+    def test_run(self):
+
+        if sys.platform == 'win32':
+            self.skipTest('packed scripts are run with bash')
+
+        available = sorted(os.sched_getaffinity(0))
+        if len(available) < 2:
+            self.skipTest('at least two cores are required to pin two cases')
+
+        with tempfile.TemporaryDirectory() as folder:
+            os.mkdir(os.path.join(folder,'bin'))
+            with open(os.path.join(folder,'bin','fluent'),'w') as file:
+                file.write(FAKE_FLUENT)
+
+            os.chmod(os.path.join(folder,'bin','fluent'),0o755)
+            for f in ['case-0','case-1']:
+                os.mkdir(os.path.join(folder,f))
+                with open(os.path.join(folder,f,'fluent.input'),'w') as file:
+                    file.write('')
+
+            packed = FluentPackedScript([make_slurm(1),make_slurm(1)],['case-0','case-1'])
+            packed.write(os.path.join(folder,'pack.sh'))
+            env = dict(os.environ,SLURM_SUBMIT_DIR = folder,
+                       PATH = os.path.join(folder,'bin') + os.pathsep + os.environ['PATH'])
+            subprocess.run(['bash',os.path.join(folder,'pack.sh')],env = env,
+                            capture_output = True,text = True)
+
+            for i,f in enumerate(['case-0','case-1']):                      #each case pinned to its own core
+                with open(os.path.join(folder,f,'solution.trn'),'r') as file:
+                    self.assertEqual(file.read().strip(),str(available[i]))
+
+            with open(os.path.join(folder,packed.status_file),'r') as file:
+                self.assertListEqual(sorted(file.read().split()),['case-0,0','case-1,0'])
+
+class TestSharedJobMonitor(TestCase):
+
+    fake_scheduler = 'fake_scheduler.py'
+
+    def test_shared_resubmission(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            state_file = os.path.join(folder,'scheduler.json')
+            scheduler = '"{}" "{}" "{}"'.format(sys.executable,os.path.abspath(self.fake_scheduler),state_file)
+            monitor = BatchMonitor('solution.trn','run.sh',
+                                   backend = scheduler + ' submit',
+                                   cancel_command = scheduler + ' cancel',
+                                   scheduler = 'squeue',
+                                   query = {'command': scheduler + ' status {jobids}'},
+                                   check_time = 0.0,
+                                   root = folder,
+                                   sleep = lambda t: None,
+                                   verbose = False)
+
+            #the packed job only solves the first case
+            for f in ['case-0','case-1']:
+                os.mkdir(os.path.join(folder,f))
+                with open(os.path.join(folder,f,'run.sh'),'w') as file:
+                    file.write('touch solution.trn\n')
+
+            with open(os.path.join(folder,'pack.sh'),'w') as file:
+                file.write('touch case-0/solution.trn\n')
+
+            output = subprocess.run(scheduler + ' submit pack.sh',shell = True,cwd = folder,
+                                    capture_output = True,text = True)
+            jobid = output.stdout.split()[-1]
+            with open(os.path.join(folder,BatchMonitor.JOB_FILE),'w') as jobfile:
+                jobfile.write('case-0,{}\ncase-1,{}\n'.format(jobid,jobid))
+
+            monitor.run(max_polls = 10)
+            self.assertTrue(monitor.done)
+            self.assertDictEqual(monitor.resubmissions,{'case-1': 1})
+            self.assertTrue(os.path.exists(os.path.join(folder,'case-1','solution.trn')))
+
+            with open(state_file,'r') as file:
+                state = json.load(file)
+
+            self.assertNotIn('CANCELLED',[job['state'] for job in state['jobs'].values()])
+
+if __name__ == '__main__':
+    main()
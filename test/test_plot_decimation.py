@@ -0,0 +1,77 @@
+import matplotlib
+matplotlib.use('Agg')
+from fluentpy.batch.plot import decimate_series,batch_envelope,reduce_envelope,_summary_plot
+
+from unittest import TestCase,main
+from matplotlib import pyplot as plt
+import numpy as np
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking the decimation of the series and envelopes plotted for a batch
+"""
+
+class TestDecimation(TestCase):
+
+    x = np.arange(1,50001)
+    y = np.exp(-x/5000.0)*(1.0 + 0.1*np.sin(x/3.0))
+
+    def test_minmax(self):
+
+        x,y = decimate_series(self.x,self.y,500)
+        self.assertLessEqual(y.shape[0],2*500 + 2)
+        self.assertTrue(np.all(np.diff(x) > 0))                                     #order is kept
+        self.assertEqual(y.max(),self.y.max())
+        self.assertEqual(y.min(),self.y.min())
+        self.assertListEqual([x[0],x[-1]],[1,50000])
+
+    def test_lttb(self):
+
+        x,y = decimate_series(self.x,self.y,500,method = 'lttb')
+        self.assertEqual(y.shape[0],500)
+        self.assertListEqual([x[0],x[-1]],[1,50000])
+        self.assertTrue(np.all(np.isin(y,self.y)))
+
+    def test_short_series(self):
+
+        x,y = decimate_series(self.x[0:100],np.where(self.x[0:100] > 90,np.nan,self.y[0:100]),500)
+        self.assertEqual(y.shape[0],90)                                             #missing values are dropped
+
+        with self.assertRaises(ValueError):
+            decimate_series(self.x,self.y,500,method = 'other')
+
+class TestEnvelope(TestCase):
+
+    def test_ragged_envelope(self):
+
+        Y = np.array([[1.0,2.0],[3.0,np.nan],[5.0,np.nan]])
+        b1,b2,cen = batch_envelope(Y)
+        self.assertListEqual(b1.tolist(),[1.0,3.0,5.0])
+        self.assertListEqual(b2.tolist(),[2.0,3.0,5.0])
+        self.assertListEqual(cen.tolist(),[1.5,3.0,5.0])
+
+    def test_reduce_envelope(self):
+
+        x = np.arange(10000)
+        Y = np.random.default_rng(0).random((10000,4))
+        b1,b2,cen = batch_envelope(Y)
+        xr,b1r,b2r,cenr = reduce_envelope(x,b1,b2,cen,100)
+        self.assertEqual(xr.shape[0],100)
+        self.assertEqual(b1r.min(),b1.min())
+        self.assertEqual(b2r.max(),b2.max())
+        self.assertAlmostEqual(cenr.mean(),cen.mean())
+    
+    def test_summary_plot(self):
+
+        _,ax = plt.subplots()
+        _summary_plot(ax,np.arange(50000),np.random.default_rng(0).random((50000,3)))
+        self.assertTrue(all(line.get_xdata().shape[0] <= ax.get_window_extent().width + 1 for line in ax.get_lines()))
+        plt.close('all')
+
+if __name__ == '__main__':
+    main()
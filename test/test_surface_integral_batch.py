@@ -0,0 +1,94 @@
+from fluentpy.batch.post import SurfaceIntegralBatch
+from fluentpy.tui import FluentEnginePool
+
+from unittest import TestCase,main
+import tempfile
+import sys
+import os
+
+"""
+-- Creation --
+Date: 10.18.2026
+Author: Michael Lanahan
+
+-- Further Description --
+
+Checking concurrent evaluation of surface integrals across a batch folder,
+using fake_fluent.py in place of fluent
+"""
+
+class TestSurfaceIntegralBatch(TestCase):
+
+    fake_fluent = 'fake_fluent.py'
+    num_cases = 6
+
+    def make_batch(self,folder: str) -> None:
+
+        for i in range(self.num_cases):
+            os.mkdir(os.path.join(folder,str(i)))
+            for ext in ['.cas','.dat']:
+                with open(os.path.join(folder,str(i),'result' + ext),'w') as file:
+                    file.write('')
+
+        os.mkdir(os.path.join(folder,'bin'))
+        with open(os.path.join(folder,'bin','fluent'),'w') as file:
+            file.write('#!/bin/sh\nexec "{}" "{}" "$@"\n'.format(sys.executable,os.path.abspath(self.fake_fluent)))
+
+        os.chmod(os.path.join(folder,'bin','fluent'),0o755)
+
+    def check_df(self,df) -> None:
+
+        self.assertEqual(df.shape,(self.num_cases,3))
+        self.assertListEqual(sorted(df.index),[str(i) for i in range(self.num_cases)])
+        self.assertTrue((df['area-weighted-avg-Net: 10-11-temperature (k)'] == 11.0).all())
+
+    def test_concurrent_engines(self):
+
+        if sys.platform == 'win32' or sys.platform == 'win64':
+            self.skipTest('fake fluent executable is a shell script')
+
+        with tempfile.TemporaryDirectory() as folder:
+            self.make_batch(folder)
+            sib = SurfaceIntegralBatch(folder,[[10,11]],['temperature'],['area-weighted-avg'],
+                                       workers = 3,processors_per_worker = 2,
+                                       fluent_path = os.path.join(folder,'bin'))
+
+            self.check_df(sib.readdf(run_fluent = True))
+            self.assertDictEqual(sib.failures,{})
+            for i in range(self.num_cases):                                          #engine files are not written to case folders
+                self.assertListEqual(sorted(os.listdir(os.path.join(folder,str(i)))),
+                                     ['result-area-weighted-avg-10-11-temperature','result.cas','result.dat'])
+
+    def test_relative_folder(self):
+
+        if sys.platform == 'win32' or sys.platform == 'win64':
+            self.skipTest('fake fluent executable is a shell script')
+
+        cwd = os.getcwd()
+        fake_fluent = os.path.abspath(self.fake_fluent)
+        with tempfile.TemporaryDirectory() as folder:
+            os.chdir(folder)
+            try:
+                os.mkdir('batch')
+                self.fake_fluent = fake_fluent
+                self.make_batch('batch')
+                sib = SurfaceIntegralBatch('batch',[[10,11]],['temperature'],['area-weighted-avg'],
+                                           workers = 2,fluent_path = os.path.abspath(os.path.join('batch','bin')))
+
+                self.check_df(sib.readdf(run_fluent = True))
+                self.assertDictEqual(sib.failures,{})
+            finally:
+                del self.fake_fluent
+                os.chdir(cwd)
+
+    def test_pooled_engines(self):
+
+        with tempfile.TemporaryDirectory() as folder:
+            self.make_batch(folder)
+            with FluentEnginePool(2,command = [sys.executable,os.path.abspath(self.fake_fluent)],timeout = 30) as pool:
+                sib = SurfaceIntegralBatch(folder,[[10,11]],['temperature'],['area-weighted-avg'],
+                                           engine = pool)
+                self.check_df(sib.readdf(run_fluent = True))
+
+if __name__ == '__main__':
+    main()
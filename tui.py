@@ -12,6 +12,11 @@ import re
 import string
 import random 
 import warnings
+import threading
+import queue
+import itertools
+import copy
+from concurrent.futures import ThreadPoolExecutor
 
 #package imports
 from .disk import SerializableClass
@@ -28,6 +33,8 @@ __all__ = [
            'CaseMeshReplaceReader',
            'CaseDataReader',
            'FluentEngine',
+           'FluentSession',
+           'FluentEnginePool',
            'BatchCaseReader',
            'DataWriter',
            'CaseWriter',
@@ -45,7 +52,8 @@ __all__ = [
            'PressureOutlet',
            'VelocityInlet',
            'SurfaceIntegrals',
-           'FluentJournal'
+           'FluentJournal',
+           'JournalTemplate'
            ]
 
 """
@@ -1061,6 +1069,11 @@ class FluentEngine(TUIBase):
             keyword argument specifying the path to the fluent executable
     version : str
             the version of fluent being used. may be used to switch between paths
+    work_dir : str
+            keyword argument - folder to write the input/output files to and run
+            fluent from. default None uses the folder of the case file. If provided,
+            files are referenced with absolute paths so that multiple engines 
+            can run concurrently without sharing input/output files
 
     Examples
     --------
@@ -1084,18 +1097,32 @@ class FluentEngine(TUIBase):
                       num_processors = 1,
                       reader = CaseDataReader,
                       version = '19.1',
-                      fluent_path = None):
+                      fluent_path = None,
+                      work_dir = None):
         
         self.path,file_name = os.path.split(file)
         self.spec = specification
         self.__num_processors = num_processors
-        self.__input = reader(file_name)
+        self.__relative_paths = work_dir is None
+        if self.relative_paths:
+            self.work_dir = self.path
+            self.__input = reader(file_name)
+        else:
+            self.work_dir = work_dir
+            self.__input = reader(os.path.abspath(file))
+
         self._additional_txt = ''
-        self.input_file = os.path.join(self.path,self.FLUENT_INPUT_NAME)
-        self.output_file = os.path.join(self.path,self.FLUENT_OUTPUT_NAME)
+        self.input_file = os.path.join(self.work_dir,self.FLUENT_INPUT_NAME)
+        self.output_file = os.path.join(self.work_dir,self.FLUENT_OUTPUT_NAME)
         self.__fluent_path = fluent_path
         self.version = version
     
+    @property
+    def relative_paths(self) -> bool:
+        """
+        whether files may be referenced relative to the case folder
+        """
+        return self.__relative_paths
 
     def insert_text(self,other):
         self._additional_txt += other
@@ -1191,16 +1218,345 @@ class FluentEngine(TUIBase):
         (4) cleans up the directory again
         """
 
+        if self.work_dir and not os.path.exists(self.work_dir):
+            os.makedirs(self.work_dir)
+
         self._clean()
         txt = self._format_call(save)
-        cwd = os.getcwd()
-        os.chdir(self.path)
-        process = subprocess.call(txt)
-        os.chdir(cwd)
+        #run from the working directory rather than changing the directory of the 
+        #interpreter so that engines may be called from multiple threads
+        process = subprocess.call(txt,
+                                  cwd = self.work_dir if self.work_dir else None,
+                                  shell = not (sys.platform == 'win32' or sys.platform == 'win64'))
         self._clean()
         return process
 
 
+class FluentSession(TUIBase):
+
+    """
+    a single long-lived fluent process. Journal text is streamed to the process
+    over stdin and completion of each block of commands is detected by having fluent 
+    display a marker once the block is finished, so the same process (and license) 
+    can be used for many cases without paying the start up cost each time.
+
+    The marker is assembled by fluent using string-append so that the echo of the command
+    itself is never mistaken for the completion of the command.
+
+    Parameters
+    ----------
+    specification : str
+            keyword argument for the specification of fluent - default "3ddp"
+    num_processors : int
+            keyword argument specifying the number of processors to use\
+            when invoking fluent - default 1
+    version : str
+            the version of fluent being used. may be used to switch between paths
+    fluent_path : str
+            keyword argument specifying the path to the fluent executable
+    command : list
+            keyword argument - if provided, the command used to start the process
+            in place of fluent, i.e. a stand-in script for testing
+    timeout : float
+            keyword argument - the number of seconds to wait for a block of commands
+            to complete before raising a TimeoutError. default None waits indefinitely
+    cwd : str
+            keyword argument - the working directory to start the process in
+
+    Examples
+    --------
+    
+    .. code-block:: python
+        
+        with FluentSession(num_processors = 4) as session:
+            output = session.send('file/read-case-data /path/to/sample.cas')
+    """
+
+    MARKER_PREFIX = 'fluentpy-'
+    MARKER_SUFFIX = 'done-{}'
+    MARKER_STATEMENT = '(begin (display (string-append "{}" "{}")) (newline))'
+    POSIX_FLUENT_COMMAND = ['{}/fluent','{}','-t{}','-g']
+    WINDOWS_FLUENT_COMMAND = ['{}/fluent','{}','-t{}','-g','-hidden','-wait']
+
+    def __init__(self,specification = '3ddp',
+                      num_processors = 1,
+                      version = '19.1',
+                      fluent_path = None,
+                      command = None,
+                      timeout = None,
+                      cwd = None):
+        
+        self.spec = specification
+        self.__num_processors = num_processors
+        self.version = version
+        self.__fluent_path = fluent_path
+        self.__command = command
+        self.timeout = timeout
+        self.cwd = cwd
+        self.__process = None
+        self.__lines = None
+        self.__counter = itertools.count()
+        self.__lock = threading.Lock()
+
+    @property
+    def num_processors(self):
+        return str(self.__num_processors)
+
+    @property
+    def fluent_path(self):
+
+        if self.__fluent_path is None:
+            return get_fluent_path(self.version)
+        else:
+            return self.__fluent_path
+    
+    @property
+    def command(self) -> list:
+        """
+        the command used to start the process, platform dependent for fluent
+        """
+        if self.__command is not None:
+            return list(self.__command)
+        
+        if sys.platform == 'win32' or sys.platform == 'win64':
+            command = self.WINDOWS_FLUENT_COMMAND
+        else:
+            command = self.POSIX_FLUENT_COMMAND
+        
+        return [command[0].format(self.fluent_path),command[1].format(self.spec),
+                command[2].format(self.num_processors)] + command[3:]
+
+    @property
+    def alive(self) -> bool:
+        return self.__process is not None and self.__process.poll() is None
+
+    def start(self) -> None:
+        """
+        start the process if it is not already running, with a thread
+        forwarding the process output line by line so that reads can time out
+        """
+        if self.alive:
+            return
+        
+        self.__process = subprocess.Popen(self.command,
+                                          stdin = subprocess.PIPE,
+                                          stdout = subprocess.PIPE,
+                                          stderr = subprocess.STDOUT,
+                                          cwd = self.cwd,
+                                          universal_newlines = True,
+                                          bufsize = 1)
+        
+        self.__lines = queue.Queue()
+        reader = threading.Thread(target = self._forward_output,
+                                  args = (self.__process.stdout,self.__lines),
+                                  daemon = True)
+        reader.start()
+    
+    @staticmethod
+    def _forward_output(stream,lines: queue.Queue) -> None:
+        for line in iter(stream.readline,''):
+            lines.put(line)
+        
+        lines.put(None)
+
+    def _format_marker(self,count: int) -> tuple:
+        """
+        returns the statement sent to fluent and the text it displays 
+        """
+        suffix = self.MARKER_SUFFIX.format(count)
+        return self.MARKER_STATEMENT.format(self.MARKER_PREFIX,suffix),self.MARKER_PREFIX + suffix
+
+    def send(self,txt: str,
+                  timeout = None) -> str:
+        """
+        send a block of commands to the process and wait for them to complete,
+        returning the output generated by fluent while processing the commands
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self.__lock:
+            self.start()
+            statement,marker = self._format_marker(next(self.__counter))
+            try:
+                self.__process.stdin.write(txt.rstrip(self.LINE_BREAK) + self.LINE_BREAK + statement + self.LINE_BREAK)
+                self.__process.stdin.flush()
+            except (BrokenPipeError,OSError) as oe:
+                raise RuntimeError('fluent session exited before commands could be sent: {}'.format(str(oe)))
+
+            return self._read_until(marker,timeout)
+    
+    def _read_until(self,marker: str,
+                         timeout: float) -> str:
+        
+        output = []
+        while True:
+            try:
+                line = self.__lines.get(timeout = timeout)
+            except queue.Empty:
+                self.close(force = True)
+                raise TimeoutError('fluent session did not complete commands within {} seconds'.format(timeout))
+            
+            if line is None:
+                raise RuntimeError('fluent session exited while processing commands:\n{}'.format(''.join(output)))
+            elif line.strip() == marker:
+                return ''.join(output)
+            
+            output.append(line)
+    
+    def close(self,force = False) -> int:
+        """
+        exit fluent (or kill it if forced) and return the exit code of the process
+        """
+        if self.__process is None:
+            return None
+        
+        process,self.__process = self.__process,None
+        if not force and process.poll() is None:
+            try:
+                process.stdin.write(self.EXIT_STATEMENT + self.LINE_BREAK + 'ok' + self.LINE_BREAK)
+                process.stdin.close()
+                return process.wait(timeout = self.timeout)
+            except (BrokenPipeError,OSError,subprocess.TimeoutExpired):
+                pass
+        
+        process.kill()
+        return process.wait()
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self,*args):
+        self.close()
+
+class PooledFluentEngine(TUIBase):
+
+    """
+    drop in replacement for the FluentEngine, created by the FluentEnginePool, that 
+    sends the commands to one of the running sessions of the pool instead of starting
+    fluent. Because the session is not started in the folder of the case, all files 
+    are referenced using absolute paths
+    """
+
+    relative_paths = False
+
+    def __init__(self,file: str,
+                      pool,
+                      reader = CaseDataReader):
+
+        self.file = os.path.abspath(file)
+        self.path,_ = os.path.split(self.file)
+        self.pool = pool
+        self.__input = reader(self.file)
+        self._additional_txt = ''
+    
+    def insert_text(self,other):
+        self._additional_txt += other
+    
+    @property
+    def input(self):
+        return str(self.__input)
+    
+    def _format_input(self,save) -> str:
+
+        if save:
+            raise NotImplementedError('not formatted for saving')
+        
+        return self.input + self.LINE_BREAK + self._additional_txt
+    
+    def __call__(self,save = None) -> str:
+        """
+        acquire a session from the pool, run the commands and return
+        the output of the session
+        """
+
+        txt = self._format_input(save)
+        with self.pool.session() as session:
+            return session.send(txt)
+
+class FluentEnginePool:
+
+    """
+    a pool of persistent fluent sessions. calling the pool with a case file 
+    returns an engine that runs on one of the sessions, so that the pool may be
+    passed anywhere a FluentEngine is expected, and the map function schedules 
+    work across the sessions concurrently. Sessions are started lazily and kept 
+    alive until the pool is closed.
+
+    Parameters
+    ----------
+    num_sessions : int
+            the number of fluent processes to keep alive - default 2
+    session_kwargs : dict
+            keyword arguments passed to each FluentSession, i.e. num_processors,
+            version, fluent_path, command or timeout
+
+    Examples
+    --------
+    
+    .. code-block:: python
+
+        with FluentEnginePool(4,num_processors = 1) as pool:
+            si = SurfaceIntegrals('sample.cas',11,'temperature','area-weighted-avg',engine = pool)
+            sif = si()
+    """
+
+    def __init__(self,num_sessions = 2,
+                      **session_kwargs):
+
+        if num_sessions < 1:
+            raise ValueError('pool must have at least one session, not: {}'.format(num_sessions))
+
+        self.num_sessions = num_sessions
+        self.sessions = [FluentSession(**session_kwargs) for _ in range(num_sessions)]
+        self.__available = queue.Queue()
+        for session in self.sessions:
+            self.__available.put(session)
+    
+    def __call__(self,file: str,
+                      reader = CaseDataReader,
+                      **kwargs) -> PooledFluentEngine:
+
+        return PooledFluentEngine(file,self,reader = reader)
+    
+    def session(self):
+        """
+        context manager that checks out an idle session, restarting it if required
+        """
+        return _CheckedOutSession(self.__available)
+
+    def map(self,func: callable,
+                 iterable) -> list:
+        """
+        apply func to each item of the iterable with at most num_sessions 
+        calls in flight at once, returning the results in order
+        """
+        with ThreadPoolExecutor(max_workers = self.num_sessions) as executor:
+            return list(executor.map(func,iterable))
+
+    def close(self) -> None:
+        for session in self.sessions:
+            session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self,*args):
+        self.close()
+
+class _CheckedOutSession:
+
+    def __init__(self,available: queue.Queue):
+        self.available = available
+        self.session = None
+    
+    def __enter__(self) -> FluentSession:
+        self.session = self.available.get()
+        return self.session
+    
+    def __exit__(self,*args):
+        self.available.put(self.session)
+
+
 class ProfileReader(FileIO):
 
     """
@@ -4217,7 +4573,8 @@ class SurfaceIntegrals(TUIBase):
         except TypeError:
             self.engine = None
         
-        self.file = file
+        #engines running fluent outside of the case folder write the files with absolute paths
+        self.file = file if getattr(self.engine,'relative_paths',True) else os.path.abspath(file)
         self.id,self.variable,self.surface_type  = \
              self._validate_constructor_args(id,variable,surface_type)
         
@@ -4278,7 +4635,10 @@ class SurfaceIntegrals(TUIBase):
             
             txt += variable + self.LINE_BREAK
             txt += 'yes' + self.LINE_BREAK
-            _,_file = os.path.split(self.file_name(ids,surface_type,variable))
+            _file = self.file_name(ids,surface_type,variable)
+            if getattr(self.engine,'relative_paths',True):
+                _,_file = os.path.split(_file)
+            
             txt += _file + self.LINE_BREAK
         
         return txt
@@ -4407,6 +4767,7 @@ class FluentJournal(SerializableClass,TUIBase):
         self.pre_solution = pre_solution
         self.attached_files = attached_files
         self.__exit = exit_sim
+        self.journal_template = None
 
     @property
     def case(self):
@@ -4488,14 +4849,15 @@ class FluentJournal(SerializableClass,TUIBase):
         
         return text
     
-    def _boundary_conditions_spec(self):
+    def _boundary_conditions_spec(self,format_bc = None):
         """
-        boundary conditions must be callable 
+        boundary conditions must be callable, or are formatted by format_bc
         """
-        txt = self.LINE_BREAK + ';Boundary Conditions' + self.LINE_BREAK + self.LINE_BREAK
-        for bc in self.boundary_conditions:
-            txt += bc()
+        if format_bc is None:
+            format_bc = lambda bc: bc()
         
+        txt = self.LINE_BREAK + ';Boundary Conditions' + self.LINE_BREAK + self.LINE_BREAK
+        txt += ''.join([format_bc(bc) for bc in self.boundary_conditions])
         return txt
 
     def _format_convergence_condition(self):
@@ -4525,11 +4887,10 @@ class FluentJournal(SerializableClass,TUIBase):
         
         return txt
 
-    def _format_fluent_file(self) -> str:
+    def _format_header(self) -> str:
         """
-        format the fluent input file
+        the transcript and reading of the case
         """
-        
         if self.transcript_file is not None:
             try:
                 txt = 'file/start-transcript ' + self.transcript_file + self.LINE_BREAK     
@@ -4544,10 +4905,19 @@ class FluentJournal(SerializableClass,TUIBase):
         except TypeError as te:
             warnings.warn(str(te))
         
-        txt += self._format_convergence_condition()
-        txt += self._model_modification_spec()
-        txt += self._boundary_conditions_spec()
-        txt += self._pre_solution_spec()
+        return txt
+    
+    def _format_prefix(self) -> str:
+        """
+        everything between reading the case and the boundary conditions
+        """
+        return self._format_convergence_condition() + self._model_modification_spec()
+
+    def _format_suffix(self) -> str:
+        """
+        everything following the boundary conditions
+        """
+        txt = self._pre_solution_spec()
         if self.solver is not None:
             txt += str(self.solver)
         txt += self._post_spec()
@@ -4562,6 +4932,46 @@ class FluentJournal(SerializableClass,TUIBase):
 
         return txt
 
+    def _format_fluent_file(self) -> str:
+        """
+        format the fluent input file
+        """
+        
+        txt = self._format_header()
+        journal_template = getattr(self,'journal_template',None)
+        if journal_template is None:
+            txt += self._format_prefix()
+            txt += self._boundary_conditions_spec()
+            txt += self._format_suffix()
+        else:
+            txt += journal_template.prefix
+            txt += self._boundary_conditions_spec(journal_template.format_boundary_condition)
+            txt += journal_template.suffix
+
+        return txt
+    
+    def _from_template(self,journal_template,
+                            boundary_conditions: list,
+                            pwd = None):
+        """
+        a shallow copy of the journal (sharing everything but the reader) with the 
+        boundary conditions, rendered using the journal template
+        """
+        journal = copy.copy(self)
+        journal.__reader = copy.copy(self.__reader)
+        if pwd is not None:
+            journal.__reader.pwd = pwd
+        
+        journal.__boundary_conditions = boundary_conditions
+        journal.journal_template = journal_template
+        return journal
+    
+    def _dict_representation(self):
+        
+        d = super()._dict_representation()
+        d.pop('journal_template',None)
+        return d
+
     def __call__(self):
         return self._format_fluent_file()
 
@@ -4598,4 +5008,77 @@ class FluentJournal(SerializableClass,TUIBase):
         dmdict['data_writer'] = dmdict.pop('data_writer').__class__
 
         return [case_file],dmdict
+
+class JournalTemplate:
+
+    """
+    Compiles the journals of a batch which differ only in the folder of the (batch) reader 
+    and the boundary conditions, i.e. the rows of a table of boundary conditions. The text 
+    before and after the boundary conditions is rendered once for the whole batch from the 
+    template journal, and the text of each boundary condition object is rendered once, no 
+    matter how many of the journals share the object.
+
+    The journals share everything but the reader and boundary conditions with the template, 
+    so the template should not be modified after the journals are rendered.
+
+    Parameters
+    ----------
+    fluent_journal : FluentJournal
+            the template journal
+    
+    Examples
+    --------
+    .. code-block:: python
+
+        template = JournalTemplate(FluentJournal('sample.cas',reader = BatchCaseReader))
+        journals = [template.journal(bcs,pwd = 'sample-' + str(i)) for i,bcs in enumerate(rows)]
+        print(journals[0]())
+    """
+
+    def __init__(self,fluent_journal: FluentJournal):
+
+        self.fluent_journal = fluent_journal
+        self.__prefix = None
+        self.__suffix = None
+        self.__fragments = {}
+    
+    @property
+    def prefix(self) -> str:
+        if self.__prefix is None:
+            self.__prefix = self.fluent_journal._format_prefix()
+        
+        return self.__prefix
+    
+    @property
+    def suffix(self) -> str:
+        if self.__suffix is None:
+            self.__suffix = self.fluent_journal._format_suffix()
+        
+        return self.__suffix
+    
+    def format_boundary_condition(self,bc) -> str:
+        """
+        the text of the boundary condition, rendered the first time the object is seen
+        """
+        try:
+            return self.__fragments[id(bc)][1]
+        except KeyError:
+            txt = bc()
+            #keep the object so that its id is not reused
+            self.__fragments[id(bc)] = (bc,txt)
+            return txt
+
+    def journal(self,boundary_conditions: list,
+                     pwd = None) -> FluentJournal:
+        """
+        the journal with the boundary conditions, reading the case from pwd
+        """
+        return self.fluent_journal._from_template(self,boundary_conditions,pwd = pwd)
+    
+    def __getstate__(self):
+        
+        #rendered text is not pickled
+        state = self.__dict__.copy()
+        state['_JournalTemplate__fragments'] = {}
+        return state
     
\ No newline at end of file